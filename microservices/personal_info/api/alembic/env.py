@@ -4,12 +4,11 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
-from app.core.database import Base
+from app.core.base import Base
 from app.core.config import settings
 
-from app.models import *
-
-
+# Registers every table on Base.metadata; only the models, not the app or its engines.
+import app.models  # noqa: F401
 
 
 # this is the Alembic Config object, which provides
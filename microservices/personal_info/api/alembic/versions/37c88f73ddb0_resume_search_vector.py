@@ -0,0 +1,122 @@
+"""resume search vector
+
+Revision ID: 37c88f73ddb0
+Revises: 415144ffd166
+Create Date: 2026-10-18 14:02:51.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '37c88f73ddb0'
+down_revision: Union[str, Sequence[str], None] = '415144ffd166'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A GENERATED column only sees its own row, while the vector also covers section
+# text, so it is kept up to date by triggers instead: the resume's own row
+# trigger for title/summary edits, statement-level triggers on the sections.
+SEARCH_SECTION_TABLES = ('experiences', 'projects', 'education')
+
+RESUME_SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION resume_search_vector(rid integer, title text, summary text) RETURNS tsvector
+LANGUAGE sql STABLE AS $$
+    SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(summary, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(
+            (SELECT string_agg(concat_ws(' ', job_title, description, challenge), ' ')
+             FROM experiences WHERE resume_id = rid), '')), 'C')
+        || setweight(to_tsvector('english', concat_ws(' ',
+            (SELECT string_agg(concat_ws(' ', title, description), ' ') FROM projects WHERE resume_id = rid),
+            (SELECT string_agg(concat_ws(' ', degree, field_of_study), ' ') FROM education WHERE resume_id = rid)
+        )), 'D')
+$$
+"""
+
+RESUME_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION resumes_search_vector_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := resume_search_vector(NEW.id, NEW.professional_title, NEW.summary);
+    RETURN NEW;
+END
+$$
+"""
+
+SECTION_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION resume_sections_search_vector_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE resumes SET search_vector = resume_search_vector(id, professional_title, summary)
+        WHERE id IN (SELECT resume_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE resumes SET search_vector = resume_search_vector(id, professional_title, summary)
+        WHERE id IN (SELECT resume_id FROM old_rows);
+    ELSE
+        UPDATE resumes SET search_vector = resume_search_vector(id, professional_title, summary)
+        WHERE id IN (SELECT resume_id FROM new_rows UNION SELECT resume_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+SECTION_TRIGGER_EVENTS = {
+    'insert': 'AFTER INSERT ON {table} REFERENCING NEW TABLE AS new_rows',
+    'update': 'AFTER UPDATE ON {table} REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'delete': 'AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resumes', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute(RESUME_SEARCH_VECTOR_FUNCTION)
+    op.execute(RESUME_TRIGGER_FUNCTION)
+    op.execute(SECTION_TRIGGER_FUNCTION)
+
+    op.execute(
+        'CREATE TRIGGER resumes_search_vector BEFORE INSERT OR UPDATE OF professional_title, summary ON resumes '
+        'FOR EACH ROW EXECUTE FUNCTION resumes_search_vector_trigger()'
+    )
+    for table in SEARCH_SECTION_TABLES:
+        for event, clause in SECTION_TRIGGER_EVENTS.items():
+            op.execute(
+                f'CREATE TRIGGER {table}_search_vector_{event} {clause.format(table=table)} '
+                f'FOR EACH STATEMENT EXECUTE FUNCTION resume_sections_search_vector_trigger()'
+            )
+
+    op.execute('UPDATE resumes SET search_vector = resume_search_vector(id, professional_title, summary)')
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_resumes_search_vector', 'resumes', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_resumes_search_vector', table_name='resumes', postgresql_concurrently=True, if_exists=True
+        )
+
+    for table in SEARCH_SECTION_TABLES:
+        for event in SECTION_TRIGGER_EVENTS:
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_search_vector_{event} ON {table}')
+    op.execute('DROP TRIGGER IF EXISTS resumes_search_vector ON resumes')
+
+    op.execute('DROP FUNCTION IF EXISTS resume_sections_search_vector_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS resumes_search_vector_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS resume_search_vector(integer, text, text)')
+
+    op.drop_column('resumes', 'search_vector')
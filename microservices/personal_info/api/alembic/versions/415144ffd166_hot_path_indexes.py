@@ -0,0 +1,52 @@
+"""hot path indexes
+
+Revision ID: 415144ffd166
+Revises: f5ad1cf5cfb8
+Create Date: 2026-10-18 11:40:12.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '415144ffd166'
+down_revision: Union[str, Sequence[str], None] = 'f5ad1cf5cfb8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SECTION_TABLES = ('certificates', 'education', 'experiences', 'languages', 'projects', 'skills', 'social_link')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table in SECTION_TABLES:
+            op.create_index(
+                op.f(f'ix_{table}_resume_id'), table, ['resume_id'],
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+        op.create_index(
+            'ix_social_link_user_id_id', 'social_link', ['user_id', 'id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Fails if a user already owns more than one resume; deduplicate first.
+        op.create_index(
+            op.f('ix_resumes_user_id'), 'resumes', ['user_id'],
+            unique=True, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_resumes_user_id'), table_name='resumes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            'ix_social_link_user_id_id', table_name='social_link', postgresql_concurrently=True, if_exists=True
+        )
+        for table in SECTION_TABLES:
+            op.drop_index(
+                op.f(f'ix_{table}_resume_id'), table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,110 @@
+"""resume change notifications
+
+Revision ID: 4ec849e5cb0b
+Revises: dc279073e70a
+Create Date: 2026-10-18 21:12:40.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4ec849e5cb0b'
+down_revision: Union[str, Sequence[str], None] = 'dc279073e70a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Payloads are "resume_id:user_id:table:op:version" on the resume_changes channel,
+# see app.core.change_feed. Only the resumes trigger sends the version (updated_at
+# in ETag format); section writes bump it through touch_resume in the same
+# transaction. pg_notify drops identical payloads within a transaction, so a
+# statement touching many rows of one resume notifies once.
+CHANNEL = 'resume_changes'
+
+SECTION_TABLES = (
+    'experiences', 'education', 'skills', 'projects', 'certificates', 'languages', 'social_link',
+)
+
+RESUME_NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION resumes_notify_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    r resumes;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        r := OLD;
+    ELSE
+        r := NEW;
+    END IF;
+    PERFORM pg_notify('{CHANNEL}', format('%s:%s:%s:%s:%s',
+        r.id, r.user_id, TG_TABLE_NAME, TG_OP, to_char(r.updated_at, 'YYYYMMDDHH24MISSUS')));
+    RETURN NULL;
+END
+$$
+"""
+
+# Statement level with transition tables, like the search vector triggers. Rows of
+# a resume deleted in the same statement no longer join, the resume's own DELETE
+# notification covers them.
+SECTION_NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION resume_sections_notify_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM pg_notify('{CHANNEL}', format('%s:%s:%s:%s:', r.id, r.user_id, TG_TABLE_NAME, TG_OP))
+        FROM resumes AS r WHERE r.id IN (SELECT resume_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('{CHANNEL}', format('%s:%s:%s:%s:', r.id, r.user_id, TG_TABLE_NAME, TG_OP))
+        FROM resumes AS r WHERE r.id IN (SELECT resume_id FROM old_rows);
+    ELSE
+        PERFORM pg_notify('{CHANNEL}', format('%s:%s:%s:%s:', r.id, r.user_id, TG_TABLE_NAME, TG_OP))
+        FROM resumes AS r WHERE r.id IN (SELECT resume_id FROM new_rows UNION SELECT resume_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+SECTION_TRIGGER_EVENTS = {
+    'insert': 'AFTER INSERT ON {table} REFERENCING NEW TABLE AS new_rows',
+    'update': 'AFTER UPDATE ON {table} REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'delete': 'AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(RESUME_NOTIFY_FUNCTION)
+    op.execute(SECTION_NOTIFY_FUNCTION)
+
+    op.execute(
+        'CREATE TRIGGER resumes_notify_change AFTER INSERT OR DELETE ON resumes '
+        'FOR EACH ROW EXECUTE FUNCTION resumes_notify_change()'
+    )
+    # Trigger-maintained columns (search vector, skill tokens) are rewritten without a new version;
+    # every real change bumps updated_at.
+    op.execute(
+        'CREATE TRIGGER resumes_notify_update AFTER UPDATE ON resumes '
+        'FOR EACH ROW WHEN (OLD.updated_at IS DISTINCT FROM NEW.updated_at) '
+        'EXECUTE FUNCTION resumes_notify_change()'
+    )
+    for table in SECTION_TABLES:
+        for event, clause in SECTION_TRIGGER_EVENTS.items():
+            op.execute(
+                f'CREATE TRIGGER {table}_notify_{event} {clause.format(table=table)} '
+                f'FOR EACH STATEMENT EXECUTE FUNCTION resume_sections_notify_change()'
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SECTION_TABLES:
+        for event in SECTION_TRIGGER_EVENTS:
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_notify_{event} ON {table}')
+    op.execute('DROP TRIGGER IF EXISTS resumes_notify_update ON resumes')
+    op.execute('DROP TRIGGER IF EXISTS resumes_notify_change ON resumes')
+
+    op.execute('DROP FUNCTION IF EXISTS resume_sections_notify_change()')
+    op.execute('DROP FUNCTION IF EXISTS resumes_notify_change()')
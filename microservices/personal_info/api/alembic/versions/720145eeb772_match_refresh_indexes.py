@@ -0,0 +1,43 @@
+"""match refresh indexes
+
+Revision ID: 720145eeb772
+Revises: 4ec849e5cb0b
+Create Date: 2026-10-19 10:02:51.417206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '720145eeb772'
+down_revision: Union[str, Sequence[str], None] = '4ec849e5cb0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The match refresh looks up resumes changed since the newest vector instead of anti-joining all of them.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_resumes_updated_at'), 'resumes', ['updated_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_resume_vectors_dim_resume_updated_at', 'resume_vectors', ['dim', 'resume_updated_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_resume_vectors_dim_resume_updated_at', table_name='resume_vectors',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            op.f('ix_resumes_updated_at'), table_name='resumes', postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,187 @@
+"""skill tokens and facets
+
+Revision ID: aa65a181288c
+Revises: 37c88f73ddb0
+Create Date: 2026-10-18 15:21:07.118830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aa65a181288c'
+down_revision: Union[str, Sequence[str], None] = '37c88f73ddb0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Seed for skill_aliases; later additions only apply to rows written afterwards.
+SKILL_ALIASES = {
+    'py': 'python', 'python3': 'python',
+    'js': 'javascript', 'ecmascript': 'javascript', 'ts': 'typescript',
+    'node': 'node.js', 'nodejs': 'node.js',
+    'react.js': 'react', 'reactjs': 'react', 'vue.js': 'vue', 'vuejs': 'vue',
+    'golang': 'go',
+    'postgres': 'postgresql', 'psql': 'postgresql', 'pg': 'postgresql',
+    'mongo': 'mongodb',
+    'k8s': 'kubernetes',
+    'gcp': 'google cloud', 'amazon web services': 'aws',
+    'ml': 'machine learning', 'dl': 'deep learning',
+    'c sharp': 'c#', 'csharp': 'c#', 'cpp': 'c++',
+    'sklearn': 'scikit-learn', 'tf': 'tensorflow',
+    'sqlalchemy orm': 'sqlalchemy', 'drf': 'django rest framework',
+}
+
+SKILL_TOKEN_TABLES = ('skills', 'projects')
+
+NORMALIZE_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION normalize_skill_token(raw text) RETURNS varchar
+LANGUAGE sql STABLE AS $$
+    SELECT coalesce((SELECT token FROM skill_aliases WHERE alias = folded), folded)
+    FROM (SELECT nullif(regexp_replace(lower(trim(raw)), '\s+', ' ', 'g'), '') AS folded) AS t
+$$
+"""
+
+RESUME_SKILL_TOKENS_FUNCTION = """
+CREATE OR REPLACE FUNCTION resume_skill_tokens(rid integer) RETURNS varchar[]
+LANGUAGE sql STABLE AS $$
+    SELECT coalesce(array_agg(DISTINCT token ORDER BY token) FILTER (WHERE token IS NOT NULL), '{}')
+    FROM (
+        SELECT normalize_skill_token(name) AS token FROM skills WHERE resume_id = rid
+        UNION ALL
+        SELECT normalize_skill_token(unnest(tech_stack)) FROM projects WHERE resume_id = rid
+    ) AS tokens
+$$
+"""
+
+SECTION_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION resume_sections_skill_tokens_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    affected integer[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT resume_id) INTO affected FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT resume_id) INTO affected FROM old_rows;
+    ELSE
+        SELECT array_agg(DISTINCT resume_id) INTO affected
+        FROM (SELECT resume_id FROM new_rows UNION SELECT resume_id FROM old_rows) AS changed;
+    END IF;
+
+    UPDATE resumes SET skill_tokens = resume_skill_tokens(id)
+    WHERE id = ANY(affected) AND skill_tokens IS DISTINCT FROM resume_skill_tokens(id);
+    RETURN NULL;
+END
+$$
+"""
+
+# Row-level on resumes: fires once per resume whose token set actually changed.
+FACETS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION resumes_skill_facets_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    old_tokens varchar[] := CASE WHEN TG_OP = 'INSERT' THEN '{}' ELSE OLD.skill_tokens END;
+    new_tokens varchar[] := CASE WHEN TG_OP = 'DELETE' THEN '{}' ELSE NEW.skill_tokens END;
+BEGIN
+    INSERT INTO skill_facets AS f (token, resume_count)
+    SELECT token, 1 FROM unnest(new_tokens) AS token WHERE NOT token = ANY(old_tokens)
+    ORDER BY token
+    ON CONFLICT (token) DO UPDATE SET resume_count = f.resume_count + 1;
+
+    UPDATE skill_facets SET resume_count = resume_count - 1
+    WHERE token IN (SELECT token FROM unnest(old_tokens) AS token WHERE NOT token = ANY(new_tokens));
+
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    skill_aliases = op.create_table(
+        'skill_aliases',
+        sa.Column('alias', sa.String(), nullable=False),
+        sa.Column('token', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('alias'),
+    )
+    op.bulk_insert(skill_aliases, [{'alias': alias, 'token': token} for alias, token in SKILL_ALIASES.items()])
+
+    op.create_table(
+        'skill_facets',
+        sa.Column('token', sa.String(), nullable=False),
+        sa.Column('resume_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('token'),
+    )
+    op.create_index('ix_skill_facets_resume_count', 'skill_facets', ['resume_count'], unique=False)
+
+    op.add_column(
+        'resumes',
+        sa.Column('skill_tokens', postgresql.ARRAY(sa.String()), server_default='{}', nullable=False),
+    )
+
+    op.execute(NORMALIZE_FUNCTION)
+    op.execute(RESUME_SKILL_TOKENS_FUNCTION)
+    op.execute(SECTION_TRIGGER_FUNCTION)
+    op.execute(FACETS_TRIGGER_FUNCTION)
+
+    op.execute('UPDATE resumes SET skill_tokens = resume_skill_tokens(id)')
+    op.execute(
+        'INSERT INTO skill_facets (token, resume_count) '
+        'SELECT token, count(*) FROM resumes, unnest(skill_tokens) AS token GROUP BY token'
+    )
+
+    for table in SKILL_TOKEN_TABLES:
+        op.execute(
+            f'CREATE TRIGGER {table}_skill_tokens_insert AFTER INSERT ON {table} '
+            f'REFERENCING NEW TABLE AS new_rows '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION resume_sections_skill_tokens_trigger()'
+        )
+        op.execute(
+            f'CREATE TRIGGER {table}_skill_tokens_update AFTER UPDATE ON {table} '
+            f'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION resume_sections_skill_tokens_trigger()'
+        )
+        op.execute(
+            f'CREATE TRIGGER {table}_skill_tokens_delete AFTER DELETE ON {table} '
+            f'REFERENCING OLD TABLE AS old_rows '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION resume_sections_skill_tokens_trigger()'
+        )
+    op.execute(
+        'CREATE TRIGGER resumes_skill_facets AFTER INSERT OR DELETE OR UPDATE OF skill_tokens ON resumes '
+        'FOR EACH ROW EXECUTE FUNCTION resumes_skill_facets_trigger()'
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_resumes_skill_tokens', 'resumes', ['skill_tokens'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_resumes_skill_tokens', table_name='resumes', postgresql_concurrently=True, if_exists=True
+        )
+
+    op.execute('DROP TRIGGER IF EXISTS resumes_skill_facets ON resumes')
+    for table in SKILL_TOKEN_TABLES:
+        for event in ('insert', 'update', 'delete'):
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_skill_tokens_{event} ON {table}')
+
+    op.execute('DROP FUNCTION IF EXISTS resumes_skill_facets_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS resume_sections_skill_tokens_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS resume_skill_tokens(integer)')
+    op.execute('DROP FUNCTION IF EXISTS normalize_skill_token(text)')
+
+    op.drop_column('resumes', 'skill_tokens')
+    op.drop_index('ix_skill_facets_resume_count', table_name='skill_facets')
+    op.drop_table('skill_facets')
+    op.drop_table('skill_aliases')
@@ -0,0 +1,39 @@
+"""resume vectors
+
+Revision ID: d6ef0f63adf9
+Revises: aa65a181288c
+Create Date: 2026-10-18 16:44:30.902158
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6ef0f63adf9'
+down_revision: Union[str, Sequence[str], None] = 'aa65a181288c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'resume_vectors',
+        sa.Column('resume_id', sa.Integer(), nullable=False),
+        sa.Column('dim', sa.Integer(), nullable=False),
+        sa.Column('vector', sa.LargeBinary(), nullable=False),
+        sa.Column('resume_updated_at', sa.DateTime(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('resume_id'),
+    )
+    op.create_index(op.f('ix_resume_vectors_computed_at'), 'resume_vectors', ['computed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_resume_vectors_computed_at'), table_name='resume_vectors')
+    op.drop_table('resume_vectors')
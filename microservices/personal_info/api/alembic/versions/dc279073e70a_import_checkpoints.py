@@ -0,0 +1,38 @@
+"""import checkpoints
+
+Revision ID: dc279073e70a
+Revises: d6ef0f63adf9
+Create Date: 2026-10-18 18:05:13.551872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dc279073e70a'
+down_revision: Union[str, Sequence[str], None] = 'd6ef0f63adf9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'import_checkpoints',
+        sa.Column('import_id', sa.String(), nullable=False),
+        sa.Column('lines', sa.Integer(), nullable=False),
+        sa.Column('resumes_imported', sa.Integer(), nullable=False),
+        sa.Column('resumes_skipped', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('import_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('import_checkpoints')
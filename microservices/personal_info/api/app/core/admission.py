@@ -0,0 +1,81 @@
+import math
+from collections.abc import AsyncGenerator
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+
+from app.core.config import settings
+from app.core.database import Database, get_database
+from app.core.pool import InstrumentedAsyncQueuePool
+
+
+class LoadShedder:
+    """Adaptive cap on the requests this worker serves at once, driven by the primary pool's pressure.
+
+    While callers wait for connections longer than ``max_wait`` seconds, or more
+    than ``max_queue`` of them are waiting, the cap drops below the current
+    concurrency and excess requests are rejected right away instead of piling up
+    in the pool queue. Without pressure it grows back by one per admitted request,
+    up to ``max_limit``; it never drops below what the pool can serve at once.
+    """
+
+    def __init__(self, max_wait: float | None, max_queue: int | None, max_limit: int) -> None:
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self.in_flight = 0
+        self.shed = 0
+
+    def pressure(self, pool: InstrumentedAsyncQueuePool) -> bool:
+        return (
+            (self.max_wait is not None and pool.recent_wait() > self.max_wait)
+            or (self.max_queue is not None and pool.waiting > self.max_queue)
+        )
+
+    def admit(self, pool: InstrumentedAsyncQueuePool) -> float | None:
+        """Take a slot; None when admitted, otherwise seconds the caller should wait before retrying."""
+        if self.pressure(pool):
+            self.limit = max(min(pool.capacity, self.max_limit), int(self.in_flight * 0.9))
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+
+        if self.in_flight >= self.limit:
+            self.shed += 1
+            return max(1.0, pool.recent_wait())
+
+        self.in_flight += 1
+        return None
+
+    def release(self) -> None:
+        self.in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {"limit": self.limit, "in_flight": self.in_flight, "shed": self.shed}
+
+
+load_shedder = LoadShedder(
+    max_wait=settings.SHED_POOL_WAIT_MS / 1000 if settings.SHED_POOL_WAIT_MS is not None else None,
+    max_queue=settings.SHED_POOL_QUEUE_DEPTH,
+    max_limit=settings.SHED_MAX_CONCURRENCY,
+)
+
+
+async def shed_load(database: Annotated[Database, Depends(get_database)]) -> AsyncGenerator[None]:
+    pool = database.engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        yield
+        return
+
+    retry_after = load_shedder.admit(pool)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is overloaded, retry later.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    try:
+        yield
+    finally:
+        load_shedder.release()
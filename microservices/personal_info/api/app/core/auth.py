@@ -1,39 +1,60 @@
+from functools import lru_cache
+from time import perf_counter
 from typing import Any
 
 from fastapi import HTTPException, status, Request, Depends
-from jose import jwt, JWTError, ExpiredSignatureError
-from mypy.build import TypedDict
+from jose import jwk, jwt, JWTError, ExpiredSignatureError
+from jose.backends.base import Key
 from pydantic import ValidationError
 
 from app.core.config import settings
+from app.core.metrics import request_metrics
+from app.core.token_cache import TokenCache
 from app.schemas.user import AccessTokenPayload
 
+token_cache = TokenCache(max_size=settings.JWT_CACHE_MAX_SIZE)
+
+
+@lru_cache(maxsize=1)
+def get_jwt_public_key() -> Key:
+    return jwk.construct(settings.JWT_PUBLIC_KEY_PEM, settings.JWT_ALGORITHM)
+
 
 def verify_jwt_token(token: str) -> AccessTokenPayload:
+    start = perf_counter()
+    cached = token_cache.get(token)
+    if cached is not None:
+        request_metrics.observe_jwt_verification(perf_counter() - start, "hit")
+        return cached
+
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_PUBLIC_KEY_PEM,
+            get_jwt_public_key(),
             algorithms=[settings.JWT_ALGORITHM],
         )
 
-
-        return AccessTokenPayload.model_validate(payload)
+        token_payload = AccessTokenPayload.model_validate(payload)
 
     except ExpiredSignatureError:
+        request_metrics.observe_jwt_verification(perf_counter() - start, "failed")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired.",
         )
     except (JWTError, ValidationError) as e:
+        request_metrics.observe_jwt_verification(perf_counter() - start, "failed")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
 
+    token_cache.put(token, token_payload)
+    request_metrics.observe_jwt_verification(perf_counter() - start, "miss")
+    return token_payload
 
-def get_token_payload(request: Request) -> AccessTokenPayload:
-    authorization_header = request.headers.get("Authorization")
+
+def _verify_authorization(authorization_header: str | None) -> AccessTokenPayload:
     if not authorization_header or not authorization_header.startswith("Bearer "):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -44,5 +65,33 @@ def get_token_payload(request: Request) -> AccessTokenPayload:
     return verify_jwt_token(token)
 
 
+def get_token_payload(request: Request) -> AccessTokenPayload:
+    """The verified payload of the request's bearer token.
+
+    The outcome, a rejection included, is kept on ``request.state``: the rate
+    limiter, read routing and the route's own dependencies all ask, and an invalid
+    token must not cost a signature verification for each of them.
+    """
+    outcome: AccessTokenPayload | HTTPException | None = getattr(request.state, "token_payload", None)
+    if outcome is None:
+        try:
+            outcome = _verify_authorization(request.headers.get("Authorization"))
+        except HTTPException as e:
+            outcome = e
+        request.state.token_payload = outcome
+
+    if isinstance(outcome, HTTPException):
+        raise outcome
+    return outcome
+
+
 def get_user_id(request: Request, token=Depends(get_token_payload)) -> int:
     return token.sub
+
+
+def get_optional_user_id(request: Request) -> int | None:
+    """The caller's user id when the request carries a valid token, without rejecting it otherwise."""
+    try:
+        return get_token_payload(request).sub
+    except HTTPException:
+        return None
@@ -0,0 +1,4 @@
+from sqlalchemy.orm import declarative_base
+
+# Kept apart from app.core.database so models and migrations can import it without creating engines.
+Base = declarative_base()
@@ -0,0 +1,155 @@
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.core.config import settings
+from app.core.single_flight import read_flights
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """Serialized response body stamped with the version (ETag) it was rendered from."""
+
+    version: str
+    body: bytes
+
+    def dumps(self) -> bytes:
+        return self.version.encode() + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "CacheEntry":
+        version, _, body = raw.partition(b"\n")
+        return cls(version=version.decode(), body=body)
+
+
+class CacheBackend(ABC):
+    """Minimal async key/value interface the read paths rely on.
+
+    Hash keys group entries that are invalidated together, e.g. every cached page
+    of a user's social links.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int) -> None: ...
+
+    @abstractmethod
+    async def hget(self, key: str, field: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def hset(self, key: str, field: str, value: bytes, ttl: int) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+
+class NullCache(CacheBackend):
+    async def get(self, key: str) -> bytes | None:
+        return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    async def hget(self, key: str, field: str) -> bytes | None:
+        return None
+
+    async def hset(self, key: str, field: str, value: bytes, ttl: int) -> None:
+        pass
+
+    async def delete(self, *keys: str) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """In-process backend for tests and single-process local runs."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[float, bytes | dict[str, bytes]]] = {}
+
+    def _live(self, key: str) -> bytes | dict[str, bytes] | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        return value
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._live(key)
+        return value if isinstance(value, bytes) else None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+
+    async def hget(self, key: str, field: str) -> bytes | None:
+        value = self._live(key)
+        return value.get(field) if isinstance(value, dict) else None
+
+    async def hset(self, key: str, field: str, value: bytes, ttl: int) -> None:
+        current = self._live(key)
+        fields = current if isinstance(current, dict) else {}
+        fields[field] = value
+        self._data[key] = (time.monotonic() + ttl, fields)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        from app.core.redis_cache import RedisCache
+
+        return RedisCache.from_settings(settings)
+
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCache()
+
+    return NullCache()
+
+
+def resume_cache_key(resume_id: int) -> str:
+    return f"resume:{resume_id}"
+
+
+def user_resume_cache_key(user_id: int) -> str:
+    return f"resume:user:{user_id}"
+
+
+def social_links_cache_key(user_id: int) -> str:
+    return f"social_links:user:{user_id}"
+
+
+def recent_write_cache_key(user_id: int) -> str:
+    return f"recent_write:user:{user_id}"
+
+
+async def get_entry(cache: CacheBackend, key: str, field: str | None = None) -> CacheEntry | None:
+    raw = await (cache.get(key) if field is None else cache.hget(key, field))
+    return CacheEntry.loads(raw) if raw is not None else None
+
+
+async def set_entry(cache: CacheBackend, key: str, entry: CacheEntry, ttl: int, field: str | None = None) -> None:
+    if field is None:
+        await cache.set(key, entry.dumps(), ttl)
+    else:
+        await cache.hset(key, field, entry.dumps(), ttl)
+
+
+async def invalidate_user_cache(cache: CacheBackend, user_id: int, resume_id: int | None = None) -> None:
+    """Drop every cached read derived from ``user_id``'s resume aggregate."""
+    keys = [user_resume_cache_key(user_id), social_links_cache_key(user_id)]
+    if resume_id is not None:
+        keys.append(resume_cache_key(resume_id))
+
+    # Reads already in flight may predate the write; later callers must not join them.
+    read_flights.forget(*keys)
+    await cache.delete(*keys)
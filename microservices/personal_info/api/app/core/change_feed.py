@@ -0,0 +1,254 @@
+import asyncio
+import datetime as dt
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import orjson
+
+from app.core.cache import CacheBackend, invalidate_user_cache
+from app.core.config import settings
+from app.core.etag import resume_etag
+from app.core.warmup import readiness
+
+if TYPE_CHECKING:
+    import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Must match the channel of the notify triggers, see the resume_change_notifications migration.
+CHANNEL = "resume_changes"
+VERSION_FORMAT = "%Y%m%d%H%M%S%f"
+
+BACKFILL_QUERY = (
+    "SELECT id, user_id, to_char(updated_at, 'YYYYMMDDHH24MISSUS') FROM resumes "
+    "WHERE updated_at > $1 ORDER BY updated_at"
+)
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+# Seconds an idle event stream takes at most to notice that its worker is draining.
+DRAIN_CHECK_INTERVAL = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeChange:
+    """A write to a resume or one of its sections, from a ``resume_id:user_id:table:op:version`` payload.
+
+    Only changes of the ``resumes`` row carry the new ``updated_at``; section
+    changes are followed by one in the same transaction.
+    """
+
+    resume_id: int
+    user_id: int
+    table: str
+    op: str
+    updated_at: dt.datetime | None = None
+
+    @classmethod
+    def loads(cls, payload: str) -> "ResumeChange":
+        resume_id, user_id, table, op, version = payload.split(":", 4)
+        updated_at = dt.datetime.strptime(version, VERSION_FORMAT) if version else None
+        return cls(int(resume_id), int(user_id), table, op, updated_at)
+
+    @property
+    def etag(self) -> str | None:
+        return resume_etag(self.resume_id, self.updated_at) if self.updated_at is not None else None
+
+
+Subscriber = Callable[[ResumeChange], Awaitable[None]]
+
+
+class ChangeFeed:
+    """Resume changes committed by any worker or instance, from one LISTEN connection per worker.
+
+    ``run`` owns the connection: a keepalive query every ``keepalive_interval``
+    seconds notices when it is gone, and it is reopened after ``reconnect_interval``.
+    Notifications sent meanwhile are lost, so after reconnecting every resume
+    updated since the last good keepalive, less ``backfill_margin`` for
+    transactions that were still open then, is replayed as a change. Deleted
+    resumes cannot be replayed.
+    """
+
+    def __init__(
+            self,
+            dsn: str,
+            keepalive_interval: float,
+            reconnect_interval: float,
+            backfill_margin: float,
+    ) -> None:
+        self.dsn = dsn
+        self.keepalive_interval = keepalive_interval
+        self.reconnect_interval = reconnect_interval
+        self.backfill_margin = dt.timedelta(seconds=backfill_margin)
+        self.subscribers: list[Subscriber] = []
+        self.connected = False
+        # Database clock (localtimestamp, like updated_at) at the last successful keepalive.
+        self.alive_at: dt.datetime | None = None
+        self.received = 0
+        self.backfilled = 0
+        self.reconnects = 0
+        self._queue: asyncio.Queue[ResumeChange] = asyncio.Queue()
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+
+    async def dispatch(self, change: ResumeChange) -> None:
+        for subscriber in list(self.subscribers):
+            try:
+                await subscriber(change)
+            except Exception:
+                logger.exception("Change subscriber failed for resume %s", change.resume_id)
+
+    def _on_notification(self, connection: object, pid: int, channel: str, payload: str) -> None:
+        try:
+            change = ResumeChange.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed change notification %r", payload)
+            return
+
+        self.received += 1
+        self._queue.put_nowait(change)
+
+    async def run(self) -> None:
+        """Listen until cancelled, reconnecting whenever the connection fails."""
+        dispatcher = asyncio.create_task(self._dispatch_queued())
+        try:
+            while True:
+                try:
+                    await self._listen()
+                except Exception as e:
+                    logger.warning(
+                        "Change feed connection failed (%s: %s), reconnecting in %s s",
+                        e.__class__.__name__, e, self.reconnect_interval,
+                    )
+                await asyncio.sleep(self.reconnect_interval)
+                self.reconnects += 1
+        finally:
+            dispatcher.cancel()
+
+    async def _dispatch_queued(self) -> None:
+        while True:
+            await self.dispatch(await self._queue.get())
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        connection = await asyncpg.connect(self.dsn, timeout=self.keepalive_interval)
+        try:
+            await connection.add_listener(CHANNEL, self._on_notification)
+            # Backfilled only once LISTEN is in place, so no change falls in between.
+            if self.alive_at is not None:
+                await self._backfill(connection, self.alive_at - self.backfill_margin)
+            self.connected = True
+
+            while True:
+                self.alive_at = await connection.fetchval("SELECT localtimestamp", timeout=self.keepalive_interval)
+                await asyncio.sleep(self.keepalive_interval)
+        finally:
+            self.connected = False
+            # terminate() does not wait on a connection that may already be dead.
+            connection.terminate()
+
+    async def _backfill(self, connection: "asyncpg.Connection", since: dt.datetime) -> None:
+        rows = await connection.fetch(BACKFILL_QUERY, since, timeout=self.keepalive_interval)
+        for resume_id, user_id, version in rows:
+            self._queue.put_nowait(ResumeChange.loads(f"{resume_id}:{user_id}:resumes:UPDATE:{version}"))
+
+        self.backfilled += len(rows)
+        logger.info("Change feed reconnected, replayed %d resumes changed since %s", len(rows), since)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "connected": self.connected,
+            "alive_at": self.alive_at,
+            "subscribers": len(self.subscribers),
+            "received": self.received,
+            "backfilled": self.backfilled,
+            "reconnects": self.reconnects,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_change_feed() -> ChangeFeed:
+    return ChangeFeed(
+        "postgresql://" + settings.DATABASE_URL,
+        keepalive_interval=settings.CHANGE_FEED_KEEPALIVE_INTERVAL,
+        reconnect_interval=settings.CHANGE_FEED_RECONNECT_INTERVAL,
+        backfill_margin=settings.CHANGE_FEED_BACKFILL_MARGIN,
+    )
+
+
+def cache_invalidator(cache: CacheBackend) -> Subscriber:
+    """Subscriber dropping the cached reads, and this worker's in-flight loads, of every changed resume."""
+
+    async def invalidate(change: ResumeChange) -> None:
+        await invalidate_user_cache(cache, change.user_id, change.resume_id)
+
+    return invalidate
+
+
+def _event(event: str, id: str | None, data: dict[str, object]) -> bytes:
+    head = f"event: {event}\nid: {id}\n" if id is not None else f"event: {event}\n"
+    return head.encode() + b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+async def resume_events(
+        feed: ChangeFeed,
+        user_id: int,
+        version: tuple[int, dt.datetime] | None,
+        last_event_id: str | None,
+        keepalive_interval: float,
+        retry_ms: int = 3000,
+) -> AsyncIterator[bytes]:
+    """Server-sent events for ``user_id``'s resume: one per committed change, with the new ETag as its id.
+
+    ``version`` is the resume's current ``(id, updated_at)``. A client that
+    reconnects with a ``Last-Event-ID`` other than the current ETag missed a
+    change and gets it first. Section changes are collected into the ``sections``
+    of the resume event that follows them in the same transaction. The stream
+    ends once the worker drains, so the client reconnects to another one instead
+    of holding up shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[ResumeChange] = asyncio.Queue()
+
+    async def enqueue(change: ResumeChange) -> None:
+        if change.user_id == user_id:
+            queue.put_nowait(change)
+
+    feed.subscribe(enqueue)
+    try:
+        yield f"retry: {retry_ms}\n\n".encode()
+
+        if version is not None and resume_etag(*version) != last_event_id:
+            yield _event("change", resume_etag(*version), {"resume_id": version[0], "sections": []})
+
+        sections: set[str] = set()
+        sent_at = loop.time()
+        while readiness.state != "draining":
+            try:
+                change = await asyncio.wait_for(queue.get(), min(keepalive_interval, DRAIN_CHECK_INTERVAL))
+            except TimeoutError:
+                if loop.time() - sent_at >= keepalive_interval:
+                    sent_at = loop.time()
+                    yield b": keepalive\n\n"
+                continue
+
+            if change.table != "resumes":
+                sections.add(change.table)
+                continue
+
+            sent_at = loop.time()
+            yield _event(
+                "delete" if change.op == "DELETE" else "change",
+                change.etag,
+                {"resume_id": change.resume_id, "sections": sorted(sections)},
+            )
+            sections.clear()
+    finally:
+        feed.unsubscribe(enqueue)
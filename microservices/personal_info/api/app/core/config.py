@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -11,13 +13,102 @@ class Settings(BaseSettings):
     POSTGRES_ASYNC_DRIVER: str = "postgresql+asyncpg://"
     POSTGRES_SYNC_DRIVER: str = "postgresql+psycopg://"
 
+    DB_POOL_SIZE: int = Field(5, alias="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(10, alias="DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT: float = Field(30.0, alias="DB_POOL_TIMEOUT")
+    DB_POOL_RECYCLE: int = Field(1800, alias="DB_POOL_RECYCLE")
+    DB_POOL_PRE_PING: bool = Field(True, alias="DB_POOL_PRE_PING")
+    DB_STATEMENT_CACHE_SIZE: int = Field(100, alias="DB_STATEMENT_CACHE_SIZE")
+    DB_COMMAND_TIMEOUT: float | None = Field(None, alias="DB_COMMAND_TIMEOUT")
+    # Connections all workers of one instance may hold per database server; split into per-worker pools.
+    DB_MAX_CONNECTIONS: int | None = Field(None, alias="DB_MAX_CONNECTIONS")
+
+    # Comma-separated "user:password@host:port/db" of read replicas; empty sends every read to the primary.
+    DB_REPLICA_URLS: str = Field("", alias="DB_REPLICA_URLS")
+    DB_REPLICA_SELECTION: Literal["round_robin", "least_connections"] = Field(
+        "round_robin", alias="DB_REPLICA_SELECTION"
+    )
+    DB_REPLICA_MAX_LAG: float = Field(5.0, alias="DB_REPLICA_MAX_LAG")
+    DB_REPLICA_CHECK_INTERVAL: float = Field(2.0, alias="DB_REPLICA_CHECK_INTERVAL")
+    DB_READ_YOUR_WRITES_WINDOW: float = Field(10.0, alias="DB_READ_YOUR_WRITES_WINDOW")
+
+    WEB_HOST: str = Field("0.0.0.0", alias="WEB_HOST")
+    WEB_PORT: int = Field(80, alias="WEB_PORT")
+    # Worker processes; defaults to the CPUs available to the container.
+    WEB_CONCURRENCY: int | None = Field(None, alias="WEB_CONCURRENCY")
+    WEB_MAX_REQUESTS: int | None = Field(20_000, alias="WEB_MAX_REQUESTS")
+    WEB_MAX_REQUESTS_JITTER: int = Field(2_000, alias="WEB_MAX_REQUESTS_JITTER")
+    WEB_GRACEFUL_TIMEOUT: int = Field(30, alias="WEB_GRACEFUL_TIMEOUT")
+    # Seconds a worker keeps serving, with /ready at 503, between SIGTERM and closing its sockets.
+    WEB_DRAIN_DELAY: float = Field(5.0, alias="WEB_DRAIN_DELAY")
+    WEB_RELOAD: bool = Field(False, alias="WEB_RELOAD")
+
+    RATE_LIMIT_BACKEND: Literal["redis", "memory", "none"] = Field("memory", alias="RATE_LIMIT_BACKEND")
+    # "requests/seconds" token buckets per caller and route; callers without a token are keyed by address.
+    RATE_LIMIT_DEFAULT: str = Field("600/60", alias="RATE_LIMIT_DEFAULT")
+    # Comma-separated "METHOD /route/template=requests/seconds" overrides of the default.
+    RATE_LIMIT_ROUTES: str = Field("POST /social-links/=120/60,PUT /resumes/me=60/60", alias="RATE_LIMIT_ROUTES")
+    # Links per POST /social-links/ request; each one costs a rate limit token.
+    SOCIAL_LINKS_MAX_BATCH: int = Field(100, alias="SOCIAL_LINKS_MAX_BATCH")
+
+    # Requests are shed with 503 while the primary pool's recent checkout wait or its queue of waiting
+    # callers is above these; None disables a signal.
+    SHED_POOL_WAIT_MS: float | None = Field(200.0, alias="SHED_POOL_WAIT_MS")
+    SHED_POOL_QUEUE_DEPTH: int | None = Field(32, alias="SHED_POOL_QUEUE_DEPTH")
+    SHED_MAX_CONCURRENCY: int = Field(256, alias="SHED_MAX_CONCURRENCY")
+
+    # One LISTEN connection per worker (outside the pool) for resume changes made by every worker.
+    CHANGE_FEED_ENABLED: bool = Field(True, alias="CHANGE_FEED_ENABLED")
+    CHANGE_FEED_KEEPALIVE_INTERVAL: float = Field(10.0, alias="CHANGE_FEED_KEEPALIVE_INTERVAL")
+    CHANGE_FEED_RECONNECT_INTERVAL: float = Field(2.0, alias="CHANGE_FEED_RECONNECT_INTERVAL")
+    CHANGE_FEED_BACKFILL_MARGIN: float = Field(60.0, alias="CHANGE_FEED_BACKFILL_MARGIN")
+    SSE_KEEPALIVE_INTERVAL: float = Field(15.0, alias="SSE_KEEPALIVE_INTERVAL")
+
+    WARMUP_ENABLED: bool = Field(True, alias="WARMUP_ENABLED")
+    WARMUP_RETRY_INTERVAL: float = Field(2.0, alias="WARMUP_RETRY_INTERVAL")
+
     JWT_PUBLIC_KEY: str = Field(..., alias="JWT_PUBLIC_KEY")
     JWT_ALGORITHM: str = Field("RS256", alias="JWT_ALGORITHM")
+    JWT_CACHE_MAX_SIZE: int = Field(10_000, alias="JWT_CACHE_MAX_SIZE")
+
+    METRICS_ENABLED: bool = Field(True, alias="METRICS_ENABLED")
+    SERVER_TIMING_ENABLED: bool = Field(False, alias="SERVER_TIMING_ENABLED")
+
+    SLOW_QUERY_THRESHOLD_MS: float | None = Field(250.0, alias="SLOW_QUERY_THRESHOLD_MS")
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = Field(0.01, alias="SLOW_QUERY_EXPLAIN_SAMPLE_RATE")
+    SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = Field(5000, alias="SLOW_QUERY_EXPLAIN_TIMEOUT_MS")
+    SLOW_QUERY_BUFFER_SIZE: int = Field(200, alias="SLOW_QUERY_BUFFER_SIZE")
+
+    MATCH_VECTOR_DIM: int = Field(256, alias="MATCH_VECTOR_DIM")
+    MATCH_SCORE_BATCH_SIZE: int = Field(65_536, alias="MATCH_SCORE_BATCH_SIZE")
+    MATCH_REFRESH_BATCH_SIZE: int = Field(500, alias="MATCH_REFRESH_BATCH_SIZE")
+    # One worker at a time recomputes at most MATCH_REFRESH_BATCH_SIZE stale vectors per MATCH_REFRESH_INTERVAL;
+    # every worker reloads the vectors written since its last tick.
+    MATCH_REFRESH_ENABLED: bool = Field(True, alias="MATCH_REFRESH_ENABLED")
+    MATCH_REFRESH_INTERVAL: float = Field(5.0, alias="MATCH_REFRESH_INTERVAL")
+
+    IMPORT_BATCH_SIZE: int = Field(1000, alias="IMPORT_BATCH_SIZE")
+
+    # Concurrent identical reads share one database load (per worker).
+    READ_COALESCING_ENABLED: bool = Field(True, alias="READ_COALESCING_ENABLED")
+
+    CACHE_BACKEND: Literal["redis", "memory", "none"] = Field("none", alias="CACHE_BACKEND")
+    CACHE_RESUME_TTL: int = Field(300, alias="CACHE_RESUME_TTL")
+    CACHE_SOCIAL_LINKS_TTL: int = Field(300, alias="CACHE_SOCIAL_LINKS_TTL")
+    REDIS_HOST: str = Field("redis", alias="REDIS_HOST")
+    REDIS_PORT: int = Field(6379, alias="REDIS_PORT")
+    REDIS_DB: int = Field(0, alias="REDIS_DB")
+    REDIS_PASSWORD_FILE: str = Field("/run/secrets/redis_password", alias="REDIS_PASSWORD_FILE")
+    REDIS_SOCKET_TIMEOUT: float = Field(0.5, alias="REDIS_SOCKET_TIMEOUT")
 
     @property
     def JWT_PUBLIC_KEY_PEM(self) -> str:
         return self.JWT_PUBLIC_KEY.replace("\\n", "\n")
 
+    @property
+    def REPLICA_DATABASE_URLS(self) -> list[str]:
+        return [url.strip() for url in self.DB_REPLICA_URLS.split(",") if url.strip()]
+
     @property
     def DATABASE_URL(self) -> str:
         return (
@@ -1,20 +1,136 @@
+import math
 from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Annotated
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.ext.declarative import declarative_base
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.auth import get_optional_user_id
+from app.core.base import Base  # noqa: F401
+from app.core.cache import CacheBackend, get_cache
 from app.core.config import settings
+from app.core.metrics import install_query_hooks
+from app.core.pool import InstrumentedAsyncQueuePool
+from app.core.replicas import REPLICA_INFO_KEY, Replica, ReplicaSet
+from app.core.slow_query import slow_query_log
 
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 
-from sqlalchemy.orm import declarative_base
+def _create_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        settings.POSTGRES_ASYNC_DRIVER + url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        },
+    )
+    install_query_hooks(engine.sync_engine)
+    slow_query_log.install(engine.sync_engine)
+    return engine
 
-engine = create_async_engine(settings.POSTGRES_ASYNC_DRIVER + settings.DATABASE_URL)
-AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
-Base = declarative_base()
+class Database:
+    """The primary engine and the optional read replicas of this process."""
 
+    def __init__(self, engine: AsyncEngine, replica_set: ReplicaSet | None = None) -> None:
+        self.engine = engine
+        self.session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        self.replica_set = replica_set
 
-async def get_db() -> AsyncGenerator[AsyncSession]:
-    async with AsyncSessionLocal() as session:
+    @classmethod
+    def from_settings(cls) -> "Database":
+        replica_set = ReplicaSet(
+            [Replica(url.rpartition("@")[2], _create_engine(url)) for url in settings.REPLICA_DATABASE_URLS],
+            selection=settings.DB_REPLICA_SELECTION,
+            max_lag=settings.DB_REPLICA_MAX_LAG,
+            check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+            read_your_writes_window=settings.DB_READ_YOUR_WRITES_WINDOW,
+        ) if settings.REPLICA_DATABASE_URLS else None
+
+        return cls(_create_engine(settings.DATABASE_URL), replica_set)
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        for replica in self.replica_set.replicas if self.replica_set is not None else ():
+            await replica.engine.dispose()
+
+
+@lru_cache(maxsize=1)
+def get_database() -> Database:
+    """Engines are created by the app lifespan (or on first use), never at import time."""
+    return Database.from_settings()
+
+
+async def close_database() -> None:
+    if get_database.cache_info().currsize:
+        await get_database().dispose()
+        get_database.cache_clear()
+
+
+async def get_db(
+        request: Request,
+        database: Annotated[Database, Depends(get_database)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+) -> AsyncGenerator[AsyncSession]:
+    """Session on the primary. Unsafe requests also pin their user's reads to it for a while."""
+    async with database.session_factory() as session:
+        try:
+            yield session
+        finally:
+            if database.replica_set is not None and request.method not in SAFE_METHODS:
+                user_id = get_optional_user_id(request)
+                if user_id is not None:
+                    await database.replica_set.record_write(user_id, cache)
+
+
+def get_session_factory(database: Annotated[Database, Depends(get_database)]) -> async_sessionmaker[AsyncSession]:
+    return database.session_factory
+
+
+async def get_read_session_factory(
+        request: Request,
+        database: Annotated[Database, Depends(get_database)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+) -> async_sessionmaker[AsyncSession]:
+    """Sessions for a read-only handler: a replica in rotation, or the primary.
+
+    The primary serves unsafe methods, users inside their read-your-writes window
+    and every read while no replica is within the lag threshold.
+    """
+    replica_set = database.replica_set
+    if replica_set is None or request.method not in SAFE_METHODS:
+        return database.session_factory
+
+    user_id = get_optional_user_id(request)
+    if user_id is not None and await replica_set.wrote_recently(user_id, cache):
+        return database.session_factory
+
+    replica = replica_set.pick()
+    return replica.session_factory if replica is not None else database.session_factory
+
+
+async def get_read_db(
+        session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_read_session_factory)],
+) -> AsyncGenerator[AsyncSession]:
+    async with session_factory() as session:
         yield session
+
+
+def cache_ttl(db: AsyncSession, ttl: int) -> int:
+    """TTL for a cache entry loaded through ``db``.
+
+    A replica can still serve the version a write on the primary has just
+    invalidated, so what it loaded is cached no longer than a replica in
+    rotation may lag behind.
+    """
+    if db.info.get(REPLICA_INFO_KEY) is None:
+        return ttl
+    return min(ttl, max(1, math.floor(settings.DB_REPLICA_MAX_LAG)))
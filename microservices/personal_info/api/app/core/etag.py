@@ -0,0 +1,128 @@
+import datetime as dt
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from fastapi import HTTPException, Response, status
+
+from app.core.cache import CacheBackend, CacheEntry, get_entry, set_entry
+from app.core.config import settings
+from app.core.single_flight import read_flights
+
+CACHE_CONTROL = "private, no-cache"
+
+T = TypeVar("T")
+
+
+def make_etag(kind: str, object_id: int, updated_at: dt.datetime) -> str:
+    """Strong validator for everything derived from one resume version.
+
+    Every write to a resume or one of its sections bumps ``resumes.updated_at``,
+    so the timestamp is a version number for the whole aggregate.
+    """
+    return f'"{kind}{object_id}.{updated_at:%Y%m%d%H%M%S%f}"'
+
+
+def resume_etag(resume_id: int, updated_at: dt.datetime) -> str:
+    return make_etag("r", resume_id, updated_at)
+
+
+def social_links_etag(resume_id: int, updated_at: dt.datetime) -> str:
+    return make_etag("l", resume_id, updated_at)
+
+
+def social_link_etag(link_id: int, updated_at: dt.datetime) -> str:
+    return make_etag("s", link_id, updated_at)
+
+
+def _parse(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def none_match(if_none_match: str | None, etag: str) -> bool:
+    """True when ``If-None-Match`` says the client copy is current (weak comparison)."""
+    if if_none_match is None:
+        return False
+
+    tags = _parse(if_none_match)
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def match(if_match: str | None, etag: str) -> bool:
+    """True when ``If-Match`` is absent or names ``etag`` (strong comparison)."""
+    if if_match is None:
+        return True
+
+    tags = _parse(if_match)
+    return "*" in tags or etag in tags
+
+
+def check_if_match(if_match: str | None, etag: str) -> None:
+    if not match(if_match, etag):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource has been modified.",
+        )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def entry_response(entry: CacheEntry) -> Response:
+    return Response(
+        entry.body,
+        media_type="application/json",
+        headers={"ETag": entry.version, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+async def _coalesced(key: str, flight: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+    if not settings.READ_COALESCING_ENABLED:
+        return await load()
+    return await read_flights.do(key, flight, load)
+
+
+async def conditional_read(
+        cache: CacheBackend,
+        key: str,
+        ttl: int,
+        if_none_match: str | None,
+        load_etag: Callable[[], Awaitable[str | None]],
+        load_entry: Callable[[], Awaitable[CacheEntry | None]],
+        field: str | None = None,
+        source: Hashable = None,
+) -> Response | None:
+    """Answer a GET from the cache, with 304 when possible, loading the body only when needed.
+
+    On a cache miss of a conditional request ``load_etag`` runs a version-only query
+    first, so an unchanged resource is confirmed without loading or serializing it.
+    Concurrent misses for the same key, field and ``source`` (the engine the loaders
+    read from) share one load; authorization stays with each caller's dependencies.
+    Returns ``None`` when ``load_entry`` finds nothing.
+    """
+    entry = await get_entry(cache, key, field)
+
+    if entry is None:
+        if if_none_match is not None:
+            etag = await _coalesced(key, ("etag", field, source), load_etag)
+            if etag is not None and none_match(if_none_match, etag):
+                return not_modified(etag)
+
+        async def load_and_store() -> CacheEntry | None:
+            with read_flights.watch(key) as forgotten:
+                loaded = await load_entry()
+                # An invalidation during the load means it may have read the old version: serve it, don't cache it.
+                if loaded is not None and not forgotten():
+                    await set_entry(cache, key, loaded, ttl, field)
+                    if forgotten():
+                        await cache.delete(key)
+            return loaded
+
+        entry = await _coalesced(key, ("entry", field, source), load_and_store)
+        if entry is None:
+            return None
+
+    if none_match(if_none_match, entry.version):
+        return not_modified(entry.version)
+
+    return entry_response(entry)
@@ -0,0 +1,147 @@
+import datetime as dt
+import math
+import re
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.models import Resume
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does doing during each
+for from further had has have having he her here hers him his how i if in into is it its itself just me more most my
+no nor not of off on once only or other our ours out over own same she should so some such than that the their theirs
+them then there these they this those through to too under until up very was we were what when where which while who
+whom why will with would you your yours
+""".split())
+
+
+def features(text: str) -> list[str]:
+    """Word unigrams and bigrams, lowercased, stop words dropped; keeps ``c++``, ``c#`` and ``node.js`` intact."""
+    words = [word for word in _WORD.findall(text.lower()) if word not in STOP_WORDS]
+    return words + [f"{first} {second}" for first, second in pairwise(words)]
+
+
+def vectorize(text: str, dim: int) -> np.ndarray:
+    """Signed feature-hashing vector with sublinear term frequency, L2-normalized.
+
+    Needs no shared vocabulary, so each resume can be (re)computed on its own. The
+    sign bit keeps hash collisions from systematically inflating similarity.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+
+    for feature, count in Counter(features(text)).items():
+        digest = zlib.crc32(feature.encode())
+        vector[digest % dim] += (1.0 + math.log(count)) * (1.0 if digest & 0x80000000 else -1.0)
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class MatchIndex:
+    """In-process matrix of resume vectors for brute-force cosine ranking.
+
+    Rows are unit vectors, so cosine similarity is one matrix-vector product. It is
+    kept in sync with ``resume_vectors`` incrementally, see ``app.crud.matching``.
+    Removed resumes leave a tombstone (id -1) that is skipped when ranking, until
+    a quarter of the rows are dead and the matrix is compacted.
+    """
+
+    def __init__(self, dim: int) -> None:
+        self.dim = dim
+        self.ids = np.empty(0, dtype=np.int64)
+        self.matrix = np.empty((0, dim), dtype=np.float32)
+        self.rows: dict[int, int] = {}
+        self.dead = 0
+        self.watermark: dt.datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def replace(self, ids: Sequence[int] | np.ndarray, vectors: np.ndarray) -> None:
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.matrix = np.array(vectors, dtype=np.float32).reshape(-1, self.dim)
+        self.rows = {int(resume_id): row for row, resume_id in enumerate(self.ids)}
+        self.dead = 0
+
+    def remove(self, ids: Iterable[int]) -> None:
+        for resume_id in ids:
+            row = self.rows.pop(resume_id, None)
+            if row is not None:
+                self.ids[row] = -1
+                self.dead += 1
+
+        if self.dead * 4 > len(self.ids):
+            alive = self.ids >= 0
+            self.replace(self.ids[alive], self.matrix[alive])
+
+    def upsert(self, ids: Sequence[int], vectors: np.ndarray) -> None:
+        new_ids, new_rows = [], []
+        for resume_id, vector in zip(ids, vectors, strict=True):
+            row = self.rows.get(resume_id)
+            if row is None:
+                new_ids.append(resume_id)
+                new_rows.append(vector)
+            else:
+                self.matrix[row] = vector
+
+        if new_ids:
+            for offset, resume_id in enumerate(new_ids):
+                self.rows[resume_id] = len(self.ids) + offset
+            self.ids = np.concatenate([self.ids, np.asarray(new_ids, dtype=np.int64)])
+            self.matrix = np.concatenate([self.matrix, np.asarray(new_rows, dtype=np.float32)])
+
+    def top_k(self, query: np.ndarray, k: int, batch_size: int) -> list[tuple[int, float]]:
+        """``k`` best ``(resume_id, cosine)`` pairs, scored ``batch_size`` rows at a time to bound temporaries."""
+        # A concurrent sync swaps these arrays rather than resizing them, so take one consistent pair.
+        ids, matrix, dead = self.ids, self.matrix, self.dead
+        best_rows: list[np.ndarray] = []
+        best_scores: list[np.ndarray] = []
+
+        for start in range(0, len(ids), batch_size):
+            scores = matrix[start:start + batch_size] @ query
+            if dead:
+                scores[ids[start:start + batch_size] < 0] = -np.inf
+            if len(scores) > k:
+                keep = np.argpartition(scores, -k)[-k:]
+                scores = scores[keep]
+            else:
+                keep = np.arange(len(scores))
+            best_rows.append(keep + start)
+            best_scores.append(scores)
+
+        if not best_rows:
+            return []
+
+        rows = np.concatenate(best_rows)
+        scores = np.concatenate(best_scores)
+        order = np.argsort(-scores, kind="stable")[:k]
+
+        return [(int(ids[rows[i]]), float(scores[i])) for i in order if ids[rows[i]] >= 0 and scores[i] > -np.inf]
+
+
+def resume_text(resume: "Resume") -> str:
+    """Matching text of a resume with ``experiences``, ``projects`` and ``skills`` loaded."""
+    parts: list[str | None] = [resume.professional_title, resume.summary]
+    for experience in resume.experiences:
+        parts += [experience.job_title, experience.description, experience.challenge]
+    for project in resume.projects:
+        parts += [project.title, project.description, *(project.tech_stack or ())]
+    parts += [skill.name for skill in resume.skills]
+
+    return "\n".join(part for part in parts if part)
+
+
+def to_bytes(vector: np.ndarray) -> bytes:
+    return vector.astype("<f4", copy=False).tobytes()
+
+
+def from_bytes(blobs: Iterable[bytes], dim: int) -> np.ndarray:
+    return np.frombuffer(b"".join(blobs), dtype="<f4").reshape(-1, dim)
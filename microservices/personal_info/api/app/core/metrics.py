@@ -0,0 +1,211 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+AUTH_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus semantics (cumulative ``le`` buckets)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        cumulative = 0
+        buckets: dict[str, int] = {}
+        for bound, count in zip((*map(str, self.buckets), "+Inf"), counts, strict=True):
+            cumulative += count
+            buckets[bound] = cumulative
+
+        return {"buckets": buckets, "count": cumulative, "sum": total}
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """Time spent inside one request, filled in by the query hooks and JWT verification."""
+
+    start: float
+    scope: Mapping[str, Any] = field(default_factory=dict)
+    db_statements: int = 0
+    db_seconds: float = 0.0
+    auth_seconds: float = 0.0
+
+    @property
+    def route(self) -> str:
+        """Path template of the matched route, available once routing has happened."""
+        return getattr(self.scope.get("route"), "path", UNMATCHED_ROUTE)
+
+    def server_timing(self) -> str:
+        total = (perf_counter() - self.start) * 1e3
+        return (
+            f'db;dur={self.db_seconds * 1e3:.2f};desc="{self.db_statements} statements", '
+            f"auth;dur={self.auth_seconds * 1e3:.2f}, total;dur={total:.2f}"
+        )
+
+
+current_timings: ContextVar[RequestTimings | None] = ContextVar("current_timings", default=None)
+
+
+class RequestMetrics:
+    """Per-route latency, statement count and DB time histograms, plus JWT verification time.
+
+    Routes are labelled by their path template, so label cardinality is bounded
+    by the number of routes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.db_seconds: dict[tuple[str, str], Histogram] = {}
+        self.db_statements: dict[tuple[str, str], Histogram] = {}
+        self.responses: dict[tuple[str, str, str], int] = {}
+        # Cache hits, verified misses, and tokens that failed verification.
+        self.jwt_verification = {outcome: Histogram(AUTH_LATENCY_BUCKETS) for outcome in ("hit", "miss", "failed")}
+
+    def _histograms(self, key: tuple[str, str]) -> tuple[Histogram, Histogram, Histogram]:
+        latency = self.latency.get(key)
+        if latency is None:
+            with self._lock:
+                if key not in self.latency:
+                    self.db_seconds[key] = Histogram()
+                    self.db_statements[key] = Histogram(STATEMENT_COUNT_BUCKETS)
+                    self.latency[key] = Histogram()
+                latency = self.latency[key]
+
+        return latency, self.db_seconds[key], self.db_statements[key]
+
+    def observe_request(
+            self, method: str, route: str, status_code: int, seconds: float, timings: RequestTimings,
+    ) -> None:
+        latency, db_seconds, db_statements = self._histograms((method, route))
+        latency.observe(seconds)
+        db_seconds.observe(timings.db_seconds)
+        db_statements.observe(timings.db_statements)
+
+        key = (method, route, str(status_code))
+        with self._lock:
+            self.responses[key] = self.responses.get(key, 0) + 1
+
+    def observe_jwt_verification(self, seconds: float, outcome: str) -> None:
+        self.jwt_verification[outcome].observe(seconds)
+
+        timings = current_timings.get()
+        if timings is not None:
+            timings.auth_seconds += seconds
+
+    def render(self) -> list[str]:
+        with self._lock:
+            routes = list(self.latency.items())
+            db_seconds = dict(self.db_seconds)
+            db_statements = dict(self.db_statements)
+            responses = dict(self.responses)
+
+        lines = ["# HELP http_requests_total Responses by route and status code.", "# TYPE http_requests_total counter"]
+        for (method, route, status_code), count in sorted(responses.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status_code)} {count}")
+
+        for name, help_text, histograms in (
+                ("http_request_duration_seconds", "Request latency by route.", dict(routes)),
+                ("http_request_db_seconds", "Time spent executing SQL per request.", db_seconds),
+                ("http_request_db_statements", "SQL statements executed per request.", db_statements),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for (method, route), histogram in sorted(histograms.items()):
+                lines += _histogram_lines(name, {"method": method, "route": route}, histogram.snapshot())
+
+        lines += ["# HELP jwt_verification_seconds Access token verification time.",
+                  "# TYPE jwt_verification_seconds histogram"]
+        for cache, histogram in self.jwt_verification.items():
+            lines += _histogram_lines("jwt_verification_seconds", {"cache": cache}, histogram.snapshot())
+
+        return lines
+
+
+request_metrics = RequestMetrics()
+
+
+def _before_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool,
+) -> None:
+    context._metrics_start = perf_counter()
+
+
+def _after_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool,
+) -> None:
+    timings = current_timings.get()
+    if timings is not None:
+        timings.db_statements += 1
+        timings.db_seconds += perf_counter() - context._metrics_start
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """Attribute SQL statement count and execution time to the request being served."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, labels: Mapping[str, str], snapshot: Mapping[str, Any]) -> list[str]:
+    lines = [f"{name}_bucket{_labels(**labels, le=le)} {count}" for le, count in snapshot["buckets"].items()]
+    lines.append(f"{name}_sum{_labels(**labels)} {snapshot['sum']}")
+    lines.append(f"{name}_count{_labels(**labels)} {snapshot['count']}")
+    return lines
+
+
+def render_prometheus(
+        metrics: RequestMetrics,
+        pool: Mapping[str, Any],
+        extra: Iterable[tuple[str, str, str, float]] = (),
+) -> str:
+    """Prometheus text exposition of request metrics, pool status and extra ``(name, type, help, value)`` samples."""
+    lines = metrics.render()
+
+    samples = [(f"db_pool_{key}", "gauge", f"Connection pool {key.replace('_', ' ')}.", pool[key])
+               for key in ("size", "checked_in", "checked_out", "overflow", "waiting")]
+    samples.append(("db_pool_timeouts_total", "counter", "Connection checkouts that timed out.", pool["timeouts"]))
+
+    for name, kind, help_text, value in (*samples, *extra):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+
+    lines += ["# HELP db_pool_wait_seconds Connection checkout wait time.", "# TYPE db_pool_wait_seconds histogram"]
+    lines += _histogram_lines("db_pool_wait_seconds", {}, pool["wait_seconds"])
+
+    return "\n".join(lines) + "\n"
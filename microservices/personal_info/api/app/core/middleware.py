@@ -0,0 +1,45 @@
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import RequestMetrics, RequestTimings, current_timings, request_metrics
+
+
+class MetricsMiddleware:
+    """Record latency, SQL statement count and DB time for every HTTP request.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware`` to keep the per-request cost to a
+    few histogram updates. With ``SERVER_TIMING_ENABLED`` the same breakdown is
+    sent back in a ``Server-Timing`` header.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings(start=perf_counter(), scope=scope)
+        token = current_timings.set(timings)
+        status_code = 500
+
+        async def send_with_timings(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    MutableHeaders(scope=message).append("Server-Timing", timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            current_timings.reset(token)
+            self.metrics.observe_request(
+                scope["method"], timings.route, status_code, perf_counter() - timings.start, timings
+            )
@@ -0,0 +1,134 @@
+import base64
+import binascii
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Generic, TypeVar
+
+from fastapi import HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.serialization import trusted_json
+
+T = TypeVar("T")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+STREAM_BATCH_SIZE = 500
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+
+class PageParams:
+    def __init__(
+            self,
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of items"),
+            after: str | None = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    ) -> None:
+        self.limit = limit
+        self.after = after
+        # Decoded once, here, so a malformed cursor is a 400 whatever path the request takes.
+        self.cursor = None if after is None else decode_cursor(after)
+
+    def key_value(self, key: InstrumentedAttribute[Any]) -> Any:
+        """The cursor's value for the keyset column ``key``; None without a cursor."""
+        if self.cursor is None:
+            return None
+
+        value = self.cursor.get(key.key)
+        # Compared with the key column, so it must decode to the column's type (bool is an int, but not an id).
+        if isinstance(value, bool) or not isinstance(value, key.type.python_type):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+        return value
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.") from e
+
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+
+    return values
+
+
+def after_cursor(stmt: Select[Any], key: InstrumentedAttribute[Any], after: Any) -> Select[Any]:
+    """Keyset filter: rows strictly after the ``key`` value ``after``, ordered by ``key``."""
+    if after is not None:
+        stmt = stmt.where(key > after)
+
+    return stmt.order_by(key)
+
+
+async def paginate(
+        db: AsyncSession,
+        stmt: Select[Any],
+        key: InstrumentedAttribute[Any],
+        params: PageParams,
+) -> dict[str, Any]:
+    """Run ``stmt`` as one keyset page ordered by the unique column ``key``.
+
+    One extra row is fetched to know whether another page exists without a COUNT.
+    The result matches the ``Page`` schema.
+    """
+    stmt = after_cursor(stmt, key, params.key_value(key)).limit(params.limit + 1)
+    items = list((await db.scalars(stmt)).all())
+
+    next_cursor = None
+    if len(items) > params.limit:
+        items = items[:params.limit]
+        next_cursor = encode_cursor({key.key: getattr(items[-1], key.key)})
+
+    return {"items": items, "next_cursor": next_cursor}
+
+
+async def ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines without holding more than one line and one chunk in memory."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+
+    if pending:
+        yield pending
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def stream_ndjson(
+        session_factory: async_sessionmaker[AsyncSession],
+        stmt: Select[Any],
+        schema: type[BaseModel],
+) -> StreamingResponse:
+    """Stream ``stmt`` rows as newline-delimited JSON through a server-side cursor.
+
+    The response body outlives request dependencies, so the rows are read on a
+    session owned by the generator rather than the one from ``get_db``.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        async with session_factory() as session:
+            result = await session.stream_scalars(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+            async for partition in result.partitions():
+                yield b"".join(trusted_json(schema, item) + b"\n" for item in partition)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -1,6 +1,7 @@
+from typing import Annotated
+
 from fastapi import HTTPException, status, Path
 from fastapi.params import Depends
-from sqlalchemy.sql.annotation import Annotated
 
 from app.core.auth import get_token_payload
 
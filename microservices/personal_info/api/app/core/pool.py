@@ -0,0 +1,103 @@
+import math
+import time
+from collections.abc import Callable
+from typing import Any, cast
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+from sqlalchemy.util.queue import AsyncAdaptedQueue
+
+from app.core.metrics import Histogram
+
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Time constant of the recent wait average; it fades towards 0 while nobody checks out a connection.
+RECENT_WAIT_DECAY_SECONDS = 1.0
+RECENT_WAIT_WEIGHT = 0.2
+
+
+class _TimedQueue(AsyncAdaptedQueue[ConnectionPoolEntry]):
+    """Idle connections of a pool, reporting how long each checkout was blocked on them."""
+
+    def __init__(self, maxsize: int = 0, use_lifo: bool = False) -> None:
+        super().__init__(maxsize, use_lifo)
+        self.waiting = 0
+        self.on_wait: Callable[[float], None] = lambda seconds: None
+
+    def get(self, block: bool = True, timeout: float | None = None) -> ConnectionPoolEntry:
+        if not block:
+            # The pool still has room, so the caller never queues: it takes or opens a connection.
+            self.on_wait(0.0)
+            return super().get(block, timeout)
+
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.waiting -= 1
+            self.on_wait(time.perf_counter() - start)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records how long callers wait for a connection.
+
+    Only the time blocked on the full pool counts, not opening or pre-pinging a
+    connection, so the numbers reflect pool pressure rather than database latency.
+    """
+
+    _queue_class = _TimedQueue
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_seconds = Histogram(POOL_WAIT_BUCKETS)
+        self.timeouts = 0
+        self._recent_wait = 0.0
+        self._recent_at = time.perf_counter()
+        self._idle = cast(_TimedQueue, self._pool)
+        self._idle.on_wait = self._observe_wait
+
+    @property
+    def waiting(self) -> int:
+        """Callers blocked until a connection is returned."""
+        return self._idle.waiting
+
+    def connect(self) -> PoolProxiedConnection:
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def _observe_wait(self, seconds: float) -> None:
+        now = time.perf_counter()
+        self.wait_seconds.observe(seconds)
+        recent = self.recent_wait(now)
+        self._recent_wait = recent + (seconds - recent) * RECENT_WAIT_WEIGHT
+        self._recent_at = now
+
+    def recent_wait(self, now: float | None = None) -> float:
+        """Exponentially weighted checkout wait of the latest callers, in seconds."""
+        now = time.perf_counter() if now is None else now
+        return self._recent_wait * math.exp(-(now - self._recent_at) / RECENT_WAIT_DECAY_SECONDS)
+
+    @property
+    def capacity(self) -> int:
+        return self.size() + max(self._max_overflow, 0)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "max_overflow": self._max_overflow,
+            "waiting": self.waiting,
+            "timeouts": self.timeouts,
+            "wait_seconds": self.wait_seconds.snapshot(),
+        }
+
+
+def instrumented_pool(engine: AsyncEngine) -> InstrumentedAsyncQueuePool:
+    """The pool of an engine built by ``app.core.database``, which always uses this pool class."""
+    return cast(InstrumentedAsyncQueuePool, engine.sync_engine.pool)
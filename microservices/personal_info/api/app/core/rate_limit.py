@@ -0,0 +1,132 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+
+from app.core.auth import get_optional_user_id
+from app.core.config import settings
+from app.core.metrics import UNMATCHED_ROUTE
+
+
+@dataclass(frozen=True, slots=True)
+class Limit:
+    """Token bucket refilled at ``rate`` tokens per second, holding at most ``burst``."""
+
+    rate: float
+    burst: int
+
+    @classmethod
+    def parse(cls, spec: str) -> "Limit":
+        """``"120/60"``: 120 requests per 60 seconds, all of which may arrive at once."""
+        requests, _, seconds = spec.strip().partition("/")
+        try:
+            limit = cls(rate=int(requests) / float(seconds), burst=int(requests))
+        except (ValueError, ZeroDivisionError):
+            raise ValueError(f"Invalid rate limit {spec!r}, expected 'requests/seconds'.") from None
+        if limit.rate <= 0:
+            raise ValueError(f"Invalid rate limit {spec!r}, expected 'requests/seconds'.")
+        return limit
+
+
+def parse_route_limits(spec: str) -> dict[str, Limit]:
+    """``"POST /social-links/=120/60,..."`` as route key -> limit."""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        route, _, limit = item.rpartition("=")
+        limits[" ".join(route.split())] = Limit.parse(limit)
+    return limits
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    async def acquire(self, key: str, limit: Limit, cost: int = 1) -> float:
+        """Take ``cost`` tokens from ``key``'s bucket: 0 on success, otherwise seconds until they are available."""
+
+
+class NullRateLimiter(RateLimiter):
+    async def acquire(self, key: str, limit: Limit, cost: int = 1) -> float:
+        return 0.0
+
+
+class MemoryRateLimiter(RateLimiter):
+    """Buckets of this process; with several workers each one enforces the limit on its own share of traffic."""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        # key -> (tokens, monotonic time of that count, time the bucket is full again)
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+
+    async def acquire(self, key: str, limit: Limit, cost: int = 1) -> float:
+        now = time.monotonic()
+        tokens, at, _ = self._buckets.get(key, (limit.burst, now, now))
+        tokens = min(limit.burst, tokens + (now - at) * limit.rate)
+
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / limit.rate
+
+        if key not in self._buckets and len(self._buckets) >= self.max_keys:
+            # Full buckets carry no state worth keeping.
+            self._buckets = {k: bucket for k, bucket in self._buckets.items() if bucket[2] > now}
+        self._buckets[key] = (tokens, now, now + (limit.burst - tokens) / limit.rate)
+        return wait
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RateLimiter:
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        from app.core.redis_rate_limit import RedisRateLimiter
+
+        return RedisRateLimiter.from_settings(settings)
+
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimiter()
+
+    return NullRateLimiter()
+
+
+@lru_cache(maxsize=1)
+def route_limits() -> tuple[Limit, dict[str, Limit]]:
+    return Limit.parse(settings.RATE_LIMIT_DEFAULT), parse_route_limits(settings.RATE_LIMIT_ROUTES)
+
+
+def rate_limit_key(route: str, caller: str) -> str:
+    return f"rate_limit:{route}:{caller}"
+
+
+async def enforce_rate_limit(request: Request, limiter: RateLimiter, cost: int = 1) -> None:
+    """Spend ``cost`` tokens of the caller's bucket for the matched route, or reject with 429.
+
+    A request costing more than a full bucket could never be admitted, so it is
+    rejected with 413 instead of being told to retry.
+    """
+    route = f"{request.method} {getattr(request.scope.get('route'), 'path', UNMATCHED_ROUTE)}"
+    default, overrides = route_limits()
+    limit = overrides.get(route, default)
+
+    user_id = get_optional_user_id(request)
+    caller = f"user:{user_id}" if user_id is not None else f"addr:{request.client.host if request.client else '-'}"
+
+    if cost > limit.burst:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Request exceeds the rate limit burst of {limit.burst}.",
+        )
+
+    wait = await limiter.acquire(rate_limit_key(route, caller), limit, cost)
+    if wait > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded.",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
+
+
+async def rate_limit(request: Request, limiter: Annotated[RateLimiter, Depends(get_rate_limiter)]) -> None:
+    await enforce_rate_limit(request, limiter)
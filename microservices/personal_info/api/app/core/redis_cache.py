@@ -0,0 +1,78 @@
+import logging
+from pathlib import Path
+from typing import cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.cache import CacheBackend
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def redis_client(settings: Settings) -> Redis:
+    password_file = Path(settings.REDIS_PASSWORD_FILE)
+    password = password_file.read_text().strip() if password_file.is_file() else None
+
+    return Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        password=password,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+
+
+class RedisCache(CacheBackend):
+    """Shared cache backend.
+
+    Redis failures are logged and treated as misses so an unavailable cache only
+    costs the database round trips it was saving.
+    """
+
+    def __init__(self, client: Redis) -> None:
+        self.client = client
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RedisCache":
+        return cls(redis_client(settings))
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            # Responses are not decoded, so values come back as bytes.
+            return cast(bytes | None, await self.client.get(key))
+        except RedisError:
+            logger.warning("Cache get failed for %s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            await self.client.set(key, value, ex=ttl)
+        except RedisError:
+            logger.warning("Cache set failed for %s", key, exc_info=True)
+
+    async def hget(self, key: str, field: str) -> bytes | None:
+        try:
+            return cast(bytes | None, await self.client.hget(key, field))
+        except RedisError:
+            logger.warning("Cache hget failed for %s", key, exc_info=True)
+            return None
+
+    async def hset(self, key: str, field: str, value: bytes, ttl: int) -> None:
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, field, value)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Cache hset failed for %s", key, exc_info=True)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+
+        try:
+            await self.client.delete(*keys)
+        except RedisError:
+            logger.error("Cache invalidation failed for %s", keys, exc_info=True)
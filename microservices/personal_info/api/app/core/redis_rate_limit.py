@@ -0,0 +1,54 @@
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import Settings
+from app.core.rate_limit import Limit, RateLimiter
+from app.core.redis_cache import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Refill and spend in one step on the server's clock, so every worker shares one bucket per key.
+# The wait is returned as a string because Lua numbers are truncated to integers in replies.
+TOKEN_BUCKET = """
+local rate, burst, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'at')
+local tokens = tonumber(bucket[1]) or burst
+local at = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - at) * rate)
+local wait = 0
+if tokens >= cost then
+  tokens = tokens - cost
+else
+  wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """Buckets shared by all workers and instances.
+
+    Redis failures are logged and the request is let through: an unavailable
+    limiter must not take the API down with it.
+    """
+
+    def __init__(self, client: Redis) -> None:
+        self.client = client
+        self.script = client.register_script(TOKEN_BUCKET)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RedisRateLimiter":
+        return cls(redis_client(settings))
+
+    async def acquire(self, key: str, limit: Limit, cost: int = 1) -> float:
+        try:
+            return float(await self.script(keys=[key], args=[limit.rate, limit.burst, cost]))
+        except RedisError:
+            logger.warning("Rate limit check failed for %s", key, exc_info=True)
+            return 0.0
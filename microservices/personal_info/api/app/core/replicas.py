@@ -0,0 +1,139 @@
+import asyncio
+import itertools
+import logging
+import math
+import time
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.core.cache import CacheBackend, recent_write_cache_key
+from app.core.pool import instrumented_pool
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica is behind the primary; 0 once it has replayed everything it
+# received, so an idle primary does not make its replicas look stale.
+LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+ReplicaSelection = Literal["round_robin", "least_connections"]
+
+# Session.info key naming the replica a session reads from.
+REPLICA_INFO_KEY = "replica"
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.session_factory = async_sessionmaker(engine, expire_on_commit=False, info={REPLICA_INFO_KEY: name})
+        # Out of rotation until the first lag check succeeds.
+        self.healthy = False
+        self.lag: float | None = None
+        self.error: str | None = None
+
+    @property
+    def connections(self) -> int:
+        return instrumented_pool(self.engine).checkedout()
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "error": self.error,
+            "pool": instrumented_pool(self.engine).stats(),
+        }
+
+
+class ReplicaSet:
+    """Read replicas in rotation, plus the users who wrote recently and must read from the primary.
+
+    Lag is checked in the background at most every ``check_interval`` seconds,
+    triggered by ``pick``; a replica further behind than ``max_lag`` (or failing
+    the check) leaves the rotation until a later check finds it caught up.
+    """
+
+    def __init__(
+            self,
+            replicas: list[Replica],
+            selection: ReplicaSelection,
+            max_lag: float,
+            check_interval: float,
+            read_your_writes_window: float,
+    ) -> None:
+        self.replicas = replicas
+        self.selection = selection
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.window = read_your_writes_window
+        self.checked_at: float | None = None
+        self._check: asyncio.Task | None = None
+        self._turn = itertools.count()
+        # user id -> monotonic deadline of this worker's read-your-writes window.
+        self._writes: dict[int, float] = {}
+
+    def pick(self) -> Replica | None:
+        """A replica for the next read, or None when none is fit to serve it."""
+        self._schedule_check()
+
+        available = [replica for replica in self.replicas if replica.healthy]
+        if not available:
+            return None
+        if self.selection == "least_connections":
+            return min(available, key=lambda replica: replica.connections)
+        return available[next(self._turn) % len(available)]
+
+    def _schedule_check(self) -> None:
+        if self._check is not None and not self._check.done():
+            return
+        if self.checked_at is not None and time.monotonic() - self.checked_at < self.check_interval:
+            return
+
+        self._check = asyncio.create_task(self.check_lag())
+
+    async def check_lag(self) -> None:
+        self.checked_at = time.monotonic()
+        await asyncio.gather(*(self._check_replica(replica) for replica in self.replicas))
+
+    async def _check_replica(self, replica: Replica) -> None:
+        lag: float | None = None
+        try:
+            async with replica.engine.connect() as conn:
+                lag = float(await asyncio.wait_for(conn.scalar(LAG_QUERY), timeout=self.check_interval))
+        except Exception as e:
+            healthy, replica.error = False, f"{e.__class__.__name__}: {e}"
+        else:
+            healthy, replica.error = lag <= self.max_lag, None
+
+        if healthy != replica.healthy:
+            logger.warning(
+                "Replica %s %s rotation (lag %s s, error %s)", replica.name, "joins" if healthy else "leaves",
+                lag, replica.error,
+            )
+        replica.healthy, replica.lag = healthy, lag
+
+    async def record_write(self, user_id: int, cache: CacheBackend) -> None:
+        """Route ``user_id``'s reads to the primary for the next ``window`` seconds.
+
+        The shared cache carries the mark to the other workers; the local copy keeps
+        it working without one.
+        """
+        now = time.monotonic()
+        if len(self._writes) > 10_000:
+            self._writes = {user: deadline for user, deadline in self._writes.items() if deadline > now}
+        self._writes[user_id] = now + self.window
+        await cache.set(recent_write_cache_key(user_id), b"1", max(1, math.ceil(self.window)))
+
+    async def wrote_recently(self, user_id: int, cache: CacheBackend) -> bool:
+        deadline = self._writes.get(user_id)
+        if deadline is not None and deadline > time.monotonic():
+            return True
+        return await cache.get(recent_write_cache_key(user_id)) is not None
+
+    def stats(self) -> list[dict[str, object]]:
+        return [replica.stats() for replica in self.replicas]
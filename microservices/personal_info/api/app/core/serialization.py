@@ -0,0 +1,74 @@
+from collections.abc import Iterable, Mapping
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+FieldPlan = tuple[tuple[str, type[BaseModel] | None, bool], ...]
+
+
+def _nested_model(annotation: Any) -> tuple[type[BaseModel] | None, bool]:
+    """Return the nested schema of a field annotation and whether it is a list of it."""
+    origin = get_origin(annotation)
+
+    if origin in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        return _nested_model(args[0]) if len(args) == 1 else (None, False)
+
+    if origin is list:
+        nested, _ = _nested_model(get_args(annotation)[0])
+        return nested, True
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+
+    return None, False
+
+
+@cache
+def _plan(schema: type[BaseModel]) -> FieldPlan:
+    return tuple((name, *_nested_model(field.annotation)) for name, field in schema.model_fields.items())
+
+
+def trusted_dump(schema: type[BaseModel], obj: Any) -> dict[str, Any]:
+    """Shape ``obj`` like ``schema`` without validating it.
+
+    Only for data read back from our own database, which was validated on the way
+    in: values are copied as stored (URLs stay strings) and nested schemas are
+    followed through lists and optionals. Accepts ORM objects, rows and mappings.
+    """
+    is_mapping = isinstance(obj, Mapping)
+    data: dict[str, Any] = {}
+
+    for name, nested, many in _plan(schema):
+        value = obj[name] if is_mapping else getattr(obj, name)
+        if nested is not None and value is not None:
+            value = [trusted_dump(nested, item) for item in value] if many else trusted_dump(nested, value)
+        data[name] = value
+
+    return data
+
+
+def trusted_dump_many(schema: type[BaseModel], objs: Iterable[Any]) -> list[dict[str, Any]]:
+    return [trusted_dump(schema, obj) for obj in objs]
+
+
+def trusted_json(schema: type[BaseModel], obj: Any) -> bytes:
+    return orjson.dumps(trusted_dump(schema, obj))
+
+
+def trusted_response(
+        schema: type[BaseModel],
+        obj: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+) -> ORJSONResponse:
+    """Response that bypasses FastAPI's ``response_model`` re-validation.
+
+    Keep ``response_model`` on the route for the OpenAPI schema.
+    """
+    content = trusted_dump_many(schema, obj) if isinstance(obj, list) else trusted_dump(schema, obj)
+    return ORJSONResponse(content, status_code=status_code, headers=headers)
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Concurrent loads of the same key share one in-flight call.
+
+    The first caller (the leader) runs the load; callers arriving while it runs
+    await its result or its exception. Leaders await the load directly, so a
+    leader whose client goes away cancels it, and its waiters start over instead
+    of failing. Keys are grouped, and ``forget`` drops a group so that callers
+    arriving after a write do not join a load that may have read the old data.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, dict[Hashable, asyncio.Future[Any]]] = {}
+        # group -> [open watches, times forgotten while watched]
+        self._watched: dict[str, list[int]] = {}
+        self.loads = 0
+        self.coalesced = 0
+
+    async def do(self, group: str, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            flights = self._flights.setdefault(group, {})
+            task: asyncio.Future[T] | None = flights.get(key)
+
+            if task is None:
+                task = asyncio.ensure_future(load())
+                flights[key] = task
+                task.add_done_callback(partial(self._done, group, key))
+                self.loads += 1
+                return await task
+
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise
+                self._done(group, key, task)
+
+    def _done(self, group: str, key: Hashable, task: asyncio.Future[Any]) -> None:
+        flights = self._flights.get(group)
+        if flights is not None and flights.get(key) is task:
+            del flights[key]
+            if not flights:
+                del self._flights[group]
+
+    def forget(self, *groups: str) -> None:
+        for group in groups:
+            self._flights.pop(group, None)
+            watched = self._watched.get(group)
+            if watched is not None:
+                watched[1] += 1
+
+    @contextmanager
+    def watch(self, group: str) -> Iterator[Callable[[], bool]]:
+        """Yield a check telling whether ``group`` was forgotten since the watch opened.
+
+        A load checks it before storing its result, so a result that may predate
+        a write is not cached after the write's invalidation.
+        """
+        watched = self._watched.setdefault(group, [0, 0])
+        watched[0] += 1
+        generation = watched[1]
+        try:
+            yield lambda: watched[1] != generation
+        finally:
+            watched[0] -= 1
+            if not watched[0] and self._watched.get(group) is watched:
+                del self._watched[group]
+
+    def stats(self) -> dict[str, int]:
+        return {"in_flight": sum(map(len, self._flights.values())), "loads": self.loads, "coalesced": self.coalesced}
+
+
+read_flights = SingleFlight()
@@ -0,0 +1,138 @@
+import re
+from dataclasses import dataclass
+
+MAX_TERMS = 20
+
+_TOKEN = re.compile(r'\s*(?:(?P<open>\()|(?P<close>\))|"(?P<quoted>[^"]*)"|(?P<word>[^\s()"]+))')
+
+
+class SkillQueryError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Term:
+    skill: str
+
+
+@dataclass(frozen=True, slots=True)
+class AllOf:
+    operands: tuple["SkillQuery", ...]
+
+
+@dataclass(frozen=True, slots=True)
+class AnyOf:
+    operands: tuple["SkillQuery", ...]
+
+
+SkillQuery = Term | AllOf | AnyOf
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split into parentheses, AND/OR operators and skill terms.
+
+    Adjacent bare words form one multi-word skill (``machine learning``); quote a
+    skill to use ``and``/``or``/parentheses literally.
+    """
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    text = text.rstrip()
+
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise SkillQueryError("Unbalanced quotes.")
+        position = match.end()
+
+        if match["open"]:
+            tokens.append(("(", "("))
+        elif match["close"]:
+            tokens.append((")", ")"))
+        elif match["quoted"] is not None:
+            tokens.append(("term", match["quoted"]))
+        elif match["word"].upper() in ("AND", "OR"):
+            tokens.append((match["word"].upper(), match["word"]))
+        elif tokens and tokens[-1][0] == "word":
+            tokens[-1] = ("word", f"{tokens[-1][1]} {match['word']}")
+        else:
+            tokens.append(("word", match["word"]))
+
+    return [("term" if kind == "word" else kind, value) for kind, value in tokens]
+
+
+class _Parser:
+    def __init__(self, tokens: list[tuple[str, str]]) -> None:
+        self.tokens = tokens
+        self.position = 0
+        self.terms = 0
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def _take(self) -> tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> SkillQuery:
+        node = self._any_of()
+        if self._peek() is not None:
+            raise SkillQueryError(f"Unexpected {self.tokens[self.position][1]!r}.")
+        return node
+
+    def _any_of(self) -> SkillQuery:
+        operands = [self._all_of()]
+        while self._peek() == "OR":
+            self._take()
+            operands.append(self._all_of())
+        return _combine(AnyOf, operands)
+
+    def _all_of(self) -> SkillQuery:
+        operands = [self._operand()]
+        while self._peek() == "AND":
+            self._take()
+            operands.append(self._operand())
+        return _combine(AllOf, operands)
+
+    def _operand(self) -> SkillQuery:
+        kind = self._peek()
+        if kind is None:
+            raise SkillQueryError("Expected a skill.")
+
+        _, value = self._take()
+        if kind == "(":
+            node = self._any_of()
+            if self._peek() != ")":
+                raise SkillQueryError("Missing closing parenthesis.")
+            self._take()
+            return node
+
+        if kind != "term" or not value.strip():
+            raise SkillQueryError(f"Expected a skill, got {value!r}.")
+
+        self.terms += 1
+        if self.terms > MAX_TERMS:
+            raise SkillQueryError(f"At most {MAX_TERMS} skills per query.")
+        return Term(" ".join(value.split()))
+
+
+def _combine(kind: type[AllOf] | type[AnyOf], operands: list[SkillQuery]) -> SkillQuery:
+    """Flatten nested operators of the same kind and drop duplicates; a single operand stands alone."""
+    flat: list[SkillQuery] = []
+    for operand in operands:
+        for item in operand.operands if isinstance(operand, kind) else (operand,):
+            if item not in flat:
+                flat.append(item)
+
+    return flat[0] if len(flat) == 1 else kind(tuple(flat))
+
+
+def parse_skill_query(text: str) -> SkillQuery:
+    """Parse ``python AND (fastapi OR django)``; AND binds tighter than OR, operators are case-insensitive."""
+    return _Parser(_tokenize(text)).parse()
+
+
+def skill_terms(query: SkillQuery) -> list[str]:
+    if isinstance(query, Term):
+        return [query.skill]
+    return [skill for operand in query.operands for skill in skill_terms(operand)]
@@ -0,0 +1,175 @@
+import asyncio
+import contextvars
+import datetime as dt
+import logging
+import random
+import re
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import UNMATCHED_ROUTE, current_timings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER_LIST = re.compile(r"\((?:\s*(?:\$\d+|\?|%\(\w+\)s|:\w+)\s*,)+\s*(?:\$\d+|\?|%\(\w+\)s|:\w+)\s*\)")
+_VALUES_ROWS = re.compile(r"(VALUES \(\.\.\.\))(?:, \(\.\.\.\))+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+_READ_ONLY = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_LOCKING = re.compile(r"\bFOR\s+(UPDATE|SHARE|NO\s+KEY\s+UPDATE|KEY\s+SHARE)\b", re.IGNORECASE)
+
+SKIP_OPTION = "slow_query_log"
+
+
+def normalize_sql(statement: str) -> str:
+    """Statement shape shared by every execution: literals, placeholder lists and extra VALUES rows collapsed."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PARAMETER_LIST.sub("(...)", normalized)
+    return _VALUES_ROWS.sub(r"\1, ...", normalized)
+
+
+def explain_options(statement: str) -> str:
+    """Only a plain SELECT is run again under ``ANALYZE``.
+
+    Writes, CTEs (which may modify data) and locking reads only get their
+    estimated plan, without executing.
+    """
+    if _READ_ONLY.match(statement) is not None and _LOCKING.search(statement) is None:
+        return "ANALYZE, BUFFERS, FORMAT JSON"
+    return "FORMAT JSON"
+
+
+def redact(parameters: Any) -> Any:
+    """Keep only the type and size of bound values; they may hold personal data."""
+    if isinstance(parameters, Mapping):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, (str, bytes)):
+        return [redact(value) for value in parameters]
+    if parameters is None:
+        return None
+    if isinstance(parameters, (str, bytes)):
+        return f"<{type(parameters).__name__}:{len(parameters)}>"
+    return f"<{type(parameters).__name__}>"
+
+
+@dataclass(slots=True)
+class SlowQuery:
+    at: dt.datetime
+    route: str
+    duration_ms: float
+    statement: str
+    parameters: Any
+    plan: Any = None
+
+
+class SlowQueryLog:
+    """Log statements slower than ``threshold_ms`` and keep the latest in a bounded buffer.
+
+    A sampled fraction of slow statements is explained on a separate pooled
+    connection, one at a time, and the plan is attached to the buffered entry.
+    Plain SELECTs are re-run under ``EXPLAIN (ANALYZE, BUFFERS)``; nothing else
+    is executed again, see ``explain_options``.
+    """
+
+    def __init__(
+            self,
+            threshold_ms: float | None,
+            explain_sample_rate: float = 0.0,
+            explain_timeout_ms: int = 5000,
+            size: int = 200,
+    ) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_timeout_ms = explain_timeout_ms
+        self.entries: deque[SlowQuery] = deque(maxlen=size)
+        self._explaining: asyncio.Task | None = None
+
+    def install(self, engine: Engine) -> None:
+        if not event.contains(engine, "after_cursor_execute", self._after_cursor_execute):
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [asdict(entry) for entry in reversed(self.entries)]
+
+    def _before_cursor_execute(
+            self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool,
+    ) -> None:
+        context._slow_query_start = perf_counter()
+
+    def _after_cursor_execute(
+            self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool,
+    ) -> None:
+        duration_ms = (perf_counter() - context._slow_query_start) * 1e3
+        if self.threshold_ms is None or duration_ms < self.threshold_ms:
+            return
+        if not context.execution_options.get(SKIP_OPTION, True):
+            return
+
+        timings = current_timings.get()
+        entry = SlowQuery(
+            at=dt.datetime.now(dt.UTC),
+            route=timings.route if timings is not None else UNMATCHED_ROUTE,
+            duration_ms=round(duration_ms, 3),
+            statement=normalize_sql(statement),
+            parameters=redact(parameters),
+        )
+        self.entries.append(entry)
+        logger.warning(
+            "Slow query %.1fms on %s: %s parameters=%s", entry.duration_ms, entry.route, entry.statement,
+            entry.parameters,
+        )
+
+        if self._should_explain(conn.engine, statement, executemany):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            # A fresh context, so the EXPLAIN is not counted in the request's metrics or logged under its route.
+            self._explaining = loop.create_task(
+                self._explain(AsyncEngine(conn.engine), statement, parameters, entry), context=contextvars.Context()
+            )
+
+    def _should_explain(self, engine: Engine, statement: str, executemany: bool) -> bool:
+        return (
+            engine.dialect.name == "postgresql"
+            and not executemany
+            and _EXPLAINABLE.match(statement) is not None
+            and (self._explaining is None or self._explaining.done())
+            and random.random() < self.explain_sample_rate
+        )
+
+    async def _explain(self, engine: AsyncEngine, statement: str, parameters: Any, entry: SlowQuery) -> None:
+        try:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(**{SKIP_OPTION: False})
+                await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}")
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN ({explain_options(statement)}) {statement}", parameters
+                )
+                plan = result.scalar_one()
+                entry.plan = orjson.loads(plan) if isinstance(plan, (str, bytes)) else plan
+                await conn.rollback()
+        except Exception:
+            logger.warning("EXPLAIN failed for slow query on %s", entry.route, exc_info=True)
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    explain_timeout_ms=settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS,
+    size=settings.SLOW_QUERY_BUFFER_SIZE,
+)
@@ -0,0 +1,74 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from app.schemas.user import AccessTokenPayload
+
+
+class TokenCache:
+    """Bounded LRU cache of already verified access tokens.
+
+    Entries are keyed by the SHA-256 digest of the raw token, so the cache never
+    keeps bearer tokens in memory, and are dropped once their ``exp`` has passed.
+    All operations are synchronous and guarded by a lock, which makes the cache
+    safe to share between the event loop and threadpool dependencies.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, AccessTokenPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> AccessTokenPayload | None:
+        key = self._digest(token)
+
+        with self._lock:
+            payload = self._entries.get(key)
+
+            if payload is None:
+                self.misses += 1
+                return None
+
+            if payload.exp <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, token: str, payload: AccessTokenPayload) -> None:
+        if self.max_size <= 0 or payload.exp <= time.time():
+            return
+
+        key = self._digest(token)
+
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
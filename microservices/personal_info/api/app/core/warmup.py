@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import signal
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from types import FrameType
+from contextlib import AsyncExitStack
+from typing import Literal
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.auth import get_jwt_public_key
+from app.core.database import Database
+
+logger = logging.getLogger(__name__)
+
+ReadinessState = Literal["starting", "ready", "draining"]
+Prime = Callable[[AsyncSession], Awaitable[None]]
+
+
+class Readiness:
+    """Whether this worker should get traffic: only between a finished warm-up and the start of draining."""
+
+    def __init__(self) -> None:
+        self.state: ReadinessState = "starting"
+        self.error: str | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    def mark_ready(self) -> None:
+        if self.state == "starting":
+            self.state = "ready"
+
+    def drain(self) -> None:
+        self.state = "draining"
+
+
+readiness = Readiness()
+
+DRAIN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+def drain_on_signals(delay: float) -> Callable[[], None]:
+    """Put ``readiness.drain()`` in front of the server's SIGINT/SIGTERM handlers.
+
+    The server's handler, which stops accepting connections, runs ``delay``
+    seconds after the first signal, so /ready answers 503 to load balancers
+    while the worker still serves; a second signal passes straight through.
+    Must be called once the server has installed its handlers (uvicorn does so
+    before the lifespan starts). Returns a function restoring them.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return lambda: None
+
+    loop = asyncio.get_running_loop()
+    originals: dict[int, object] = {sig: signal.getsignal(sig) for sig in DRAIN_SIGNALS}
+    passed_through = False
+
+    def forward(sig: int, frame: FrameType | None) -> None:
+        nonlocal passed_through
+        original = originals[sig]
+        if callable(original):
+            passed_through = True
+            original(sig, frame)
+
+    def delayed(sig: int) -> None:
+        if not passed_through:
+            forward(sig, None)
+
+    def handle(sig: int, frame: FrameType | None) -> None:
+        first = readiness.state != "draining"
+        readiness.drain()
+        if first and delay > 0:
+            logger.info("Draining, closing in %.1f s", delay)
+            loop.call_soon_threadsafe(loop.call_later, delay, delayed, sig)
+        else:
+            forward(sig, frame)
+
+    for sig, original in originals.items():
+        if callable(original):
+            signal.signal(sig, handle)
+
+    def restore() -> None:
+        for sig, original in originals.items():
+            if callable(original) and signal.getsignal(sig) is handle:
+                signal.signal(sig, original)
+
+    return restore
+
+
+async def _warm_engine(engine: AsyncEngine, connections: int, prime: Prime) -> None:
+    """Check out ``connections`` at once so the pool really opens that many, and prime each of them."""
+    async with AsyncExitStack() as stack:
+        opened = await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(connections)))
+        for conn in opened:
+            # Prepared statements are cached per connection, so every one of them runs the hot statements.
+            async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+                await prime(session)
+
+
+async def warm_up(database: Database, connections: int, prime: Prime, retry_interval: float) -> None:
+    """Pre-parse the JWT key, then open and prime the pools; mark the worker ready once done.
+
+    Retries until the database answers, leaving the worker not-ready meanwhile.
+    """
+    get_jwt_public_key()
+
+    while readiness.state == "starting":
+        start = time.perf_counter()
+        try:
+            if database.replica_set is not None:
+                await database.replica_set.check_lag()
+            engines = [database.engine]
+            engines += [replica.engine for replica in database.replica_set.replicas] if database.replica_set else []
+            await asyncio.gather(*(_warm_engine(engine, connections, prime) for engine in engines))
+        except Exception as e:
+            readiness.error = f"{e.__class__.__name__}: {e}"
+            logger.warning("Warm-up failed, retrying in %.1f s: %s", retry_interval, readiness.error)
+            await asyncio.sleep(retry_interval)
+            continue
+
+        readiness.error = None
+        readiness.mark_ready()
+        logger.info("Warm-up finished in %.3f s", time.perf_counter() - start)
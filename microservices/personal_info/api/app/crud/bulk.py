@@ -0,0 +1,40 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Row, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.base import Base
+
+# PostgreSQL accepts at most 32767 bind parameters per statement.
+MAX_BIND_PARAMS = 32767
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+async def bulk_insert_returning(
+        db: AsyncSession,
+        model: type[Base],
+        rows: Sequence[Mapping[str, Any]],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+) -> list[Row[Any]]:
+    """Insert ``rows`` with multi-row ``INSERT ... RETURNING`` statements.
+
+    Rows are sent in chunks small enough to stay under the bind parameter limit and
+    every chunk runs in the caller's transaction, so committing or rolling back is
+    left to the caller. Returned rows expose all table columns as attributes.
+    """
+    if not rows:
+        return []
+
+    table = model.__table__
+    params_per_row = len(table.columns)
+    chunk_size = max(1, min(chunk_size, MAX_BIND_PARAMS // params_per_row))
+
+    created: list[Row[Any]] = []
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        result = await db.execute(insert(table).values(list(chunk)).returning(*table.columns))
+        created.extend(result.all())
+
+    return created
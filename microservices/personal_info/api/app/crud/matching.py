@@ -0,0 +1,200 @@
+import asyncio
+import datetime as dt
+import logging
+from typing import Any
+
+from sqlalchemy import Row, delete, func, insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import load_only, selectinload
+from starlette.concurrency import run_in_threadpool
+
+from app.core.change_feed import ResumeChange, Subscriber
+from app.core.config import settings
+from app.core.matching import MatchIndex, from_bytes, resume_text, to_bytes, vectorize
+from app.models import Resume, ResumeVector
+
+logger = logging.getLogger(__name__)
+
+# now() is the transaction start time, so a row can commit with a timestamp older
+# than a watermark taken meanwhile; re-reading a window behind it catches those rows.
+SYNC_OVERLAP = dt.timedelta(seconds=60)
+# Transaction-level advisory lock electing the one worker that recomputes vectors per tick.
+REFRESH_LOCK_KEY = 0x6D61746368
+# Rankings retried after dropping resumes deleted since the index last saw them.
+MAX_RANK_ATTEMPTS = 3
+
+
+async def _lead_refresh(db: AsyncSession) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return True
+    return bool(await db.scalar(select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))))
+
+
+async def refresh_stale_vectors(dim: int, limit: int, db: AsyncSession) -> int:
+    """(Re)compute vectors of up to ``limit`` resumes changed since their vector was built.
+
+    Returns the number refreshed, 0 on workers that lost the advisory lock to the
+    worker doing it this tick. Stale resumes are looked up through the
+    ``updated_at`` index, from the newest vector's ``resume_updated_at`` less
+    ``SYNC_OVERLAP``; only the first build scans every resume.
+    """
+    if not await _lead_refresh(db):
+        await db.rollback()
+        return 0
+
+    watermark = await db.scalar(select(func.max(ResumeVector.resume_updated_at)).where(ResumeVector.dim == dim))
+    stmt = (
+        select(Resume.id)
+        .outerjoin(ResumeVector, ResumeVector.resume_id == Resume.id)
+        .where(or_(
+            ResumeVector.resume_id.is_(None),
+            ResumeVector.resume_updated_at < Resume.updated_at,
+            ResumeVector.dim != dim,
+        ))
+        .order_by(Resume.updated_at)
+        .limit(limit)
+    )
+    if watermark is not None:
+        stmt = stmt.where(Resume.updated_at > watermark - SYNC_OVERLAP)
+
+    resume_ids = list((await db.scalars(stmt)).all())
+    if not resume_ids:
+        await db.rollback()
+        return 0
+
+    loaded = await db.scalars(
+        select(Resume)
+        .options(
+            load_only(Resume.id, Resume.professional_title, Resume.summary, Resume.updated_at),
+            selectinload(Resume.experiences),
+            selectinload(Resume.projects),
+            selectinload(Resume.skills),
+        )
+        .where(Resume.id.in_(resume_ids))
+    )
+    resumes = loaded.all()
+    # Hashing many resumes is CPU-bound, so it runs off the event loop.
+    vectors = await run_in_threadpool(_vectorize_all, [resume_text(resume) for resume in resumes], dim)
+    rows = [
+        {"resume_id": resume.id, "dim": dim, "vector": vector, "resume_updated_at": resume.updated_at}
+        for resume, vector in zip(resumes, vectors, strict=True)
+    ]
+
+    try:
+        await db.execute(delete(ResumeVector).where(ResumeVector.resume_id.in_(resume_ids)))
+        await db.execute(insert(ResumeVector), rows)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return 0
+
+    return len(rows)
+
+
+def _vectorize_all(texts: list[str], dim: int) -> list[bytes]:
+    return [to_bytes(vectorize(text, dim)) for text in texts]
+
+
+async def sync_index(index: MatchIndex, db: AsyncSession) -> None:
+    """Load vectors written since the last sync, through the ``computed_at`` index.
+
+    Deleted resumes are dropped by ``prune_deleted`` and by ``match_resumes``.
+    """
+    stmt = select(ResumeVector.resume_id, ResumeVector.vector, ResumeVector.computed_at).where(
+        ResumeVector.dim == index.dim
+    )
+    full = index.watermark is None
+    if index.watermark is not None:
+        stmt = stmt.where(ResumeVector.computed_at >= index.watermark - SYNC_OVERLAP)
+
+    rows = (await db.execute(stmt)).all()
+    vectors = from_bytes((row.vector for row in rows), index.dim)
+    ids = [row.resume_id for row in rows]
+
+    if full:
+        index.replace(ids, vectors)
+    else:
+        index.upsert(ids, vectors)
+
+    if rows:
+        index.watermark = max(row.computed_at for row in rows)
+
+
+async def refresh_index(index: MatchIndex, batch_size: int, db: AsyncSession) -> int:
+    """Recompute up to ``batch_size`` stale vectors, then load new ones into ``index``.
+
+    Returns the number recomputed.
+    """
+    refreshed = await refresh_stale_vectors(index.dim, batch_size, db)
+    await sync_index(index, db)
+    return refreshed
+
+
+async def keep_index_fresh(
+        index: MatchIndex,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int,
+        interval: float,
+) -> None:
+    """Run ``refresh_index`` every ``interval`` seconds until cancelled.
+
+    One bounded batch per tick, so a large backlog of changed resumes is worked
+    off over several ticks instead of holding a connection for all of it. Every
+    worker reloads the vectors; only one of them recomputes them per tick.
+    """
+    while True:
+        try:
+            async with session_factory() as db:
+                await refresh_index(index, batch_size, db)
+        except Exception as e:
+            logger.warning("Match index refresh failed: %s: %s", e.__class__.__name__, e)
+        await asyncio.sleep(interval)
+
+
+def prune_deleted(index: MatchIndex) -> Subscriber:
+    """Change feed subscriber removing deleted resumes from ``index``."""
+
+    async def prune(change: ResumeChange) -> None:
+        if change.table == "resumes" and change.op == "DELETE":
+            index.remove([change.resume_id])
+
+    return prune
+
+
+async def match_resumes(job_description: str, top_k: int, index: MatchIndex, db: AsyncSession) -> list[dict[str, Any]]:
+    """Top ``top_k`` resumes by cosine similarity of their vectors to the job description's.
+
+    ``keep_index_fresh`` keeps ``index`` up to date in the background. Ranked
+    resumes that no longer exist, e.g. deleted while the change feed was
+    disconnected, are removed from it and the ranking is retried, so up to
+    ``top_k`` live resumes are returned.
+    """
+    query = await run_in_threadpool(vectorize, job_description, index.dim)
+    if not query.any():
+        return []
+
+    ranked: list[tuple[int, float]] = []
+    resumes: dict[int, Row] = {}
+    for _ in range(MAX_RANK_ATTEMPTS):
+        ranked = await run_in_threadpool(index.top_k, query, top_k, settings.MATCH_SCORE_BATCH_SIZE)
+        unseen = [resume_id for resume_id, _ in ranked if resume_id not in resumes]
+        if unseen:
+            resumes.update(
+                (row.id, row)
+                for row in await db.execute(
+                    select(Resume.id, Resume.user_id, Resume.professional_title, Resume.location)
+                    .where(Resume.id.in_(unseen))
+                )
+            )
+
+        deleted = [resume_id for resume_id in unseen if resume_id not in resumes]
+        if not deleted:
+            break
+        index.remove(deleted)
+
+    return [
+        {**resumes[resume_id]._mapping, "score": round(score, 6)}
+        for resume_id, score in ranked
+        if resume_id in resumes
+    ]
@@ -0,0 +1,34 @@
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.base import Base
+
+
+async def update_owned(
+        db: AsyncSession,
+        model: type[Base],
+        id: int,
+        owner: ColumnElement[bool],
+        values: Mapping[str, Any],
+) -> Row[Any] | None:
+    """``UPDATE ... WHERE id = :id AND <owner> RETURNING *`` in one round trip.
+
+    ``owner`` restricts the row to the caller, e.g. ``SocialLink.user_id == user_id``,
+    so a row of someone else is indistinguishable from a missing one: both return
+    None. ``values`` must not be empty. Runs in the caller's transaction.
+    """
+    table = model.__table__
+    result = await db.execute(
+        update(table).where(table.c.id == id, owner).values(**values).returning(*table.columns)
+    )
+    return result.one_or_none()
+
+
+async def delete_owned(db: AsyncSession, model: type[Base], id: int, owner: ColumnElement[bool]) -> Row[Any] | None:
+    """``DELETE ... WHERE id = :id AND <owner> RETURNING *``; None when no row of the caller matched."""
+    table = model.__table__
+    result = await db.execute(delete(table).where(table.c.id == id, owner).returning(*table.columns))
+    return result.one_or_none()
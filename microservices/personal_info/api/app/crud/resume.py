@@ -1,9 +1,109 @@
-from sqlalchemy import select
+import datetime as dt
+from typing import Any, get_args
+
+from pydantic import AnyUrl
+from sqlalchemy import Row, Select, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.base import Base
+from app.models import Certificate, Education, Experience, Language, Project, Resume, Skill, SocialLink
+from app.schemas.resume import ResumeCreate, ResumeOut
+
+RESUME_SECTIONS = (
+    Resume.experiences,
+    Resume.education,
+    Resume.skills,
+    Resume.projects,
+    Resume.certificates,
+    Resume.social_links,
+    Resume.languages,
+)
+
+RESUME_FIELDS = tuple(ResumeCreate.model_fields)
+
+# Document field of ResumeOut -> section model.
+SECTIONS: dict[str, type[Base]] = {
+    "experiences": Experience,
+    "education": Education,
+    "skills": Skill,
+    "projects": Project,
+    "certificates": Certificate,
+    "social_links": SocialLink,
+    "languages": Language,
+}
+
+
+# Keys of a section row, assigned on insert rather than carried by a document.
+KEY_COLUMNS = frozenset({"id", "resume_id", "user_id"})
+
+
+def _section_columns(field_name: str) -> tuple[str, ...]:
+    """Columns of a section that the resume document carries: schema fields other than the id."""
+    (schema,) = get_args(ResumeOut.model_fields[field_name].annotation)
+    table = SECTIONS[field_name].__table__
+    return tuple(name for name in schema.model_fields if name != "id" and name in table.columns)
+
+
+SECTION_COLUMNS = {name: _section_columns(name) for name in SECTIONS}
+
+# Every stored column of a section other than its keys; an export must carry all of them.
+TRANSFER_COLUMNS = {
+    name: tuple(column.name for column in model.__table__.columns if column.name not in KEY_COLUMNS)
+    for name, model in SECTIONS.items()
+}
+
+
+def column_value(value: Any) -> Any:
+    """A schema value as it is stored: URLs are plain strings."""
+    return str(value) if isinstance(value, AnyUrl) else value
+
 
-from app.models import Resume
+def full_resume_stmt() -> Select[tuple[Resume]]:
+    """Resume with every section eagerly loaded: one SELECT for the resume plus one per section."""
+    return select(Resume).options(*(selectinload(section) for section in RESUME_SECTIONS))
 
 
 async def get_resume_by_user_id(user_id: int, db: AsyncSession) -> Resume | None:
     resume = await db.execute(select(Resume).where(Resume.user_id == user_id))
     return resume.scalars().first()
+
+
+async def get_resume_id_by_user_id(user_id: int, db: AsyncSession) -> int | None:
+    resume_id = await db.execute(select(Resume.id).where(Resume.user_id == user_id))
+    return resume_id.scalars().first()
+
+
+async def get_resume_version_by_id(resume_id: int, db: AsyncSession) -> Row[tuple[int, dt.datetime]] | None:
+    version = await db.execute(select(Resume.id, Resume.updated_at).where(Resume.id == resume_id))
+    return version.first()
+
+
+async def get_resume_version_by_user_id(user_id: int, db: AsyncSession) -> Row[tuple[int, dt.datetime]] | None:
+    version = await db.execute(select(Resume.id, Resume.updated_at).where(Resume.user_id == user_id))
+    return version.first()
+
+
+async def touch_resume(resume_id: int, db: AsyncSession) -> dt.datetime | None:
+    """Bump ``updated_at`` so every cached copy and ETag of the aggregate changes.
+
+    Writes to any resume section must call this in their transaction.
+    """
+    updated_at = await db.execute(
+        update(Resume)
+        .where(Resume.id == resume_id)
+        .values(updated_at=func.now())
+        .returning(Resume.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return updated_at.scalar_one_or_none()
+
+
+async def get_full_resume_by_id(resume_id: int, db: AsyncSession) -> Resume | None:
+    resume = await db.execute(full_resume_stmt().where(Resume.id == resume_id))
+    return resume.scalars().first()
+
+
+async def get_full_resume_by_user_id(user_id: int, db: AsyncSession) -> Resume | None:
+    resume = await db.execute(full_resume_stmt().where(Resume.user_id == user_id))
+    return resume.scalars().first()
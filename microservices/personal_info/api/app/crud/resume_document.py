@@ -0,0 +1,119 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.resume import RESUME_FIELDS, SECTION_COLUMNS, SECTIONS, column_value, full_resume_stmt, touch_resume
+from app.models import Resume, SocialLink
+from app.schemas.resume import ResumeReplace
+
+
+class ResumeDocumentError(ValueError):
+    pass
+
+
+@dataclass
+class SectionDiff:
+    inserts: list[dict[str, Any]] = field(default_factory=list)
+    updates: list[dict[str, Any]] = field(default_factory=list)
+    deletes: list[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.inserts or self.updates or self.deletes)
+
+
+def diff_section(name: str, stored: Sequence[Any], items: Sequence[Any]) -> SectionDiff:
+    """Rows to insert, update and delete to turn the ``stored`` rows of a section into ``items``.
+
+    Items with an id must name a stored row of the same resume; rows whose values
+    already match are left out so they are not written at all.
+    """
+    columns = SECTION_COLUMNS[name]
+    current = {row.id: row for row in stored}
+    kept: set[int] = set()
+    diff = SectionDiff()
+
+    for item in items:
+        values = {column: column_value(getattr(item, column)) for column in columns}
+        if item.id is None:
+            diff.inserts.append(values)
+            continue
+
+        if item.id in kept:
+            raise ResumeDocumentError(f"Duplicate {name} id {item.id}.")
+        row = current.get(item.id)
+        if row is None:
+            raise ResumeDocumentError(f"Unknown {name} id {item.id}.")
+        kept.add(item.id)
+
+        if any(getattr(row, column) != value for column, value in values.items()):
+            diff.updates.append({"id": item.id, **values})
+
+    diff.deletes = [row_id for row_id in current if row_id not in kept]
+    return diff
+
+
+async def lock_full_resume_by_user_id(user_id: int, db: AsyncSession) -> Resume | None:
+    """Full resume with its row locked, so concurrent writes to the aggregate wait for this transaction."""
+    resume = await db.execute(full_resume_stmt().where(Resume.user_id == user_id).with_for_update(of=Resume))
+    return resume.scalars().first()
+
+
+async def _apply_section(name: str, diff: SectionDiff, resume_id: int, user_id: int, db: AsyncSession) -> None:
+    """One DELETE, one executemany UPDATE and one multi-row INSERT at most, whatever the item count."""
+    model = SECTIONS[name]
+
+    if diff.deletes:
+        await db.execute(
+            delete(model)
+            .where(model.resume_id == resume_id, model.id.in_(diff.deletes))
+            .execution_options(synchronize_session=False)
+        )
+    if diff.updates:
+        await db.execute(update(model), diff.updates)
+    if diff.inserts:
+        owner = {"resume_id": resume_id, "user_id": user_id} if model is SocialLink else {"resume_id": resume_id}
+        await db.execute(insert(model), [{**row, **owner} for row in diff.inserts])
+
+
+async def replace_resume(resume: Resume, resume_in: ResumeReplace, db: AsyncSession) -> bool:
+    """Write the difference between the stored ``resume`` and the document; True when anything changed.
+
+    Runs in the caller's transaction. ``updated_at`` is bumped only when a row was
+    written, so re-saving an unchanged document keeps its ETag.
+    """
+    diffs = {name: diff_section(name, getattr(resume, name), getattr(resume_in, name)) for name in SECTIONS}
+    fields = {name: column_value(getattr(resume_in, name)) for name in RESUME_FIELDS}
+    changed = {name: value for name, value in fields.items() if getattr(resume, name) != value}
+
+    for name, diff in diffs.items():
+        if diff:
+            await _apply_section(name, diff, resume.id, resume.user_id, db)
+
+    if changed:
+        await db.execute(
+            update(Resume)
+            .where(Resume.id == resume.id)
+            .values(**changed, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+    elif any(diffs.values()):
+        await touch_resume(resume.id, db)
+
+    return bool(changed) or any(diffs.values())
+
+
+async def create_resume_document(resume_in: ResumeReplace, user_id: int, db: AsyncSession) -> int:
+    """Insert the resume and all of its sections in the caller's transaction; returns the new resume id."""
+    fields = {name: column_value(getattr(resume_in, name)) for name in RESUME_FIELDS}
+    inserted = await db.execute(insert(Resume).values(**fields, user_id=user_id).returning(Resume.id))
+    resume_id = inserted.scalar_one()
+
+    for name in SECTIONS:
+        diff = diff_section(name, (), getattr(resume_in, name))
+        if diff:
+            await _apply_section(name, diff, resume_id, user_id, db)
+
+    return resume_id
@@ -0,0 +1,118 @@
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, Select, and_, func, literal_column, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from app.core.pagination import PageParams, encode_cursor, paginate
+from app.core.skill_query import AllOf, SkillQuery, Term, skill_terms
+from app.models import Resume, SkillFacet
+
+# Must match the configuration used by resume_search_vector() in the search_vector migration.
+SEARCH_CONFIG: ColumnElement[Any] = literal_column("'english'::regconfig")
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=8"
+
+
+def search_resumes_stmt(q: str, limit: int, cursor: dict[str, Any] | None = None) -> Select[Any]:
+    """Keyset page of resumes matching the web-search style query ``q``, best match first.
+
+    Matching and ranking only touch ``search_vector`` (GIN-indexed); the costlier
+    highlights are computed for the rows of the page alone.
+    """
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Resume.search_vector, query).label("rank")
+
+    matches = select(Resume.id, rank).where(Resume.search_vector.bool_op("@@")(query))
+    if cursor is not None:
+        if not isinstance(cursor.get("rank"), (int, float)) or not isinstance(cursor.get("id"), int):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+        matches = matches.where(tuple_(rank, Resume.id) < tuple_(cursor["rank"], cursor["id"]))
+    page = matches.order_by(rank.desc(), Resume.id.desc()).limit(limit + 1).subquery()
+
+    return (
+        select(
+            Resume.id,
+            Resume.user_id,
+            Resume.professional_title,
+            Resume.location,
+            page.c.rank,
+            func.ts_headline(
+                SEARCH_CONFIG, func.coalesce(Resume.professional_title, ""), query, HEADLINE_OPTIONS
+            ).label("title_highlight"),
+            func.ts_headline(
+                SEARCH_CONFIG, func.coalesce(Resume.summary, ""), query, HEADLINE_OPTIONS
+            ).label("summary_highlight"),
+        )
+        .join(page, page.c.id == Resume.id)
+        .order_by(page.c.rank.desc(), Resume.id.desc())
+    )
+
+
+async def search_resumes(q: str, limit: int, cursor: dict[str, Any] | None, db: AsyncSession) -> dict[str, Any]:
+    hits = list((await db.execute(search_resumes_stmt(q, limit, cursor))).all())
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor({"rank": hits[-1].rank, "id": hits[-1].id})
+
+    return {"items": hits, "next_cursor": next_cursor}
+
+
+def _skill_tokens(skills: list[str]) -> ColumnElement[Any]:
+    return array([func.normalize_skill_token(skill) for skill in skills])
+
+
+def skill_filter(query: SkillQuery) -> ColumnElement[bool]:
+    """WHERE clause over ``resumes.skill_tokens``.
+
+    Sibling terms collapse into one GIN-indexable array operator: ``@>`` for
+    AND, ``&&`` for OR. Terms are normalized by the same SQL function as the
+    stored tokens.
+    """
+    if isinstance(query, Term):
+        return Resume.skill_tokens.contains(_skill_tokens([query.skill]))
+
+    terms = [operand.skill for operand in query.operands if isinstance(operand, Term)]
+    clauses = [skill_filter(operand) for operand in query.operands if not isinstance(operand, Term)]
+
+    if isinstance(query, AllOf):
+        return and_(Resume.skill_tokens.contains(_skill_tokens(terms)), *clauses) if terms else and_(*clauses)
+
+    return or_(Resume.skill_tokens.overlap(_skill_tokens(terms)), *clauses) if terms else or_(*clauses)
+
+
+def filter_resumes_by_skills_stmt(query: SkillQuery) -> Select[tuple[Resume]]:
+    return select(Resume).options(
+        load_only(Resume.id, Resume.user_id, Resume.professional_title, Resume.location, Resume.skill_tokens)
+    ).where(skill_filter(query))
+
+
+def skill_facets_stmt(query: SkillQuery, limit: int) -> Select[tuple[SkillFacet]]:
+    """The ``limit`` most common skills plus the ones in ``query``, read from the precomputed counts."""
+    top = (
+        select(SkillFacet.token)
+        .where(SkillFacet.resume_count > 0)
+        .order_by(SkillFacet.resume_count.desc(), SkillFacet.token)
+        .limit(limit)
+    )
+    requested = [func.normalize_skill_token(skill) for skill in skill_terms(query)]
+
+    return (
+        select(SkillFacet)
+        .where(or_(SkillFacet.token.in_(top.scalar_subquery()), SkillFacet.token.in_(requested)))
+        .order_by(SkillFacet.resume_count.desc(), SkillFacet.token)
+    )
+
+
+async def filter_resumes_by_skills(
+        query: SkillQuery,
+        page: PageParams,
+        facets: int,
+        db: AsyncSession,
+) -> dict[str, Any]:
+    result = await paginate(db, filter_resumes_by_skills_stmt(query), Resume.id, page)
+    result["facets"] = list((await db.scalars(skill_facets_stmt(query, facets))).all())
+    return result
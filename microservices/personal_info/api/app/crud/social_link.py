@@ -0,0 +1,104 @@
+import datetime as dt
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import Row, Select, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningDelete, ReturningUpdate
+
+from app.crud.owned import delete_owned, update_owned
+from app.models import Resume, SocialLink
+
+
+def social_links_stmt(user_id: int) -> Select[tuple[SocialLink]]:
+    return select(SocialLink).where(SocialLink.user_id == user_id)
+
+
+def _touch_link_resume_stmt(link_id: int, user_id: int) -> ReturningUpdate[tuple[int, dt.datetime]]:
+    return (
+        update(Resume)
+        .where(Resume.id == select(SocialLink.resume_id).where(
+            SocialLink.id == link_id, SocialLink.user_id == user_id
+        ).scalar_subquery())
+        .values(updated_at=func.now())
+        .returning(Resume.id, Resume.updated_at)
+    )
+
+
+async def touch_link_resume(link_id: int, user_id: int, db: AsyncSession) -> Row[tuple[int, dt.datetime]] | None:
+    """``touch_resume`` for the resume of ``user_id``'s link ``link_id``: its id and new ``updated_at``.
+
+    Run before writing the link, so the resume row is locked first, in the same
+    order as every other writer of the resume. None when the user has no such link.
+    """
+    touched = await db.execute(
+        _touch_link_resume_stmt(link_id, user_id).execution_options(synchronize_session=False)
+    )
+    return touched.first()
+
+
+def update_link_stmt(link_id: int, user_id: int, values: Mapping[str, Any]) -> ReturningUpdate[tuple[Any, ...]]:
+    """Touch the link's resume and update the link in one statement (PostgreSQL only).
+
+    The resume is updated in a CTE that the link update joins, so its row is
+    locked before the link's, as ``touch_link_resume`` does. Returns the link's
+    columns and the resume's new ``updated_at``.
+    """
+    touched = _touch_link_resume_stmt(link_id, user_id).cte("touched")
+    return (
+        update(SocialLink)
+        .where(SocialLink.id == link_id, SocialLink.user_id == user_id, SocialLink.resume_id == touched.c.id)
+        .values(**values)
+        .returning(*SocialLink.__table__.columns, touched.c.updated_at)
+    )
+
+
+def delete_link_stmt(link_id: int, user_id: int) -> ReturningDelete[tuple[Any, ...]]:
+    """``update_link_stmt`` for deleting the link."""
+    touched = _touch_link_resume_stmt(link_id, user_id).cte("touched")
+    return (
+        delete(SocialLink)
+        .where(SocialLink.id == link_id, SocialLink.user_id == user_id, SocialLink.resume_id == touched.c.id)
+        .returning(*SocialLink.__table__.columns)
+    )
+
+
+def _one_statement(db: AsyncSession) -> bool:
+    # SQLite, which the tests run on, only allows SELECT inside WITH.
+    return db.get_bind().dialect.name == "postgresql"
+
+
+async def update_link(
+        link_id: int, user_id: int, values: Mapping[str, Any], db: AsyncSession
+) -> tuple[Row[Any], dt.datetime] | None:
+    """Touch the resume of ``user_id``'s link and write ``values`` to the link: the link and the new version.
+
+    One round trip on PostgreSQL; elsewhere the resume is touched first, then the
+    link updated. None when the user has no such link.
+    """
+    if _one_statement(db):
+        result = await db.execute(
+            update_link_stmt(link_id, user_id, values).execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        return None if row is None else (row, row.updated_at)
+
+    touched = await touch_link_resume(link_id, user_id, db)
+    if touched is None:
+        return None
+
+    link = await update_owned(db, SocialLink, link_id, SocialLink.user_id == user_id, values)
+    return None if link is None else (link, touched.updated_at)
+
+
+async def delete_link(link_id: int, user_id: int, db: AsyncSession) -> Row[Any] | None:
+    """``update_link`` for deleting the link; returns the deleted row."""
+    if _one_statement(db):
+        result = await db.execute(delete_link_stmt(link_id, user_id).execution_options(synchronize_session=False))
+        link: Row[Any] | None = result.one_or_none()
+        return link
+
+    if await touch_link_resume(link_id, user_id, db) is None:
+        return None
+
+    return await delete_owned(db, SocialLink, link_id, SocialLink.user_id == user_id)
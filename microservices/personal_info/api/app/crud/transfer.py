@@ -0,0 +1,121 @@
+import datetime as dt
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.resume import RESUME_FIELDS, SECTIONS, TRANSFER_COLUMNS, column_value, full_resume_stmt
+from app.models import ImportCheckpoint, Resume, SocialLink
+from app.schemas.resume import ResumeExport
+
+RESUME_COLUMNS = ("user_id", *RESUME_FIELDS, "created_at", "updated_at")
+
+
+def export_stmt() -> Select[tuple[Resume]]:
+    return full_resume_stmt().order_by(Resume.id)
+
+
+def _record(obj: BaseModel, columns: tuple[str, ...]) -> tuple[Any, ...]:
+    return tuple(column_value(getattr(obj, column)) for column in columns)
+
+
+@dataclass
+class ImportBatch:
+    """Validated resumes as COPY records, keyed by the resume id of the export."""
+
+    lines: int = 0
+    resumes: list[tuple[Any, ...]] = field(default_factory=list)
+    sections: dict[str, list[tuple[Any, ...]]] = field(default_factory=lambda: {name: [] for name in SECTIONS})
+
+    def __len__(self) -> int:
+        return len(self.resumes)
+
+    def add(self, resume: ResumeExport) -> None:
+        self.resumes.append((resume.id, *_record(resume, RESUME_COLUMNS)))
+        for name, columns in TRANSFER_COLUMNS.items():
+            self.sections[name].extend((resume.id, *_record(item, columns)) for item in getattr(resume, name))
+
+
+async def get_or_create_checkpoint(import_id: str, db: AsyncSession) -> ImportCheckpoint:
+    checkpoint = await db.get(ImportCheckpoint, import_id)
+    if checkpoint is None:
+        checkpoint = ImportCheckpoint(import_id=import_id, lines=0, resumes_imported=0, resumes_skipped=0)
+        db.add(checkpoint)
+        await db.commit()
+
+    return checkpoint
+
+
+async def import_batch(batch: ImportBatch, checkpoint: ImportCheckpoint, db: AsyncSession) -> list[int]:
+    """COPY ``batch`` into temporary staging tables, then insert it with set-based statements.
+
+    Resumes get new ids; users who already have a resume are skipped along with
+    the sections of that resume. The checkpoint advances in the same transaction,
+    so a retried import resumes after the last committed batch. Returns the user
+    ids of the imported resumes.
+    """
+    connection = (await (await db.connection()).get_raw_connection()).driver_connection
+    if connection is None:
+        raise RuntimeError("Import needs an open asyncpg connection.")
+    copy = connection.copy_records_to_table
+
+    resume_columns = ", ".join(RESUME_COLUMNS)
+    await db.execute(text(
+        f"CREATE TEMP TABLE import_resumes ON COMMIT DROP AS "
+        f"SELECT id AS source_id, {resume_columns} FROM resumes WITH NO DATA"
+    ))
+    await copy("import_resumes", records=batch.resumes, columns=("source_id", *RESUME_COLUMNS))
+
+    await db.execute(text(
+        "CREATE TEMP TABLE import_resume_ids (source_id integer, resume_id integer, user_id integer) ON COMMIT DROP"
+    ))
+    imported = await db.execute(text(
+        f"WITH inserted AS ("
+        f"  INSERT INTO resumes ({resume_columns})"
+        f"  SELECT DISTINCT ON (user_id) {resume_columns} FROM import_resumes ORDER BY user_id, source_id"
+        f"  ON CONFLICT (user_id) DO NOTHING RETURNING id, user_id"
+        f") "
+        f"INSERT INTO import_resume_ids "
+        f"SELECT DISTINCT ON (s.user_id) s.source_id, i.id, i.user_id "
+        f"FROM inserted AS i JOIN import_resumes AS s USING (user_id) ORDER BY s.user_id, s.source_id "
+        f"RETURNING user_id"
+    ))
+    user_ids = list(imported.scalars().all())
+
+    for name, model in SECTIONS.items():
+        rows = batch.sections[name]
+        if not rows:
+            continue
+
+        table = model.__tablename__
+        columns = ", ".join(TRANSFER_COLUMNS[name])
+        await db.execute(text(
+            f"CREATE TEMP TABLE import_{table} ON COMMIT DROP AS "
+            f"SELECT resume_id AS source_resume_id, {columns} FROM {table} WITH NO DATA"
+        ))
+        await copy(f"import_{table}", records=rows, columns=("source_resume_id", *TRANSFER_COLUMNS[name]))
+
+        owner, mapped = "resume_id", "m.resume_id"
+        if model is SocialLink:
+            # social_link also denormalizes the owner's user_id.
+            owner, mapped = "resume_id, user_id", "m.resume_id, m.user_id"
+        staged = ", ".join(f"s.{column}" for column in TRANSFER_COLUMNS[name])
+        await db.execute(text(
+            f"INSERT INTO {table} ({owner}, {columns}) "
+            f"SELECT {mapped}, {staged} FROM import_{table} AS s "
+            f"JOIN import_resume_ids AS m ON m.source_id = s.source_resume_id"
+        ))
+
+    checkpoint.lines = batch.lines
+    checkpoint.resumes_imported += len(user_ids)
+    checkpoint.resumes_skipped += len(batch) - len(user_ids)
+    await db.commit()
+
+    return user_ids
+
+
+async def complete_import(checkpoint: ImportCheckpoint, db: AsyncSession) -> None:
+    checkpoint.completed_at = dt.datetime.now(dt.UTC).replace(tzinfo=None)
+    await db.commit()
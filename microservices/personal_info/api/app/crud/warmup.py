@@ -0,0 +1,20 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import DEFAULT_PAGE_SIZE, PageParams, paginate
+from app.crud.resume import get_full_resume_by_user_id, get_resume_version_by_user_id
+from app.crud.social_link import social_links_stmt
+from app.models import Resume, SocialLink
+
+
+async def prime_statements(session: AsyncSession) -> None:
+    """Run the hot read statements once so the connection has them prepared and its types introspected.
+
+    An existing user is used when there is one, so the section loads of the full
+    resume run (and get prepared) too.
+    """
+    user_id = await session.scalar(select(Resume.user_id).limit(1)) or 0
+
+    await get_resume_version_by_user_id(user_id, session)
+    await get_full_resume_by_user_id(user_id, session)
+    await paginate(session, social_links_stmt(user_id), SocialLink.id, PageParams(DEFAULT_PAGE_SIZE, None))
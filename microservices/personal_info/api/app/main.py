@@ -1,16 +1,101 @@
-from fastapi import FastAPI
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+from fastapi import FastAPI, status
+from fastapi.responses import ORJSONResponse
+
+from .core.auth import get_jwt_public_key
+from .core.cache import get_cache
+from .core.change_feed import cache_invalidator, get_change_feed
+from .core.config import settings
+from .core.database import close_database, get_database
+from .core.middleware import MetricsMiddleware
+from .core.warmup import drain_on_signals, readiness, warm_up
+from .crud.warmup import prime_statements
 from .routers import routers
+from .routers.match import get_match_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    database = get_database()
+    warming: asyncio.Task | None = None
+    listening: asyncio.Task | None = None
+    refreshing: asyncio.Task | None = None
+    # /ready turns 503 as soon as SIGTERM arrives, not only once the server has stopped accepting requests.
+    restore_signals = drain_on_signals(settings.WEB_DRAIN_DELAY)
+
+    if settings.WARMUP_ENABLED:
+        # In the background, so /health answers while /ready keeps the worker out of rotation.
+        warming = asyncio.create_task(
+            warm_up(database, settings.DB_POOL_SIZE, prime_statements, settings.WARMUP_RETRY_INTERVAL)
+        )
+    else:
+        get_jwt_public_key()
+        readiness.mark_ready()
+
+    if settings.CHANGE_FEED_ENABLED:
+        # Writes made by other workers and instances invalidate this worker's cache and in-flight reads too.
+        feed = get_change_feed()
+        feed.subscribe(cache_invalidator(get_cache()))
+        listening = asyncio.create_task(feed.run())
+
+    if settings.MATCH_REFRESH_ENABLED:
+        # Vectors are recomputed here, never on the /match path; numpy is only imported now.
+        from .crud.matching import keep_index_fresh, prune_deleted
+
+        index = get_match_index()
+        if settings.CHANGE_FEED_ENABLED:
+            get_change_feed().subscribe(prune_deleted(index))
+        refreshing = asyncio.create_task(keep_index_fresh(
+            index, database.session_factory, settings.MATCH_REFRESH_BATCH_SIZE, settings.MATCH_REFRESH_INTERVAL,
+        ))
+
+    yield
+
+    restore_signals()
+    readiness.drain()
+    for task in (warming, listening, refreshing):
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    await close_database()
+
+
+def create_app() -> FastAPI:
+    """Build the application; engines and keys are set up by its lifespan, not at import time."""
+    app = FastAPI(
+        title="Personal Info API",
+        version="1.0.1",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    for router in routers:
+        app.include_router(router)
+
+    @app.get("/health")
+    async def healthcheck() -> dict[str, str]:
+        return {"status": "ok"}
 
-app = FastAPI(
-    title="Personal Info API",
-    version="1.0.1",
-)
+    @app.get(
+        "/ready",
+        summary="Readiness",
+        description="200 once warm-up has opened and primed the connection pools, 503 before that and while draining",
+    )
+    async def readiness_check() -> ORJSONResponse:
+        return ORJSONResponse(
+            {"status": readiness.state, "error": readiness.error},
+            status_code=status.HTTP_200_OK if readiness.ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
 
-for router in routers:
-    app.include_router(router)
+    return app
 
 
-@app.get("/health")
-async def healthcheck() -> dict[str, str]:
-    return {"status": "ok"}
\ No newline at end of file
+app = create_app()
@@ -1,9 +1,13 @@
 from app.models.social_link import SocialLink
 from app.models.education import Education
+from app.models.import_checkpoint import ImportCheckpoint
 from app.models.certificate import Certificate
 from app.models.education import Education
 from app.models.resume import Resume
+from app.models.resume_vector import ResumeVector
 from app.models.skill import Skill
+from app.models.skill_alias import SkillAlias
+from app.models.skill_facet import SkillFacet
 from app.models.language import Language
 from app.models.experience import Experience
 from app.models.project import Project
@@ -3,7 +3,7 @@ import datetime as dt
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import Integer, String, Text, DateTime, func, Date, ForeignKey
 
-from app.core.database import Base
+from app.core.base import Base
 
 
 
@@ -11,7 +11,7 @@ class Experience(Base):
     __tablename__ = "experiences"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    resume_id: Mapped[int] = mapped_column(ForeignKey('resumes.id', ondelete="CASCADE"), nullable=False)
+    resume_id: Mapped[int] = mapped_column(ForeignKey('resumes.id', ondelete="CASCADE"), nullable=False, index=True)
 
     job_title: Mapped[str] = mapped_column(String, nullable=False)
     company: Mapped[str] = mapped_column(String, nullable=False)
@@ -0,0 +1,20 @@
+import datetime as dt
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Integer, String, func
+
+from app.core.base import Base
+
+
+class ImportCheckpoint(Base):
+    """Progress of a resumable NDJSON import; ``lines`` are committed and skipped on retry."""
+    __tablename__ = "import_checkpoints"
+
+    import_id: Mapped[str] = mapped_column(String, primary_key=True)
+    lines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    resumes_imported: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    resumes_skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[dt.datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+    completed_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)
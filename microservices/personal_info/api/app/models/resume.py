@@ -1,17 +1,22 @@
 import datetime as dt
 
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, Text, DateTime, func
+from sqlalchemy import Index, Integer, String, Text, DateTime, func
 
-from app.core.database import Base
+from app.core.base import Base
 
 
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_resumes_skill_tokens", "skill_tokens", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False, unique=True, index=True)
 
     professional_title: Mapped[str | None] = mapped_column(String, nullable=True)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -20,7 +25,16 @@ class Resume(Base):
     image_url: Mapped[str | None] = mapped_column(String, nullable=True)
 
     created_at: Mapped[dt.datetime] = mapped_column(DateTime, server_default=func.now())
-    updated_at: Mapped[dt.datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), index=True
+    )
+
+    # Maintained by database triggers from the resume and its sections, see the search_vector migration.
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+    # Normalized skill and tech stack tokens of the sections, also trigger maintained.
+    skill_tokens: Mapped[list[str]] = mapped_column(
+        ARRAY(String), nullable=False, server_default="{}", deferred=True
+    )
 
     experiences: Mapped[list['Experience']] = relationship(back_populates="resume", cascade="all, delete")
     education: Mapped[list['Education']] = relationship(back_populates="resume", cascade="all, delete")
@@ -0,0 +1,24 @@
+import datetime as dt
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary, func
+
+from app.core.base import Base
+
+
+class ResumeVector(Base):
+    """Matching vector of a resume: ``dim`` little-endian float32 values, L2-normalized.
+
+    Stale once the resume's ``updated_at`` moves past ``resume_updated_at``.
+    """
+    __tablename__ = "resume_vectors"
+    __table_args__ = (
+        # Newest vector per dimension, where the search for stale resumes starts.
+        Index("ix_resume_vectors_dim_resume_updated_at", "dim", "resume_updated_at"),
+    )
+
+    resume_id: Mapped[int] = mapped_column(ForeignKey('resumes.id', ondelete="CASCADE"), primary_key=True)
+    dim: Mapped[int] = mapped_column(Integer, nullable=False)
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    resume_updated_at: Mapped[dt.datetime] = mapped_column(DateTime, nullable=False)
+    computed_at: Mapped[dt.datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False, index=True)
@@ -0,0 +1,12 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String
+
+from app.core.base import Base
+
+
+class SkillAlias(Base):
+    """Spelling folded into a canonical skill token by ``normalize_skill_token()``, e.g. ``k8s`` -> ``kubernetes``."""
+    __tablename__ = "skill_aliases"
+
+    alias: Mapped[str] = mapped_column(String, primary_key=True)
+    token: Mapped[str] = mapped_column(String, nullable=False)
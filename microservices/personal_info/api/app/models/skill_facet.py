@@ -0,0 +1,15 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String
+
+from app.core.base import Base
+
+
+class SkillFacet(Base):
+    """Number of resumes listing each normalized skill token.
+
+    Maintained incrementally by a trigger on ``resumes.skill_tokens``.
+    """
+    __tablename__ = "skill_facets"
+
+    token: Mapped[str] = mapped_column(String, primary_key=True)
+    resume_count: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
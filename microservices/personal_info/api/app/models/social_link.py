@@ -1,14 +1,17 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, String, ForeignKey, Index
 from pydantic import HttpUrl
-from app.core.database import Base
+from app.core.base import Base
 
 
 class SocialLink(Base):
     __tablename__ = "social_link"
+    __table_args__ = (
+        Index("ix_social_link_user_id_id", "user_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    resume_id: Mapped[int] = mapped_column(ForeignKey('resumes.id', ondelete="CASCADE"), nullable=False)
+    resume_id: Mapped[int] = mapped_column(ForeignKey('resumes.id', ondelete="CASCADE"), nullable=False, index=True)
 
     url: Mapped[HttpUrl] = mapped_column(String, nullable=False)
     platform: Mapped[str] = mapped_column(String, nullable=False)
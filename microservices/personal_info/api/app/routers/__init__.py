@@ -1,7 +1,17 @@
 from app.routers.social_link import router as social_link_router
 from app.routers.resume import router as resume_router
+from app.routers.internal import router as internal_router
+from app.routers.match import router as match_router
+from app.routers.metrics import router as metrics_router
+from app.routers.admin import router as admin_router
+from app.routers.events import router as events_router
 
 routers = [
     social_link_router,
-    resume_router
-]
\ No newline at end of file
+    resume_router,
+    internal_router,
+    match_router,
+    metrics_router,
+    admin_router,
+    events_router,
+]
@@ -0,0 +1,108 @@
+import logging
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import CacheBackend, get_cache, social_links_cache_key, user_resume_cache_key
+from app.core.config import settings
+from app.core.database import get_db, get_read_session_factory
+from app.core.pagination import NDJSON_MEDIA_TYPE, ndjson_lines, stream_ndjson
+from app.core.permissions import is_admin
+from app.core.serialization import trusted_response
+from app.crud.transfer import ImportBatch, complete_import, export_stmt, get_or_create_checkpoint, import_batch
+from app.models import ImportCheckpoint
+from app.schemas.resume import ResumeExport
+from app.schemas.transfer import ImportProgress
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(is_admin)])
+
+
+@router.get(
+    "/export",
+    summary="Export resumes",
+    description="Every resume with all of its sections as NDJSON, streamed through a server-side cursor",
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_resumes(
+        session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_read_session_factory)],
+) -> StreamingResponse:
+    return stream_ndjson(session_factory, export_stmt(), ResumeExport)
+
+
+@router.post(
+    "/import",
+    response_model=ImportProgress,
+    summary="Import resumes",
+    description="Load an NDJSON export in COPY batches. Each batch commits with a checkpoint, so a failed import "
+                "can be retried with the same import_id and continues after the last committed batch.",
+)
+async def import_resumes(
+        request: Request,
+        db: Annotated[AsyncSession, Depends(get_db)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+        import_id: Annotated[str | None, Query(max_length=64, pattern=r"^[\w.-]+$")] = None,
+) -> ORJSONResponse:
+    checkpoint = await get_or_create_checkpoint(import_id or uuid.uuid4().hex, db)
+    if checkpoint.completed_at is not None:
+        return trusted_response(ImportProgress, checkpoint)
+
+    async def flush(batch: ImportBatch) -> None:
+        user_ids = await import_batch(batch, checkpoint, db)
+        await cache.delete(*(key for user_id in user_ids
+                             for key in (user_resume_cache_key(user_id), social_links_cache_key(user_id))))
+        logger.info(
+            "Import %s: %d lines, %d resumes imported, %d skipped", checkpoint.import_id, checkpoint.lines,
+            checkpoint.resumes_imported, checkpoint.resumes_skipped,
+        )
+
+    batch = ImportBatch(lines=checkpoint.lines)
+    line_number = 0
+
+    async for line in ndjson_lines(request.stream()):
+        line_number += 1
+        if line_number <= checkpoint.lines or not line.strip():
+            batch.lines = max(batch.lines, line_number)
+            continue
+
+        try:
+            batch.add(ResumeExport.model_validate_json(line))
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid resume on line {line_number}: {e.errors(include_url=False)[0]['msg']}. "
+                       f"Lines up to {checkpoint.lines} were imported.",
+            ) from e
+        batch.lines = line_number
+
+        if len(batch) >= settings.IMPORT_BATCH_SIZE:
+            await flush(batch)
+            batch = ImportBatch(lines=checkpoint.lines)
+
+    if len(batch):
+        await flush(batch)
+    await complete_import(checkpoint, db)
+
+    return trusted_response(ImportProgress, checkpoint)
+
+
+@router.get(
+    "/import/{import_id}",
+    response_model=ImportProgress,
+    summary="Import progress",
+    description="Lines committed and resumes imported so far by an import",
+)
+async def get_import_progress(
+        import_id: str,
+        db: Annotated[AsyncSession, Depends(get_db)],
+) -> ORJSONResponse:
+    checkpoint = await db.get(ImportCheckpoint, import_id)
+    if checkpoint is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import not found.")
+
+    return trusted_response(ImportProgress, checkpoint)
@@ -0,0 +1,45 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.auth import get_user_id
+from app.core.change_feed import EVENT_STREAM_MEDIA_TYPE, ChangeFeed, get_change_feed, resume_events
+from app.core.config import settings
+from app.core.database import get_session_factory
+from app.core.rate_limit import rate_limit
+from app.crud.resume import get_resume_version_by_user_id
+
+# Apart from the resume router: an open event stream must not count against the load shedder's concurrency.
+router = APIRouter(prefix="/resumes", tags=["Resume"], dependencies=[Depends(rate_limit)])
+
+
+@router.get(
+    "/me/events",
+    response_class=StreamingResponse,
+    summary="Own resume change events",
+    description="Server-sent events, one per committed change to the current user's resume from any client, "
+                "with the new ETag as the event id. Reconnecting with Last-Event-ID replays a missed change.",
+)
+async def my_resume_events(
+        user_id: Annotated[int, Depends(get_user_id)],
+        session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
+        feed: Annotated[ChangeFeed, Depends(get_change_feed)],
+        last_event_id: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    if not settings.CHANGE_FEED_ENABLED:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Change feed is disabled.")
+
+    # A short session of its own: the stream outlives request dependencies and must not hold a connection.
+    async with session_factory() as session:
+        version = await get_resume_version_by_user_id(user_id, session)
+
+    return StreamingResponse(
+        resume_events(
+            feed, user_id, version._tuple() if version is not None else None, last_event_id,
+            settings.SSE_KEEPALIVE_INTERVAL,
+        ),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
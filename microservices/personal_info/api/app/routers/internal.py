@@ -0,0 +1,47 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.core.change_feed import ChangeFeed, get_change_feed
+from app.core.database import Database, get_database
+from app.core.permissions import is_admin
+from app.core.pool import instrumented_pool
+from app.core.slow_query import slow_query_log
+
+router = APIRouter(prefix="/internal", tags=["Internal"], dependencies=[Depends(is_admin)])
+
+
+@router.get(
+    "/pool",
+    summary="Database pool status",
+    description="Pool size, checked-out connections, overflow and checkout wait-time histogram",
+)
+async def get_pool_status(database: Annotated[Database, Depends(get_database)]) -> dict[str, object]:
+    return instrumented_pool(database.engine).stats()
+
+
+@router.get(
+    "/replicas",
+    summary="Read replica status",
+    description="Replication lag, rotation membership and pool status of every configured read replica",
+)
+async def get_replica_status(database: Annotated[Database, Depends(get_database)]) -> list[dict[str, object]]:
+    return database.replica_set.stats() if database.replica_set is not None else []
+
+
+@router.get(
+    "/change-feed",
+    summary="Change feed status",
+    description="Whether this worker's LISTEN connection is up, its last keepalive and notifications received",
+)
+async def get_change_feed_status(feed: Annotated[ChangeFeed, Depends(get_change_feed)]) -> dict[str, object]:
+    return feed.stats()
+
+
+@router.get(
+    "/slow-queries",
+    summary="Recent slow queries",
+    description="Latest statements over the slow-query threshold, newest first, with sampled EXPLAIN ANALYZE plans",
+)
+async def get_slow_queries() -> list[dict[str, object]]:
+    return slow_query_log.snapshot()
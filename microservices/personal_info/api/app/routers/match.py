@@ -0,0 +1,45 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated
+
+from fastapi import APIRouter, Body, Depends
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.admission import shed_load
+from app.core.auth import get_token_payload
+from app.core.config import settings
+from app.core.database import get_read_db
+from app.core.rate_limit import rate_limit
+from app.core.serialization import trusted_response
+from app.schemas.match import MatchHit, MatchRequest
+
+if TYPE_CHECKING:
+    from app.core.matching import MatchIndex
+
+router = APIRouter(prefix="/match", tags=["Match"], dependencies=[Depends(shed_load), Depends(rate_limit)])
+
+
+@lru_cache(maxsize=1)
+def get_match_index() -> "MatchIndex":
+    # numpy is imported when the app starts up (or by the first match request), never at import time.
+    from app.core.matching import MatchIndex
+
+    return MatchIndex(settings.MATCH_VECTOR_DIM)
+
+
+@router.post(
+    "",
+    response_model=list[MatchHit],
+    summary="Match resumes to a job",
+    description="Resumes most similar to a job description, best first",
+    dependencies=[Depends(get_token_payload)],
+)
+async def match(
+        match_in: Annotated[MatchRequest, Body()],
+        db: Annotated[AsyncSession, Depends(get_read_db)],
+        index: Annotated["MatchIndex", Depends(get_match_index)],
+) -> ORJSONResponse:
+    from app.crud.matching import match_resumes
+
+    hits = await match_resumes(match_in.job_description, match_in.top_k, index, db)
+    return trusted_response(MatchHit, hits)
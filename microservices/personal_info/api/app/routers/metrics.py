@@ -0,0 +1,41 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.core.admission import load_shedder
+from app.core.auth import token_cache
+from app.core.database import Database, get_database
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus, request_metrics
+from app.core.pool import instrumented_pool
+from app.core.single_flight import read_flights
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="Per-route latency, SQL statements and DB time per request, JWT verification time, pool status, "
+                "load shedding and read coalescing",
+)
+async def get_metrics(database: Annotated[Database, Depends(get_database)]) -> PlainTextResponse:
+    tokens = token_cache.stats()
+    admission = load_shedder.stats()
+    flights = read_flights.stats()
+    extra = [
+        ("jwt_cache_size", "gauge", "Verified access tokens held in the cache.", tokens["size"]),
+        ("jwt_cache_hits_total", "counter", "Access token cache hits.", tokens["hits"]),
+        ("jwt_cache_misses_total", "counter", "Access token cache misses.", tokens["misses"]),
+        ("admission_concurrency_limit", "gauge", "Adaptive cap on concurrent requests.", admission["limit"]),
+        ("admission_in_flight", "gauge", "Requests currently admitted.", admission["in_flight"]),
+        ("admission_shed_total", "counter", "Requests rejected under pool pressure.", admission["shed"]),
+        ("read_loads_total", "counter", "Database loads run for cache misses.", flights["loads"]),
+        ("read_coalesced_total", "counter", "Reads served by another request's load.", flights["coalesced"]),
+    ]
+
+    return PlainTextResponse(
+        render_prometheus(request_metrics, instrumented_pool(database.engine).stats(), extra),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -1,16 +1,54 @@
 from typing import Annotated
 
-from fastapi import APIRouter, status, Body, Depends, HTTPException
+from fastapi import APIRouter, status, Body, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_user_id
-from app.core.database import get_db
-from app.core.permissions import is_owner
-from app.crud.resume import get_resume_by_user_id
+from app.core.admission import shed_load
+from app.core.auth import get_token_payload, get_user_id
+from app.core.cache import (
+    CacheBackend,
+    CacheEntry,
+    get_cache,
+    invalidate_user_cache,
+    resume_cache_key,
+    user_resume_cache_key,
+)
+from app.core.config import settings
+from app.core.database import cache_ttl, get_db, get_read_db
+from app.core.etag import check_if_match, conditional_read, resume_etag
+from app.core.pagination import Page, PageParams
+from app.core.rate_limit import rate_limit
+from app.core.serialization import trusted_json, trusted_response
+from app.core.skill_query import SkillQueryError, parse_skill_query
+from app.crud.resume import (
+    get_full_resume_by_id,
+    get_full_resume_by_user_id,
+    get_resume_version_by_id,
+    get_resume_version_by_user_id,
+)
+from app.crud.resume_document import (
+    ResumeDocumentError,
+    create_resume_document,
+    lock_full_resume_by_user_id,
+    replace_resume,
+)
+from app.crud.search import filter_resumes_by_skills, search_resumes
 from app.models import Resume
-from app.schemas.resume import ResumeOut, ResumeCreate
+from app.schemas.resume import ResumeOut, ResumeCreate, ResumeReplace, ResumeSearchHit, ResumeSkillPage
+
+router = APIRouter(prefix="/resumes", tags=["Resume"], dependencies=[Depends(shed_load), Depends(rate_limit)])
+
+
+def _resume_entry(resume: Resume | None) -> CacheEntry | None:
+    if resume is None:
+        return None
 
-router = APIRouter(prefix="/resumes", tags=["Resume"])
+    return CacheEntry(
+        version=resume_etag(resume.id, resume.updated_at),
+        body=trusted_json(ResumeOut, resume),
+    )
 
 
 @router.post(
@@ -23,27 +61,182 @@ router = APIRouter(prefix="/resumes", tags=["Resume"])
 async def create_resume(
         resume_in: Annotated[ResumeCreate, Body()],
         db: Annotated[AsyncSession, Depends(get_db)],
-        user_id: Annotated[int, Depends(get_user_id)]
-):
-    resume = await get_resume_by_user_id(user_id, db)
+        user_id: Annotated[int, Depends(get_user_id)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+) -> ORJSONResponse:
+    obj = Resume(**resume_in.model_dump(), user_id=user_id)
+
+    db.add(obj)
 
-    if resume:
+    # The unique index on resumes.user_id is the source of truth, so concurrent creates cannot both succeed.
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Resume already exists for this user."
-        )
+        ) from e
 
-    obj = Resume(**resume_in.model_dump(), user_id=user_id)
+    await invalidate_user_cache(cache, user_id, obj.id)
+
+    resume = await get_full_resume_by_id(obj.id, db)
+
+    return trusted_response(ResumeOut, resume, status_code=status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/me",
+    response_model=ResumeOut,
+    summary="Get own resume",
+    description="Get the current user's resume with all of its sections",
+)
+async def get_my_resume(
+        db: Annotated[AsyncSession, Depends(get_read_db)],
+        user_id: Annotated[int, Depends(get_user_id)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    async def load_etag() -> str | None:
+        version = await get_resume_version_by_user_id(user_id, db)
+        return resume_etag(*version) if version else None
+
+    async def load_entry() -> CacheEntry | None:
+        return _resume_entry(await get_full_resume_by_user_id(user_id, db))
+
+    response = await conditional_read(
+        cache, user_resume_cache_key(user_id), cache_ttl(db, settings.CACHE_RESUME_TTL), if_none_match,
+        load_etag, load_entry, source=db.bind,
+    )
+
+    if response is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found.")
+
+    return response
+
+
+@router.put(
+    "/me",
+    response_model=ResumeOut,
+    summary="Save own resume",
+    description="Replace the current user's resume with the full document, sections included, in one transaction. "
+                "Only rows that differ from the stored resume are written; items without an id are added and "
+                "stored items left out are deleted. Creates the resume (201) when the user has none. With If-Match, "
+                "answers 412 unless it names the current ETag.",
+    responses={201: {"model": ResumeOut}},
+)
+async def put_my_resume(
+        resume_in: Annotated[ResumeReplace, Body()],
+        db: Annotated[AsyncSession, Depends(get_db)],
+        user_id: Annotated[int, Depends(get_user_id)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+        if_match: Annotated[str | None, Header()] = None,
+) -> ORJSONResponse:
+    resume = await lock_full_resume_by_user_id(user_id, db)
+    status_code = status.HTTP_200_OK if resume else status.HTTP_201_CREATED
+
+    if resume is not None:
+        check_if_match(if_match, resume_etag(resume.id, resume.updated_at))
+    elif if_match is not None:
+        # No current version can match, not even "*".
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Resource has been modified.")
+
+    try:
+        if resume is None:
+            resume_id, changed = await create_resume_document(resume_in, user_id, db), True
+        else:
+            resume_id, changed = resume.id, await replace_resume(resume, resume_in, db)
+    except ResumeDocumentError as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Resume already exists for this user."
+        ) from e
+
+    if resume is not None and not changed:
+        # Nothing was written; committing just releases the row lock.
+        await db.commit()
+        return trusted_response(ResumeOut, resume, headers={"ETag": resume_etag(resume.id, resume.updated_at)})
 
-    db.add(obj)
     await db.commit()
-    await db.refresh(obj)
+    await invalidate_user_cache(cache, user_id, resume_id)
+
+    db.expire_all()
+    saved = await get_full_resume_by_id(resume_id, db)
+    headers = {"ETag": resume_etag(saved.id, saved.updated_at)} if saved is not None else None
+
+    return trusted_response(ResumeOut, saved, status_code=status_code, headers=headers)
+
+
+@router.get(
+    "/search",
+    response_model=Page[ResumeSearchHit],
+    summary="Search resumes",
+    description="Full-text search over titles, summaries, experience, projects and education, best match first. "
+                "Supports quoted phrases, OR and -exclusions.",
+    dependencies=[Depends(get_token_payload)],
+)
+async def search(
+        q: Annotated[str, Query(min_length=1, max_length=256, description="Search query")],
+        page: Annotated[PageParams, Depends()],
+        db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> ORJSONResponse:
+    hits = await search_resumes(q, page.limit, page.cursor, db)
+    return trusted_response(Page[ResumeSearchHit], hits)
+
+
+@router.get(
+    "/filter",
+    response_model=ResumeSkillPage,
+    summary="Filter resumes by skills",
+    description="Resumes whose skills and project tech stacks match a boolean query such as "
+                "'python AND (fastapi OR django)', with per-skill resume counts",
+    dependencies=[Depends(get_token_payload)],
+)
+async def filter_by_skills(
+        skills: Annotated[str, Query(min_length=1, max_length=512, description="Skills joined with AND/OR")],
+        page: Annotated[PageParams, Depends()],
+        db: Annotated[AsyncSession, Depends(get_read_db)],
+        facets: Annotated[int, Query(ge=0, le=100, description="Number of most common skills to count")] = 20,
+) -> ORJSONResponse:
+    try:
+        query = parse_skill_query(skills)
+    except SkillQueryError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid skill query: {e}") from e
+
+    result = await filter_resumes_by_skills(query, page, facets, db)
+    return trusted_response(ResumeSkillPage, result)
+
+
+@router.get(
+    "/{id}",
+    response_model=ResumeOut,
+    summary="Get resume",
+    description="Get a resume with all of its sections",
+    dependencies=[Depends(get_token_payload)],
+)
+async def get_resume(
+        id: int,
+        db: Annotated[AsyncSession, Depends(get_read_db)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    async def load_etag() -> str | None:
+        version = await get_resume_version_by_id(id, db)
+        return resume_etag(*version) if version else None
+
+    async def load_entry() -> CacheEntry | None:
+        return _resume_entry(await get_full_resume_by_id(id, db))
+
+    response = await conditional_read(
+        cache, resume_cache_key(id), cache_ttl(db, settings.CACHE_RESUME_TTL), if_none_match, load_etag, load_entry,
+        source=db.bind,
+    )
 
-    return obj
+    if response is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found.")
 
-# @router.get('/')
-# async def get_resume(
-#         user_id: Annotated[int, Depends(get_user_id)],
-#         perm: Annotated[dict, Depends(is_owner)]
-# ):
-#     pass
+    return response
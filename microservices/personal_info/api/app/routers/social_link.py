@@ -1,17 +1,46 @@
 from typing import Annotated
 
+import orjson
 from sqlalchemy import select
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.admission import shed_load
 from app.core.auth import get_user_id
-from app.core.database import get_db
+from app.core.cache import (
+    CacheBackend,
+    CacheEntry,
+    get_cache,
+    invalidate_user_cache,
+    social_links_cache_key,
+)
+from app.core.config import settings
+from app.core.database import cache_ttl, get_db, get_read_db, get_read_session_factory
+from app.core.etag import (
+    CACHE_CONTROL,
+    check_if_match,
+    conditional_read,
+    none_match,
+    not_modified,
+    social_link_etag,
+    social_links_etag,
+)
+from app.core.pagination import NDJSON_MEDIA_TYPE, Page, PageParams, after_cursor, paginate, stream_ndjson, wants_ndjson
+from app.core.rate_limit import RateLimiter, enforce_rate_limit, get_rate_limiter, rate_limit
+from app.core.serialization import trusted_dump_many, trusted_response
+from app.crud.bulk import bulk_insert_returning
+from app.crud.resume import get_resume_id_by_user_id, get_resume_version_by_user_id, touch_resume
+from app.crud.social_link import delete_link, social_links_stmt, update_link
+from app.models.resume import Resume
 from app.models.social_link import SocialLink
 from app.schemas.social_link import SocialLinkOut, SocialLinkCreate, SocialLinkUpdate, SocialLinkUpdatePartially
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-router = APIRouter(prefix="/social-links", tags=["Social Links"])
+router = APIRouter(
+    prefix="/social-links", tags=["Social Links"], dependencies=[Depends(shed_load), Depends(rate_limit)]
+)
 
 
 @router.post(
@@ -19,27 +48,35 @@ router = APIRouter(prefix="/social-links", tags=["Social Links"])
     response_model=list[SocialLinkOut],
     status_code=status.HTTP_201_CREATED,
     summary="Bulk add social links for the current user",
-    description="Add multiple social links to the current user",
+    description=f"Add up to {settings.SOCIAL_LINKS_MAX_BATCH} social links to the current user. "
+                "Each link counts against the rate limit.",
 )
 async def add_social_links(
-        links: Annotated[list[SocialLinkCreate], ...],
+        request: Request,
+        links: Annotated[list[SocialLinkCreate], Body(max_length=settings.SOCIAL_LINKS_MAX_BATCH)],
         db: Annotated[AsyncSession, Depends(get_db)],
-        user_id: Annotated[int, Depends(get_user_id)]
-) -> list[SocialLinkOut]:
-    created_links: list[SocialLink] = []
+        user_id: Annotated[int, Depends(get_user_id)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+        limiter: Annotated[RateLimiter, Depends(get_rate_limiter)],
+) -> ORJSONResponse:
+    if len(links) > 1:
+        # The router's rate limit already took one token for the request.
+        await enforce_rate_limit(request, limiter, cost=len(links) - 1)
 
-    try:
-        for link in links:
-            item = SocialLink(user_id=user_id, **link.model_dump())
-            db.add(item)
-            created_links.append(item)
+    resume_id = await get_resume_id_by_user_id(user_id, db)
 
-        await db.commit()
+    if resume_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found.")
+
+    rows = [{"user_id": user_id, "resume_id": resume_id, **link.model_dump()} for link in links]
 
-        for item in created_links:
-            await db.refresh(item)
+    try:
+        created_links = await bulk_insert_returning(db, SocialLink, rows)
+        await touch_resume(resume_id, db)
+        await db.commit()
+        await invalidate_user_cache(cache, user_id, resume_id)
 
-        return [SocialLinkOut.model_validate(item, from_attributes=True) for item in created_links]
+        return trusted_response(SocialLinkOut, created_links, status_code=status.HTTP_201_CREATED)
 
     except SQLAlchemyError as err:
         await db.rollback()
@@ -50,64 +87,144 @@ async def add_social_links(
         )
 
 
-@router.get("/", response_model=list[SocialLinkOut])
+@router.get(
+    "/",
+    response_model=Page[SocialLinkOut],
+    summary="List social links of the current user",
+    description=f"Keyset paginated by id. Send `Accept: {NDJSON_MEDIA_TYPE}` to stream all links as NDJSON instead.",
+)
 async def get_social_links(
         user_id: Annotated[int, Depends(get_user_id)],
-        db: AsyncSession = Depends(get_db)
-) -> list[SocialLinkOut]:
-    stmt = select(SocialLink).where(SocialLink.user_id == user_id)
-    results = await db.execute(stmt)
-    return results.scalars().all()
+        page: Annotated[PageParams, Depends()],
+        session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_read_session_factory)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
+        db: AsyncSession = Depends(get_read_db),
+        accept: Annotated[str | None, Header()] = None,
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    stmt = social_links_stmt(user_id)
+    after = page.key_value(SocialLink.id)
+
+    if wants_ndjson(accept):
+        return stream_ndjson(session_factory, after_cursor(stmt, SocialLink.id, after), SocialLinkOut)
+
+    etag: str | None = None
+    etag_loaded = False
+
+    async def load_etag() -> str | None:
+        nonlocal etag, etag_loaded
+        version = await get_resume_version_by_user_id(user_id, db)
+        etag, etag_loaded = social_links_etag(*version) if version else None, True
+        return etag
+
+    async def load_entry() -> CacheEntry | None:
+        if not etag_loaded:
+            await load_etag()
+        if etag is None:
+            # No resume, so no version to validate or cache an empty page under.
+            return None
+
+        result = await paginate(db, stmt, SocialLink.id, page)
+        result["items"] = trusted_dump_many(SocialLinkOut, result["items"])
+        return CacheEntry(version=etag, body=orjson.dumps(result))
+
+    response = await conditional_read(
+        cache,
+        social_links_cache_key(user_id),
+        cache_ttl(db, settings.CACHE_SOCIAL_LINKS_TTL),
+        if_none_match,
+        load_etag,
+        load_entry,
+        field=f"{page.limit}:{page.after or ''}",
+        source=db.bind,
+    )
+    if response is None:
+        return trusted_response(Page[SocialLinkOut], {"items": [], "next_cursor": None})
+
+    return response
 
 
 @router.get("/{id}/", response_model=SocialLinkOut)
 async def get_social_link(
         id: int,
-        db: AsyncSession = Depends(get_db),
-) -> SocialLinkOut:
-    stmt = select(SocialLink).where(SocialLink.user_id == 1, SocialLink.id == id)
+        user_id: Annotated[int, Depends(get_user_id)],
+        db: AsyncSession = Depends(get_read_db),
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    stmt = (
+        select(SocialLink, Resume.updated_at)
+        .join(SocialLink.resume)
+        .where(SocialLink.user_id == user_id, SocialLink.id == id)
+    )
     result = await db.execute(stmt)
-    link = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if link is None:
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Social Link not found.")
 
-    return link
+    link, updated_at = row
+    etag = social_link_etag(link.id, updated_at)
+
+    if none_match(if_none_match, etag):
+        return not_modified(etag)
+
+    return trusted_response(SocialLinkOut, link, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+async def _check_if_match(id: int, user_id: int, if_match: str, db: AsyncSession) -> None:
+    """412 unless ``if_match`` matches the link's version; 404 when the user has no such link.
+
+    Locks the parent resume until commit, so the check cannot race another writer.
+    """
+    updated_at = await db.scalar(
+        select(Resume.updated_at)
+        .join(SocialLink.resume)
+        .where(SocialLink.id == id, SocialLink.user_id == user_id)
+        .with_for_update(of=Resume)
+    )
+    if updated_at is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Social Link not found.")
+
+    check_if_match(if_match, social_link_etag(id, updated_at))
 
 
 @router.patch("/{id}/", response_model=SocialLinkOut)
 async def update_partially_social_link(
         id: int,
         update_data: SocialLinkUpdate,
+        user_id: Annotated[int, Depends(get_user_id)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
         db: AsyncSession = Depends(get_db),
-) -> SocialLinkOut:
-    stmt = select(SocialLink).where(SocialLink.id == id, SocialLink.user_id == 1)
-    result = await db.execute(stmt)
-    link = result.scalar_one_or_none()
+        if_match: Annotated[str | None, Header()] = None,
+) -> ORJSONResponse:
+    if if_match is not None:
+        await _check_if_match(id, user_id, if_match, db)
 
-    if link is None:
+    written = await update_link(id, user_id, update_data.model_dump(exclude_unset=True), db)
+    if written is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Social Link not found.")
 
-    for field, value in update_data.model_dump(exclude_unset=True).items():
-        setattr(link, field, value)
-
+    link, updated_at = written
     await db.commit()
-    await db.refresh(link)
+    await invalidate_user_cache(cache, user_id, link.resume_id)
 
-    return link
+    return trusted_response(SocialLinkOut, link, headers={"ETag": social_link_etag(link.id, updated_at)})
 
 
 @router.delete("/{id}/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_social_link(
         id: int,
+        user_id: Annotated[int, Depends(get_user_id)],
+        cache: Annotated[CacheBackend, Depends(get_cache)],
         db: AsyncSession = Depends(get_db),
+        if_match: Annotated[str | None, Header()] = None,
 ) -> None:
-    stmt = select(SocialLink).where(SocialLink.id == id, SocialLink.user_id == 1)
-    result = await db.execute(stmt)
-    link = result.scalar_one_or_none()
+    if if_match is not None:
+        await _check_if_match(id, user_id, if_match, db)
 
+    link = await delete_link(id, user_id, db)
     if link is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Social Link not found.")
 
-    await db.delete(link)
     await db.commit()
+    await invalidate_user_cache(cache, user_id, link.resume_id)
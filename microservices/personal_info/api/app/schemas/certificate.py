@@ -0,0 +1,27 @@
+import datetime as dt
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_serializer
+
+
+class CertificateCreate(BaseModel):
+    issuer: str
+    name: str
+    date: dt.date | None = None
+    description: str | None = None
+    link: HttpUrl
+
+    @field_serializer("link")
+    def serialize_link(self, link: HttpUrl) -> str:
+        return str(link)
+
+
+class CertificateReplace(CertificateCreate):
+    id: int | None = Field(None, description="Existing item to keep or update; omit to add a new one")
+
+
+class CertificateOut(CertificateCreate):
+    id: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
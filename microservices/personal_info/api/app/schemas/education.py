@@ -0,0 +1,25 @@
+import datetime as dt
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class EducationCreate(BaseModel):
+    school: str
+    degree: str | None = None
+    field_of_study: str | None = None
+    location: str | None = None
+    start_date: dt.date
+    end_date: dt.date | None = None
+    description: str | None = None
+
+
+class EducationReplace(EducationCreate):
+    id: int | None = Field(None, description="Existing item to keep or update; omit to add a new one")
+
+
+class EducationOut(EducationCreate):
+    id: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
@@ -0,0 +1,25 @@
+import datetime as dt
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ExperienceCreate(BaseModel):
+    job_title: str
+    company: str
+    location: str | None = None
+    start_date: dt.date
+    end_date: dt.date | None = None
+    description: str
+    challenge: str | None = None
+
+
+class ExperienceReplace(ExperienceCreate):
+    id: int | None = Field(None, description="Existing item to keep or update; omit to add a new one")
+
+
+class ExperienceOut(ExperienceCreate):
+    id: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
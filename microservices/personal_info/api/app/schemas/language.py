@@ -0,0 +1,18 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LanguageCreate(BaseModel):
+    name: str | None = None
+    level: str | None = None
+
+
+class LanguageReplace(LanguageCreate):
+    id: int | None = Field(None, description="Existing item to keep or update; omit to add a new one")
+
+
+class LanguageOut(LanguageCreate):
+    id: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
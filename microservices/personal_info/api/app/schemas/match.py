@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class MatchRequest(BaseModel):
+    job_description: str = Field(..., min_length=1, max_length=20_000, description="Job posting text")
+    top_k: int = Field(10, ge=1, le=100, description="Number of resumes to return")
+
+
+class MatchHit(BaseModel):
+    id: int
+    user_id: int
+    professional_title: str | None
+    location: str
+    score: float = Field(..., description="Cosine similarity to the job description, higher is better")
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_serializer
+
+
+class ProjectCreate(BaseModel):
+    title: str
+    description: str | None = None
+    link: HttpUrl | None = None
+    tech_stack: list[str] | None = None
+
+    @field_serializer("link")
+    def serialize_link(self, link: HttpUrl | None) -> str | None:
+        return str(link) if link is not None else None
+
+
+class ProjectReplace(ProjectCreate):
+    id: int | None = Field(None, description="Existing item to keep or update; omit to add a new one")
+
+
+class ProjectOut(ProjectCreate):
+    id: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
@@ -2,6 +2,15 @@ import datetime as dt
 
 from pydantic import BaseModel, Field, HttpUrl, ConfigDict
 
+from app.core.pagination import Page
+from app.schemas.certificate import CertificateOut, CertificateReplace
+from app.schemas.education import EducationOut, EducationReplace
+from app.schemas.experience import ExperienceOut, ExperienceReplace
+from app.schemas.language import LanguageOut, LanguageReplace
+from app.schemas.project import ProjectOut, ProjectReplace
+from app.schemas.skill import SkillFacetOut, SkillOut, SkillReplace
+from app.schemas.social_link import SocialLinkExport, SocialLinkOut, SocialLinkReplace
+
 
 class ResumeCreate(BaseModel):
     professional_title: str | None = Field(None, description="CV headline/title, e.g. Python Developer")
@@ -19,12 +28,77 @@ class ResumeUpdate(BaseModel):
     image_url: HttpUrl | None = None
 
 
+class ResumeReplace(ResumeCreate):
+    """The whole resume document; section items without an id are added, stored ones left out are deleted."""
+
+    experiences: list[ExperienceReplace] = []
+    education: list[EducationReplace] = []
+    skills: list[SkillReplace] = []
+    projects: list[ProjectReplace] = []
+    certificates: list[CertificateReplace] = []
+    social_links: list[SocialLinkReplace] = []
+    languages: list[LanguageReplace] = []
+
+
 class ResumeOut(ResumeCreate):
     id: int
     user_id: int
     created_at: dt.datetime
     updated_at: dt.datetime
 
+    experiences: list[ExperienceOut] = []
+    education: list[EducationOut] = []
+    skills: list[SkillOut] = []
+    projects: list[ProjectOut] = []
+    certificates: list[CertificateOut] = []
+    social_links: list[SocialLinkOut] = []
+    languages: list[LanguageOut] = []
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
+
+
+class ResumeExport(ResumeCreate):
+    """Line of an admin export: the fields of ``ResumeOut`` plus stored section columns the API does not expose."""
+
+    id: int
+    user_id: int
+    created_at: dt.datetime
+    updated_at: dt.datetime
+
+    experiences: list[ExperienceOut] = []
+    education: list[EducationOut] = []
+    skills: list[SkillOut] = []
+    projects: list[ProjectOut] = []
+    certificates: list[CertificateOut] = []
+    social_links: list[SocialLinkExport] = []
+    languages: list[LanguageOut] = []
+
     model_config = ConfigDict(
         from_attributes=True
-    )
\ No newline at end of file
+    )
+
+
+class ResumeSearchHit(BaseModel):
+    id: int
+    user_id: int
+    professional_title: str | None
+    location: str
+    rank: float = Field(..., description="Relevance; hits are ordered by it, highest first")
+    title_highlight: str = Field(..., description="Professional title with matches wrapped in <mark></mark>")
+    summary_highlight: str = Field(..., description="Best matching summary fragments, matches wrapped in <mark></mark>")
+
+
+class ResumeSkillHit(BaseModel):
+    id: int
+    user_id: int
+    professional_title: str | None
+    location: str
+    skill_tokens: list[str] = Field(..., description="Normalized skills and tech stack of the resume")
+
+
+class ResumeSkillPage(Page[ResumeSkillHit]):
+    facets: list[SkillFacetOut] = Field(
+        ..., description="Resume counts of the most common skills and of the skills in the query"
+    )
@@ -0,0 +1,27 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SkillCreate(BaseModel):
+    name: str | None = None
+    level: str | None = None
+
+
+class SkillFacetOut(BaseModel):
+    token: str
+    resume_count: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
+
+
+class SkillReplace(SkillCreate):
+    id: int | None = Field(None, description="Existing item to keep or update; omit to add a new one")
+
+
+class SkillOut(SkillCreate):
+    id: int
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
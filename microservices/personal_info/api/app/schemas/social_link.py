@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl, model_validator, field_serializer
+from pydantic import BaseModel, Field, HttpUrl, model_validator, field_serializer
 
 
 class SocialLinkCreate(BaseModel):
@@ -23,9 +23,17 @@ class SocialLinkUpdatePartially(BaseModel):
         return str(url)
 
 
+class SocialLinkReplace(SocialLinkCreate):
+    id: int | None = Field(None, description="Existing item to keep or update; omit to add a new one")
+
+
 class SocialLinkOut(SocialLinkCreate):
     id: int
 
     model_config = {
         "from_attributes": True
     }
+
+
+class SocialLinkExport(SocialLinkOut):
+    description: str | None = ""
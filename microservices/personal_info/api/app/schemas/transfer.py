@@ -0,0 +1,15 @@
+import datetime as dt
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ImportProgress(BaseModel):
+    import_id: str
+    lines: int = Field(..., description="Input lines committed; a retry with the same import_id skips them")
+    resumes_imported: int
+    resumes_skipped: int = Field(..., description="Resumes of users who already had one")
+    completed_at: dt.datetime | None = None
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
@@ -0,0 +1,89 @@
+"""Process entrypoint: ``python -m app.serve`` for production, ``python -m app.serve --reload`` for development.
+
+Kept free of application imports: the supervisor only forks workers, each of
+which imports ``app.main`` itself.
+"""
+import argparse
+import math
+import os
+from pathlib import Path
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.core.config import settings
+
+APP = "app.main:app"
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+
+def available_cpus() -> int:
+    """CPUs this process may use, honoring the container's cgroup v2 CPU quota."""
+    cpus = os.process_cpu_count() or 1
+    try:
+        quota, period = CGROUP_CPU_MAX.read_text().split()
+        if quota == "max":
+            return cpus
+        return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        return cpus
+
+
+def split_pool(
+        workers: int, max_connections: int | None, pool_size: int, max_overflow: int, reserved: int = 0
+) -> tuple[int, int]:
+    """Per-worker ``pool_size`` and ``max_overflow`` so all workers together stay within ``max_connections``.
+
+    ``reserved`` connections per worker are opened outside the pool.
+    """
+    if max_connections is None:
+        return pool_size, max_overflow
+
+    per_worker = max_connections // workers - reserved
+    if per_worker < 1:
+        raise ValueError(f"DB_MAX_CONNECTIONS={max_connections} leaves no connection for each of {workers} workers.")
+
+    pool_size = min(pool_size, per_worker)
+    return pool_size, min(max_overflow, per_worker - pool_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the Personal Info API.")
+    parser.add_argument("--reload", action="store_true", default=settings.WEB_RELOAD,
+                        help="single process that restarts on code changes (development only)")
+    parser.add_argument("--workers", type=int, default=settings.WEB_CONCURRENCY,
+                        help="worker processes (default: available CPUs)")
+    args = parser.parse_args()
+
+    if args.reload:
+        uvicorn.run(APP, host=settings.WEB_HOST, port=settings.WEB_PORT, reload=True, reload_dirs=["app"])
+        return
+
+    workers = args.workers or available_cpus()
+    pool_size, max_overflow = split_pool(
+        workers, settings.DB_MAX_CONNECTIONS, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW,
+        reserved=1 if settings.CHANGE_FEED_ENABLED else 0,  # the change feed's LISTEN connection
+    )
+    # Workers are spawned and read their settings from the environment.
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+
+    config = uvicorn.Config(
+        APP,
+        host=settings.WEB_HOST,
+        port=settings.WEB_PORT,
+        workers=workers,
+        proxy_headers=True,
+        # Recycled workers bound memory growth; the jitter keeps them from restarting all at once.
+        limit_max_requests=settings.WEB_MAX_REQUESTS,
+        limit_max_requests_jitter=settings.WEB_MAX_REQUESTS_JITTER,
+        # On SIGTERM a worker stops accepting, lets in-flight requests finish for up to this long, then
+        # runs the lifespan shutdown (readiness drains, pools close).
+        timeout_graceful_shutdown=settings.WEB_GRACEFUL_TIMEOUT,
+    )
+    # The supervisor restarts workers that exit, recycled ones included, even with a single worker.
+    Multiprocess(config, sockets=[config.bind_socket()]).run()
+
+
+if __name__ == "__main__":
+    main()
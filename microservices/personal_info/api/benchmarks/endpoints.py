@@ -0,0 +1,455 @@
+"""HTTP load benchmark for every router in ``app.routers``.
+
+The app runs in-process behind ``httpx.ASGITransport``, on a seeded throwaway
+database: a temporary SQLite file by default (one connection per session, so
+concurrent writers behave), or any async SQLAlchemy URL passed with
+``--database-url`` (all tables there are dropped and recreated). Numbers are only
+comparable between runs against the same kind of database, and endpoints that
+need Postgres-only SQL (search, skill filter, import) are skipped on SQLite.
+Tokens are minted with a freshly generated RS256 keypair.
+
+Run from the api directory::
+
+    python -m benchmarks.endpoints --users 200 --requests 2000 --concurrency 32 --output report.json
+    python -m benchmarks.endpoints --baseline benchmarks/baseline.json   # exits 1 on regression
+"""
+import argparse
+import asyncio
+import datetime as dt
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from httpx import ASGITransport, AsyncClient, Response
+
+from benchmarks.standin import Keypair, configure_environment, create_standin_engine
+
+keypair = Keypair()
+configure_environment(keypair)
+
+
+@dataclass
+class Seed:
+    users: list[int]
+    resume_ids: dict[int, int]
+    link_ids: dict[int, list[int]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    send: Callable[[AsyncClient, "Context"], Awaitable[Response]]
+    postgres_only: bool = False
+
+
+@dataclass
+class Context:
+    seed: Seed
+    rng: random.Random
+    tokens: dict[int, str] = field(default_factory=dict)
+    admin_token: str = ""
+    app: Any = None
+
+    def user(self) -> int:
+        return self.rng.choice(self.seed.users)
+
+    def headers(self, user_id: int) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+    def admin_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.admin_token}"}
+
+
+async def seed_database(engine, users: int, sections: int, links: int) -> Seed:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from app.core.base import Base
+    from app.crud.bulk import bulk_insert_returning
+    from app.models import Certificate, Education, Experience, Language, Project, Resume, Skill, SocialLink
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_ids = list(range(1, users + 1))
+    today = dt.date(2024, 1, 1)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        resumes = await bulk_insert_returning(db, Resume, [
+            {
+                "user_id": user_id,
+                "professional_title": "Python Developer",
+                "summary": "Backend engineer working on APIs and data pipelines. " * 4,
+                "location": "Warsaw",
+                "phone": "+48 000 000 000",
+            }
+            for user_id in user_ids
+        ])
+        resume_ids = {row.user_id: row.id for row in resumes}
+
+        section_rows: dict[Any, list[dict[str, Any]]] = {
+            Experience: [], Education: [], Skill: [], Project: [], Certificate: [], Language: [],
+        }
+        for resume_id in resume_ids.values():
+            for i in range(sections):
+                section_rows[Experience].append({
+                    "resume_id": resume_id, "job_title": f"Engineer {i}", "company": "ACME", "start_date": today,
+                    "description": "Designed and shipped services. " * 8,
+                })
+                section_rows[Education].append({"resume_id": resume_id, "school": "University", "start_date": today})
+                section_rows[Skill].append({"resume_id": resume_id, "name": f"skill-{i}", "level": "expert"})
+                section_rows[Project].append({"resume_id": resume_id, "title": f"Project {i}", "description": "x"})
+                section_rows[Certificate].append({
+                    "resume_id": resume_id, "issuer": "Issuer", "name": f"Cert {i}", "link": "https://example.com",
+                })
+                section_rows[Language].append({"resume_id": resume_id, "name": "English", "level": "C1"})
+
+        for model, rows in section_rows.items():
+            await bulk_insert_returning(db, model, rows)
+
+        created_links = await bulk_insert_returning(db, SocialLink, [
+            {"resume_id": resume_id, "user_id": user_id, "platform": f"site-{i}", "url": f"https://site.io/{user_id}/{i}"}
+            for user_id, resume_id in resume_ids.items()
+            for i in range(links)
+        ])
+        await db.commit()
+
+    link_ids: dict[int, list[int]] = {user_id: [] for user_id in user_ids}
+    for row in created_links:
+        link_ids[row.user_id].append(row.id)
+
+    return Seed(users=user_ids, resume_ids=resume_ids, link_ids=link_ids)
+
+
+async def first_event(app: Any, path: str, headers: dict[str, str]) -> Response:
+    """GET an event stream through ASGI directly and disconnect once its first event arrived.
+
+    ``ASGITransport`` only returns after the app finished, which an event stream never does.
+    """
+    requested = False
+    received = asyncio.Event()
+    status_code = 500
+
+    async def receive() -> dict[str, Any]:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await received.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            if message.get("body", b"").startswith(b"event:") or not message.get("more_body", False):
+                received.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 0),
+    }
+    await app(scope, receive, send)
+    return Response(status_code)
+
+
+def scenarios() -> list[Scenario]:
+    imported_ids = itertools.count(10_000_000)
+
+    async def resume_me(client: AsyncClient, ctx: Context) -> Response:
+        return await client.get("/resumes/me", headers=ctx.headers(ctx.user()))
+
+    async def resume_by_id(client: AsyncClient, ctx: Context) -> Response:
+        user_id = ctx.user()
+        return await client.get(f"/resumes/{ctx.seed.resume_ids[user_id]}", headers=ctx.headers(user_id))
+
+    async def resume_not_modified(client: AsyncClient, ctx: Context) -> Response:
+        headers = ctx.headers(ctx.user())
+        first = await client.get("/resumes/me", headers=headers)
+        return await client.get("/resumes/me", headers=headers | {"If-None-Match": first.headers.get("ETag", "")})
+
+    async def resume_put(client: AsyncClient, ctx: Context) -> Response:
+        headers = ctx.headers(ctx.user())
+        current = await client.get("/resumes/me", headers=headers)
+        document = current.json() | {"summary": f"Edited {ctx.rng.random()}"}
+        return await client.put(
+            "/resumes/me", json=document, headers=headers | {"If-Match": current.headers.get("ETag", "")},
+        )
+
+    async def resume_search(client: AsyncClient, ctx: Context) -> Response:
+        params = {"q": "python developer -frontend", "limit": 20}
+        return await client.get("/resumes/search", params=params, headers=ctx.headers(ctx.user()))
+
+    async def resume_filter(client: AsyncClient, ctx: Context) -> Response:
+        params = {"skills": "skill-0 AND (skill-1 OR skill-2)", "limit": 20}
+        return await client.get("/resumes/filter", params=params, headers=ctx.headers(ctx.user()))
+
+    async def match(client: AsyncClient, ctx: Context) -> Response:
+        job = {"job_description": "Python backend engineer building APIs and data pipelines", "top_k": 10}
+        return await client.post("/match", json=job, headers=ctx.headers(ctx.user()))
+
+    async def resume_events(client: AsyncClient, ctx: Context) -> Response:
+        # A stale Last-Event-ID makes the missed change the first event.
+        return await first_event(ctx.app, "/resumes/me/events", ctx.headers(ctx.user()) | {"Last-Event-ID": "stale"})
+
+    async def social_links_list(client: AsyncClient, ctx: Context) -> Response:
+        return await client.get("/social-links/", params={"limit": 50}, headers=ctx.headers(ctx.user()))
+
+    async def social_link_get(client: AsyncClient, ctx: Context) -> Response:
+        user_id = ctx.user()
+        link_id = ctx.rng.choice(ctx.seed.link_ids[user_id])
+        return await client.get(f"/social-links/{link_id}/", headers=ctx.headers(user_id))
+
+    async def social_links_create(client: AsyncClient, ctx: Context) -> Response:
+        links = [{"platform": "bench", "url": f"https://bench.io/{ctx.rng.random()}"} for _ in range(10)]
+        return await client.post("/social-links/", json=links, headers=ctx.headers(ctx.user()))
+
+    async def social_link_patch(client: AsyncClient, ctx: Context) -> Response:
+        user_id = ctx.user()
+        link_id = ctx.rng.choice(ctx.seed.link_ids[user_id])
+        payload = {"platform": "patched", "url": f"https://patched.io/{link_id}"}
+        return await client.patch(f"/social-links/{link_id}/", json=payload, headers=ctx.headers(user_id))
+
+    async def internal_pool(client: AsyncClient, ctx: Context) -> Response:
+        return await client.get("/internal/pool", headers=ctx.admin_headers())
+
+    async def admin_export(client: AsyncClient, ctx: Context) -> Response:
+        return await client.get("/admin/export", headers=ctx.admin_headers())
+
+    async def admin_import(client: AsyncClient, ctx: Context) -> Response:
+        stamp = dt.datetime(2024, 1, 1).isoformat()
+        lines = []
+        for _ in range(10):
+            resume_id = next(imported_ids)
+            lines.append(json.dumps({
+                "id": resume_id, "user_id": resume_id, "created_at": stamp, "updated_at": stamp,
+                "professional_title": "Imported Developer", "location": "Warsaw", "phone": "+48 000 000 000",
+                "skills": [{"id": resume_id, "name": "python", "level": "expert"}],
+            }))
+        headers = ctx.admin_headers() | {"Content-Type": "application/x-ndjson"}
+        return await client.post("/admin/import", content="\n".join(lines) + "\n", headers=headers)
+
+    return [
+        Scenario("GET /resumes/me", resume_me),
+        Scenario("GET /resumes/{id}", resume_by_id),
+        Scenario("GET /resumes/me (If-None-Match)", resume_not_modified),
+        Scenario("GET + PUT /resumes/me (If-Match)", resume_put),
+        Scenario("GET /resumes/search", resume_search, postgres_only=True),
+        Scenario("GET /resumes/filter", resume_filter, postgres_only=True),
+        Scenario("POST /match", match),
+        Scenario("GET /resumes/me/events (first event)", resume_events),
+        Scenario("GET /social-links/", social_links_list),
+        Scenario("GET /social-links/{id}/", social_link_get),
+        Scenario("POST /social-links/ (10 links)", social_links_create),
+        Scenario("PATCH /social-links/{id}/", social_link_patch),
+        Scenario("GET /internal/pool", internal_pool),
+        Scenario("GET /admin/export", admin_export),
+        Scenario("POST /admin/import (10 resumes)", admin_import, postgres_only=True),
+    ]
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: AsyncClient, ctx: Context, scenario: Scenario, requests: int, concurrency: int):
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await scenario.send(client, ctx)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1e3, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1e3, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1e3, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1e3, 3),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        return await run_against(database_url, args)
+
+
+async def run_against(database_url: str, args: argparse.Namespace) -> dict[str, Any]:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from app.core.cache import MemoryCache, NullCache, get_cache
+    from app.core.config import settings
+    from app.core.database import get_db, get_read_db, get_read_session_factory, get_session_factory
+    from app.core.matching import MatchIndex
+    from app.core.metrics import install_query_hooks
+    from app.core.rate_limit import NullRateLimiter, get_rate_limiter
+    from app.crud.matching import refresh_index
+    from app.main import app
+    from app.routers.match import get_match_index
+
+    engine = create_standin_engine(database_url)
+    install_query_hooks(engine.sync_engine)
+    seed = await seed_database(engine, args.users, args.sections, args.links)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    # The refresh task of the lifespan does not run here; build the whole index up front.
+    match_index = MatchIndex(settings.MATCH_VECTOR_DIM)
+    async with session_factory() as db:
+        while await refresh_index(match_index, settings.MATCH_REFRESH_BATCH_SIZE, db):
+            pass
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    cache = MemoryCache() if args.cache == "memory" else NullCache()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_read_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_cache] = lambda: cache
+    app.dependency_overrides[get_match_index] = lambda: match_index
+    # The load generator is one user; measure the endpoints, not the limiter's 429s.
+    app.dependency_overrides[get_rate_limiter] = NullRateLimiter
+
+    ctx = Context(
+        seed=seed,
+        rng=random.Random(args.seed),
+        tokens={user_id: keypair.token(sub=user_id, ttl=3600) for user_id in seed.users},
+        admin_token=keypair.token(sub=0, roles=["admin"], ttl=3600),
+        app=app,
+    )
+
+    results: dict[str, Any] = {}
+    selected = [s for s in scenarios() if not args.only or any(term in s.name for term in args.only)]
+    if engine.dialect.name != "postgresql":
+        for scenario in selected:
+            if scenario.postgres_only:
+                print(f"{scenario.name:<36} skipped, needs PostgreSQL", file=sys.stderr)
+        selected = [s for s in selected if not s.postgres_only]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for scenario in selected:
+            for _ in range(args.warmup):
+                await scenario.send(client, ctx)
+            results[scenario.name] = await run_scenario(client, ctx, scenario, args.requests, args.concurrency)
+            print(f"{scenario.name:<36} {json.dumps(results[scenario.name])}", file=sys.stderr)
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+    return {
+        "meta": {
+            "created_at": dt.datetime.now(dt.UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "cache": args.cache,
+            "users": args.users,
+            "sections": args.sections,
+            "links": args.links,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "endpoints": results,
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Endpoints whose p95 latency or throughput is worse than the baseline by more than ``tolerance``."""
+    regressions = []
+
+    for name, current in report["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if previous is None:
+            continue
+
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms")
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {previous['throughput_rps']} -> {current['throughput_rps']} rps")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP load benchmark for the personal info API")
+    parser.add_argument(
+        "--database-url", help="async SQLAlchemy URL of a THROWAWAY database (default: temporary SQLite file)"
+    )
+    parser.add_argument("--cache", choices=("none", "memory"), default="none")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--sections", type=int, default=3, help="rows per resume section")
+    parser.add_argument("--links", type=int, default=5, help="social links per user")
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per endpoint")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="*", help="run endpoints whose name contains any of these terms")
+    parser.add_argument("--output", type=Path, help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="compare against this report and exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--save-baseline", action="store_true", help="write the report to --baseline")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    rendered = json.dumps(report, indent=2)
+
+    if args.output:
+        args.output.write_text(rendered + "\n")
+    else:
+        print(rendered)
+
+    if args.baseline is None:
+        return
+
+    if args.save_baseline:
+        args.baseline.write_text(rendered + "\n")
+        return
+
+    regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Brute-force ranking cost of ``POST /match`` over an in-memory index of random unit vectors.
+
+Run from the api directory::
+
+    python -m benchmarks.matching --resumes 100000 --dim 256 --top-k 10
+"""
+import argparse
+import os
+import time
+
+for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_HOST", "JWT_PUBLIC_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+import numpy as np  # noqa: E402
+
+from app.core.matching import MatchIndex, vectorize  # noqa: E402
+
+JOB_DESCRIPTION = """
+Senior Python developer to build async REST APIs with FastAPI, SQLAlchemy and PostgreSQL. Experience with Docker,
+Kubernetes and CI/CD pipelines, caching with Redis and observability is a plus.
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=65_536)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.resumes, args.dim), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    index = MatchIndex(args.dim)
+    index.replace(range(1, args.resumes + 1), vectors)
+
+    start = time.perf_counter()
+    query = vectorize(JOB_DESCRIPTION, args.dim)
+    vectorize_ms = (time.perf_counter() - start) * 1e3
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        index.top_k(query, args.top_k, args.batch_size)
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    timings.sort()
+    print(f"index: {args.resumes} x {args.dim} float32 = {index.matrix.nbytes / 2 ** 20:.1f} MiB")
+    print(f"vectorize job description: {vectorize_ms:.3f} ms")
+    print(f"top-{args.top_k}: median {timings[len(timings) // 2]:.2f} ms, max {timings[-1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
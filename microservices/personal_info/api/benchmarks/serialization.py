@@ -0,0 +1,68 @@
+"""Per-item cost of serializing social links: validated FastAPI path vs trusted path.
+
+Run from the api directory::
+
+    python -m benchmarks.serialization --items 1000
+"""
+import argparse
+import json
+import os
+import timeit
+
+for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_HOST", "JWT_PUBLIC_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+import orjson  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.core.serialization import trusted_dump_many  # noqa: E402
+from app.models import SocialLink  # noqa: E402
+from app.schemas.social_link import SocialLinkOut  # noqa: E402
+
+response_adapter = TypeAdapter(list[SocialLinkOut])
+
+
+def make_links(count: int) -> list[SocialLink]:
+    return [
+        SocialLink(id=i, resume_id=1, user_id=1, platform="github", url=f"https://github.com/user-{i}")
+        for i in range(count)
+    ]
+
+
+def fastapi_response(items: list) -> bytes:
+    # What FastAPI does with a response_model: validate, dump in JSON mode, then json.dumps.
+    validated = response_adapter.validate_python(items, from_attributes=True)
+    content = response_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def validated_twice(links: list[SocialLink]) -> bytes:
+    # The old add_social_links path: model_validate in the handler, then the response_model pass.
+    return fastapi_response([SocialLinkOut.model_validate(link, from_attributes=True) for link in links])
+
+
+def validated_once(links: list[SocialLink]) -> bytes:
+    return fastapi_response(links)
+
+
+def trusted(links: list[SocialLink]) -> bytes:
+    return orjson.dumps(trusted_dump_many(SocialLinkOut, links))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    links = make_links(args.items)
+    assert orjson.loads(trusted(links)) == orjson.loads(validated_once(links))
+
+    for label, func in (("validated twice", validated_twice), ("validated once", validated_once), ("trusted", trusted)):
+        best = min(timeit.repeat(lambda func=func: func(links), repeat=args.repeat, number=args.number)) / args.number
+        print(f"{label:>16}: {best * 1e3:8.3f} ms per {args.items} items, {best / args.items * 1e6:6.3f} us per item")
+
+
+if __name__ == "__main__":
+    main()
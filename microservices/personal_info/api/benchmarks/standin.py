@@ -0,0 +1,68 @@
+"""Local stand-ins for the service's external dependencies.
+
+The auth service's RS256 keypair is generated on the fly, and PostgreSQL can be
+replaced by in-memory SQLite for anything that does not rely on Postgres-only SQL.
+Importing this module registers the SQLite compilation shims.
+"""
+import os
+import time
+
+import rsa
+from jose import jwt
+from sqlalchemy import ARRAY
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.functions import now
+
+SQLITE_MEMORY_URL = "sqlite+aiosqlite://"
+
+
+@compiles(ARRAY, "sqlite")
+@compiles(postgresql.ARRAY, "sqlite")
+def _compile_array_for_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@compiles(TSVECTOR, "sqlite")
+def _compile_tsvector_for_sqlite(type_, compiler, **kw):
+    return "TEXT"
+
+
+@compiles(now, "sqlite")
+def _compile_now_for_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP has one-second resolution, too coarse for updated_at based versions.
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+class Keypair:
+    """RS256 keypair that mints access tokens the API accepts."""
+
+    def __init__(self, bits: int = 2048) -> None:
+        public_key, private_key = rsa.newkeys(bits)
+        self.public_pem = public_key.save_pkcs1("PEM").decode()
+        self.private_pem = private_key.save_pkcs1("PEM").decode()
+
+    def token(self, sub: int = 1, roles: list[str] | None = None, ttl: int = 300) -> str:
+        issued_at = int(time.time())
+        claims = {"sub": str(sub), "iat": issued_at, "exp": issued_at + ttl, "roles": roles or ["user"]}
+        return jwt.encode(claims, self.private_pem, algorithm="RS256")
+
+
+def configure_environment(keypair: Keypair) -> None:
+    """Fill the settings the app needs at import time, keeping anything already set."""
+    os.environ.setdefault("POSTGRES_USER", "standin")
+    os.environ.setdefault("POSTGRES_PASSWORD", "standin")
+    os.environ.setdefault("POSTGRES_DB", "standin")
+    os.environ.setdefault("POSTGRES_HOST", "localhost")
+    os.environ.setdefault("JWT_PUBLIC_KEY", keypair.public_pem)
+
+
+def create_standin_engine(url: str | None = None) -> AsyncEngine:
+    """Engine for ``url``, or a shared in-memory SQLite database when no URL is given."""
+    if url is None or url == SQLITE_MEMORY_URL:
+        return create_async_engine(SQLITE_MEMORY_URL, poolclass=StaticPool)
+
+    return create_async_engine(url)
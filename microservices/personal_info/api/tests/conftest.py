@@ -0,0 +1,83 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks.standin import Keypair, configure_environment, create_standin_engine
+
+keypair = Keypair()
+configure_environment(keypair)
+
+
+@pytest.fixture
+def token_factory():
+    return keypair.token
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine():
+    from app.core.base import Base
+    from app.core.metrics import install_query_hooks
+    from app.core.slow_query import slow_query_log
+    import app.models  # noqa: F401
+
+    engine = create_standin_engine()
+    install_query_hooks(engine.sync_engine)
+    slow_query_log.install(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(engine):
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    executed: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+async def client(engine):
+    from app.core.cache import MemoryCache, get_cache
+    from app.core.database import get_db, get_read_db, get_read_session_factory, get_session_factory
+    from app.core.rate_limit import MemoryRateLimiter, get_rate_limiter
+    from app.main import app
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_read_session_factory] = lambda: session_factory
+    cache = MemoryCache()
+    app.dependency_overrides[get_cache] = lambda: cache
+    limiter = MemoryRateLimiter()
+    app.dependency_overrides[get_rate_limiter] = lambda: limiter
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+    app.dependency_overrides.clear()
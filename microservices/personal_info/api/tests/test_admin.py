@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from app.core.pagination import ndjson_lines
+from app.models import ImportCheckpoint, Resume, Skill, SocialLink
+
+pytestmark = pytest.mark.anyio
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_ndjson_lines_reassembles_split_chunks():
+    lines = [line async for line in ndjson_lines(_chunks(b'{"a":', b'1}\n{"b"', b":2}\n\n", b'{"c":3}'))]
+
+    assert lines == [b'{"a":1}', b'{"b":2}', b"", b'{"c":3}']
+
+
+async def test_export_streams_full_resumes(client, db, token_factory):
+    for user_id in (1, 2):
+        resume = Resume(user_id=user_id, professional_title=f"Dev {user_id}", summary="s", location="l", phone="1")
+        db.add(resume)
+        await db.flush()
+        db.add(Skill(resume_id=resume.id, name="python"))
+    await db.commit()
+
+    response = await client.get("/admin/export", headers={"Authorization": f"Bearer {token_factory(roles=['admin'])}"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    resumes = [json.loads(line) for line in response.text.splitlines()]
+    assert [resume["user_id"] for resume in resumes] == [1, 2]
+    assert resumes[0]["skills"][0]["name"] == "python"
+
+
+def test_export_carries_every_stored_section_column():
+    from typing import get_args
+
+    from app.crud.resume import TRANSFER_COLUMNS
+    from app.schemas.resume import ResumeExport, ResumeOut
+
+    assert list(ResumeExport.model_fields) == list(ResumeOut.model_fields)
+    for name, columns in TRANSFER_COLUMNS.items():
+        (item,) = get_args(ResumeExport.model_fields[name].annotation)
+        assert set(columns) <= set(item.model_fields), name
+    assert "description" in TRANSFER_COLUMNS["social_links"]
+
+
+async def test_export_round_trips_social_link_description(client, db, token_factory):
+    from app.crud.transfer import ImportBatch
+    from app.schemas.resume import ResumeExport
+
+    resume = Resume(user_id=1, location="l", phone="1")
+    db.add(resume)
+    await db.flush()
+    db.add(SocialLink(resume_id=resume.id, user_id=1, platform="blog", url="https://blog.me", description="Notes"))
+    await db.commit()
+
+    response = await client.get("/admin/export", headers={"Authorization": f"Bearer {token_factory(roles=['admin'])}"})
+    batch = ImportBatch()
+    batch.add(ResumeExport.model_validate_json(response.text.splitlines()[0]))
+
+    assert json.loads(response.text)["social_links"][0]["description"] == "Notes"
+    assert batch.sections["social_links"] == [(resume.id, "https://blog.me/", "blog", "Notes")]
+
+
+async def test_transfer_requires_admin(client, token_factory):
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+
+    assert (await client.get("/admin/export", headers=headers)).status_code == 403
+    assert (await client.post("/admin/import", content=b"", headers=headers)).status_code == 403
+
+
+async def test_import_rejects_invalid_line(client, token_factory):
+    response = await client.post(
+        "/admin/import", content=b'{"user_id": "x"}\n',
+        headers={"Authorization": f"Bearer {token_factory(roles=['admin'])}"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid resume on line 1:")
+
+
+async def test_completed_import_is_not_replayed(client, db, token_factory):
+    db.add(ImportCheckpoint(import_id="done", lines=3, resumes_imported=2, resumes_skipped=1))
+    await db.commit()
+    headers = {"Authorization": f"Bearer {token_factory(roles=['admin'])}"}
+
+    first = await client.post("/admin/import?import_id=done", content=b"", headers=headers)
+    replay = await client.post("/admin/import?import_id=done", content=b"not json\n", headers=headers)
+    progress = await client.get("/admin/import/done", headers=headers)
+
+    assert first.status_code == replay.status_code == 200
+    assert replay.json()["lines"] == 3 and replay.json()["completed_at"] is not None
+    assert progress.json() == replay.json()
+    assert (await client.get("/admin/import/missing", headers=headers)).status_code == 404
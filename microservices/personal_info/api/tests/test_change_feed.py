@@ -0,0 +1,169 @@
+import asyncio
+import contextlib
+import datetime as dt
+
+import pytest
+
+from app.core.cache import MemoryCache, social_links_cache_key, user_resume_cache_key
+from app.core.change_feed import ChangeFeed, ResumeChange, cache_invalidator, resume_events
+from app.core.etag import resume_etag
+
+pytestmark = pytest.mark.anyio
+
+UPDATED_AT = dt.datetime(2026, 10, 18, 12, 30, 5, 123456)
+
+
+def _feed(**kwargs) -> ChangeFeed:
+    return ChangeFeed("postgresql://standin", **{
+        "keepalive_interval": 0.01, "reconnect_interval": 0, "backfill_margin": 60, **kwargs
+    })
+
+
+def test_payloads():
+    resume = ResumeChange.loads("3:7:resumes:UPDATE:20261018123005123456")
+    section = ResumeChange.loads("3:7:skills:DELETE:")
+
+    assert resume == ResumeChange(3, 7, "resumes", "UPDATE", UPDATED_AT)
+    assert resume.etag == resume_etag(3, UPDATED_AT)
+    assert section.updated_at is None and section.etag is None
+    with pytest.raises(ValueError):
+        ResumeChange.loads("3:7")
+
+
+async def test_dispatch_invalidates_cache_despite_failing_subscribers():
+    feed, cache = _feed(), MemoryCache()
+    await cache.set(user_resume_cache_key(7), b"x", 60)
+    await cache.set(social_links_cache_key(7), b"x", 60)
+
+    async def broken(change):
+        raise RuntimeError
+
+    feed.subscribe(broken)
+    feed.subscribe(cache_invalidator(cache))
+    await feed.dispatch(ResumeChange(3, 7, "skills", "INSERT"))
+
+    assert await cache.get(user_resume_cache_key(7)) is None
+    assert await cache.get(social_links_cache_key(7)) is None
+
+
+async def test_events_replay_missed_version_and_collect_sections():
+    feed = _feed()
+    events = resume_events(feed, 7, (3, UPDATED_AT), last_event_id='"r3.stale"', keepalive_interval=0.01)
+
+    assert await anext(events) == b"retry: 3000\n\n"
+    missed = await anext(events)
+    assert missed.startswith(f"event: change\nid: {resume_etag(3, UPDATED_AT)}\n".encode())
+    assert await anext(events) == b": keepalive\n\n"
+
+    later = UPDATED_AT + dt.timedelta(seconds=1)
+    pending = asyncio.ensure_future(anext(events))
+    await asyncio.sleep(0)
+    for change in (
+            ResumeChange(3, 7, "skills", "INSERT"),
+            ResumeChange(4, 8, "resumes", "UPDATE", later),
+            ResumeChange(3, 7, "social_link", "DELETE"),
+            ResumeChange(3, 7, "resumes", "UPDATE", later),
+    ):
+        await feed.dispatch(change)
+
+    assert await pending == (
+        f"event: change\nid: {resume_etag(3, later)}\n".encode()
+        + b'data: {"resume_id":3,"sections":["skills","social_link"]}\n\n'
+    )
+    await events.aclose()
+    assert feed.subscribers == []
+
+
+async def test_events_skip_replay_when_client_is_current():
+    feed = _feed()
+    events = resume_events(feed, 7, (3, UPDATED_AT), resume_etag(3, UPDATED_AT), keepalive_interval=0.01)
+
+    await anext(events)
+    assert await anext(events) == b": keepalive\n\n"
+    await events.aclose()
+
+
+async def test_events_end_when_the_worker_drains(monkeypatch):
+    from app.core.warmup import readiness
+
+    monkeypatch.setattr(readiness, "state", "ready")
+    feed = _feed()
+    events = resume_events(feed, 7, None, None, keepalive_interval=60)
+    await anext(events)
+
+    pending = asyncio.ensure_future(anext(events))
+    await asyncio.sleep(0)
+    readiness.drain()
+
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(pending, 2)
+    assert feed.subscribers == []
+
+
+class Connection:
+    def __init__(self, keepalives: list[dt.datetime], backfill: list[tuple]) -> None:
+        self.keepalives = keepalives
+        self.backfill = backfill
+        self.backfilled_since = None
+        self.terminated = False
+        self.listener = None
+
+    async def add_listener(self, channel, callback):
+        self.listener = callback
+
+    async def fetchval(self, query, timeout=None):
+        if not self.keepalives:
+            raise ConnectionResetError("connection lost")
+        return self.keepalives.pop(0)
+
+    async def fetch(self, query, since, timeout=None):
+        self.backfilled_since = since
+        return self.backfill
+
+    def terminate(self):
+        self.terminated = True
+
+
+async def test_reconnect_backfills_changes_missed_while_disconnected(monkeypatch):
+    first = Connection([UPDATED_AT], [])
+    second = Connection([UPDATED_AT, UPDATED_AT], [(3, 7, "20261018123010000000")])
+    connections = iter([first, second])
+
+    async def connect(dsn, timeout=None):
+        return next(connections)
+
+    monkeypatch.setattr("asyncpg.connect", connect)
+    feed = _feed()
+    received = []
+
+    async def subscriber(change):
+        received.append(change)
+
+    feed.subscribe(subscriber)
+    running = asyncio.create_task(feed.run())
+    while second.listener is None:
+        await asyncio.sleep(0.01)
+    second.listener(second, 1, "resume_changes", "4:8:projects:UPDATE:")
+    while len(received) < 2:
+        await asyncio.sleep(0.01)
+    running.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await running
+
+    assert first.terminated and second.terminated
+    assert second.backfilled_since == UPDATED_AT - dt.timedelta(seconds=60)
+    assert received == [
+        ResumeChange(3, 7, "resumes", "UPDATE", dt.datetime(2026, 10, 18, 12, 30, 10)),
+        ResumeChange(4, 8, "projects", "UPDATE"),
+    ]
+    assert feed.stats()["backfilled"] == 1
+
+
+async def test_events_endpoint_needs_the_change_feed(client, token_factory, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "CHANGE_FEED_ENABLED", False)
+    response = await client.get("/resumes/me/events", headers={"Authorization": f"Bearer {token_factory()}"})
+
+    assert response.status_code == 503
+    assert (await client.get("/resumes/me/events")).status_code == 401
@@ -0,0 +1,144 @@
+import pytest
+
+from app.core.cache import NullCache, get_cache
+from app.core.etag import match, none_match
+from app.main import app
+from app.models import Resume, SocialLink
+
+pytestmark = pytest.mark.anyio
+
+
+async def _resume_with_link(db, user_id: int) -> SocialLink:
+    resume = Resume(user_id=user_id, location="Warsaw", phone="123")
+    db.add(resume)
+    await db.flush()
+    link = SocialLink(resume_id=resume.id, user_id=user_id, platform="github", url="https://github.com/me")
+    db.add(link)
+    await db.commit()
+    return link
+
+
+def test_etag_comparison():
+    assert none_match('W/"r1.1", "r1.2"', '"r1.1"')
+    assert none_match("*", '"r1.1"')
+    assert not none_match(None, '"r1.1"')
+    assert match(None, '"r1.1"')
+    assert not match('W/"r1.1"', '"r1.1"')
+
+
+async def test_resume_not_modified(client, db, token_factory):
+    await _resume_with_link(db, user_id=1)
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+
+    first = await client.get("/resumes/me", headers=headers)
+    second = await client.get("/resumes/me", headers=headers | {"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 304
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.content == b""
+
+
+async def test_not_modified_without_cache_runs_only_version_query(client, db, statements, token_factory):
+    await _resume_with_link(db, user_id=1)
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+    app.dependency_overrides[get_cache] = NullCache
+    etag = (await client.get("/resumes/me", headers=headers)).headers["ETag"]
+    statements.clear()
+
+    response = await client.get("/resumes/me", headers=headers | {"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+
+
+async def test_social_links_etag_changes_after_write(client, db, token_factory):
+    await _resume_with_link(db, user_id=1)
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+
+    before = (await client.get("/social-links/", headers=headers)).headers["ETag"]
+    await client.post("/social-links/", json=[{"platform": "blog", "url": "https://blog.me"}], headers=headers)
+    after = await client.get("/social-links/", headers=headers | {"If-None-Match": before})
+
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before
+    assert len(after.json()["items"]) == 2
+
+
+async def test_patch_honors_if_match(client, db, token_factory):
+    link = await _resume_with_link(db, user_id=1)
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+    url = f"/social-links/{link.id}/"
+    payload = {"platform": "gitlab", "url": "https://gitlab.com/me"}
+    etag = (await client.get(url, headers=headers)).headers["ETag"]
+
+    updated = await client.patch(url, json=payload, headers=headers | {"If-Match": etag})
+    stale = await client.patch(url, json=payload, headers=headers | {"If-Match": etag})
+
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] != etag
+    assert stale.status_code == 412
+
+
+async def test_delete_honors_if_match(client, db, token_factory):
+    link = await _resume_with_link(db, user_id=1)
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+
+    response = await client.delete(f"/social-links/{link.id}/", headers=headers | {"If-Match": '"s0.0"'})
+
+    assert response.status_code == 412
+
+
+async def test_put_honors_if_match(client, db, token_factory):
+    await _resume_with_link(db, user_id=1)
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+    read = await client.get("/resumes/me", headers=headers)
+    etag, document = read.headers["ETag"], read.json()
+
+    unchanged = await client.put("/resumes/me", json=document, headers=headers | {"If-Match": etag})
+    updated = await client.put("/resumes/me", json={**document, "phone": "456"}, headers=headers | {"If-Match": etag})
+    stale = await client.put("/resumes/me", json=document, headers=headers | {"If-Match": etag})
+    missing = await client.put(
+        "/resumes/me", json=document, headers={"Authorization": f"Bearer {token_factory(sub=2)}", "If-Match": "*"}
+    )
+
+    assert unchanged.status_code == 200
+    assert unchanged.headers["ETag"] == etag
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] not in (etag, None)
+    assert updated.headers["ETag"] == (await client.get("/resumes/me", headers=headers)).headers["ETag"]
+    assert stale.status_code == 412
+    assert missing.status_code == 412
+
+
+async def test_entries_loaded_from_a_replica_expire_within_the_lag_threshold(client, engine, db, token_factory):
+    import time
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from app.core.cache import user_resume_cache_key
+    from app.core.config import settings
+    from app.core.database import get_read_db
+    from app.core.replicas import Replica
+
+    await _resume_with_link(db, user_id=1)
+    replica = Replica("replica-0", engine)
+    primary = async_sessionmaker(engine, expire_on_commit=False)
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+    cache = app.dependency_overrides[get_cache]()
+
+    def read_from(session_factory):
+        async def get_session():
+            async with session_factory() as session:
+                yield session
+        return get_session
+
+    app.dependency_overrides[get_read_db] = read_from(replica.session_factory)
+    await client.get("/resumes/me", headers=headers)
+    expires_at, _ = cache._data[user_resume_cache_key(1)]
+    assert expires_at - time.monotonic() <= settings.DB_REPLICA_MAX_LAG
+
+    await cache.delete(user_resume_cache_key(1))
+    app.dependency_overrides[get_read_db] = read_from(primary)
+    await client.get("/resumes/me", headers=headers)
+    expires_at, _ = cache._data[user_resume_cache_key(1)]
+    assert expires_at - time.monotonic() > settings.DB_REPLICA_MAX_LAG
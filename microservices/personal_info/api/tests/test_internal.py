@@ -0,0 +1,151 @@
+import time
+
+import pytest
+
+from app.core.metrics import Histogram
+
+pytestmark = pytest.mark.anyio
+
+
+def test_histogram_cumulative_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+
+
+async def test_pool_status_requires_admin(client, token_factory):
+    response = await client.get("/internal/pool", headers={"Authorization": f"Bearer {token_factory()}"})
+
+    assert response.status_code == 403
+
+
+async def test_pool_status(client, token_factory):
+    response = await client.get(
+        "/internal/pool", headers={"Authorization": f"Bearer {token_factory(roles=['admin'])}"}
+    )
+
+    assert response.status_code == 200
+    assert {"size", "checked_out", "overflow", "waiting", "wait_seconds"} <= response.json().keys()
+
+
+async def test_metrics_exposes_route_latency_and_statement_counts(client, token_factory):
+    await client.get("/resumes/me", headers={"Authorization": f"Bearer {token_factory(sub=41)}"})
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/resumes/me",status="404"}' in response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/resumes/me"}' in response.text
+    assert 'http_request_db_statements_bucket{method="GET",route="/resumes/me",le="1"}' in response.text
+    assert "jwt_verification_seconds_count" in response.text
+    assert "db_pool_checked_out 0" in response.text
+
+
+async def test_server_timing_header(client, token_factory, monkeypatch):
+    from app.core.config import settings
+
+    headers = {"Authorization": f"Bearer {token_factory(sub=42)}"}
+    assert "Server-Timing" not in (await client.get("/resumes/me", headers=headers)).headers
+
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", True)
+    response = await client.get("/resumes/me", headers=headers)
+
+    assert 'desc="1 statements"' in response.headers["Server-Timing"]
+    assert "auth;dur=" in response.headers["Server-Timing"]
+
+
+def test_normalize_sql_collapses_literals_and_parameter_lists():
+    from app.core.slow_query import normalize_sql
+
+    statement = "SELECT *\n  FROM social_link WHERE user_id = 7 AND platform = 'git''hub' AND id IN ($1, $2, $3)"
+
+    assert normalize_sql(statement) == "SELECT * FROM social_link WHERE user_id = ? AND platform = ? AND id IN (...)"
+
+
+async def test_slow_queries_are_recorded_with_route_and_redacted_parameters(client, token_factory, monkeypatch):
+    from app.core.slow_query import slow_query_log
+
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0.0)
+    monkeypatch.setattr(slow_query_log, "entries", type(slow_query_log.entries)(maxlen=10))
+
+    await client.get("/resumes/me", headers={"Authorization": f"Bearer {token_factory(sub=43)}"})
+    response = await client.get(
+        "/internal/slow-queries", headers={"Authorization": f"Bearer {token_factory(roles=['admin'])}"}
+    )
+
+    assert response.status_code == 200
+    entry = response.json()[0]
+    assert entry["route"] == "/resumes/me"
+    assert entry["statement"].startswith("SELECT resumes.id")
+    assert entry["parameters"] == ["<int>"]
+    assert entry["plan"] is None
+
+
+def test_only_plain_selects_are_explained_with_analyze():
+    from app.core.slow_query import explain_options
+
+    assert explain_options("SELECT resumes.id FROM resumes WHERE resumes.user_id = $1").startswith("ANALYZE")
+    for statement in (
+        "SELECT resumes.updated_at FROM resumes WHERE resumes.id = $1 FOR UPDATE OF resumes",
+        "select id from resumes for share",
+        "WITH moved AS (DELETE FROM skills RETURNING *) SELECT count(*) FROM moved",
+        "UPDATE resumes SET updated_at=now() WHERE resumes.id = $1",
+    ):
+        assert explain_options(statement) == "FORMAT JSON"
+
+
+async def test_explain_runs_outside_the_request_context(client, token_factory, monkeypatch):
+    from app.core.metrics import current_timings
+    from app.core.slow_query import slow_query_log
+
+    seen = []
+
+    async def explain(engine, statement, parameters, entry):
+        seen.append(current_timings.get())
+
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0.0)
+    monkeypatch.setattr(slow_query_log, "entries", type(slow_query_log.entries)(maxlen=10))
+    monkeypatch.setattr(slow_query_log, "_should_explain", lambda *args: True)
+    monkeypatch.setattr(slow_query_log, "_explain", explain)
+
+    await client.get("/resumes/me", headers={"Authorization": f"Bearer {token_factory(sub=43)}"})
+    await slow_query_log._explaining
+
+    assert seen == [None]
+
+
+async def test_pool_wait_counts_only_time_blocked_on_a_full_pool(tmp_path):
+    import asyncio
+
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.core.pool import InstrumentedAsyncQueuePool, instrumented_pool
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedAsyncQueuePool, pool_size=1,
+        max_overflow=0, pool_pre_ping=True,
+    )
+    pool = instrumented_pool(engine)
+    # Opening a connection is slow, but nobody queues for it.
+    event.listen(engine.sync_engine, "connect", lambda *args: time.sleep(0.05))
+
+    async with engine.connect():
+        assert pool.wait_seconds.snapshot()["sum"] < 0.01
+
+        blocked = asyncio.create_task(engine.connect().__aenter__())
+        await asyncio.sleep(0.05)
+        assert pool.waiting == 1
+
+    await (await blocked).close()
+    snapshot = pool.wait_seconds.snapshot()
+    assert snapshot["count"] == 2
+    assert 0.04 <= snapshot["sum"] < 0.5
+    assert pool.waiting == 0
+    await engine.dispose()
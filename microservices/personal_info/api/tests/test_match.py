@@ -0,0 +1,157 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+from sqlalchemy import delete, update
+
+from app.core.change_feed import ResumeChange
+from app.core.matching import MatchIndex, features, vectorize
+from app.crud.matching import prune_deleted, refresh_index
+from app.models import Experience, Resume, ResumeVector, Skill
+
+pytestmark = pytest.mark.anyio
+
+
+def test_features_keep_tech_tokens_and_add_bigrams():
+    assert features("The C++ and Node.js developer") == ["c++", "node.js", "developer", "c++ node.js",
+                                                         "node.js developer"]
+
+
+def test_vectors_are_unit_float32():
+    vector = vectorize("python fastapi postgresql", 64)
+
+    assert vector.dtype == np.float32
+    assert np.linalg.norm(vector) == pytest.approx(1.0)
+    assert not vectorize("the and of", 64).any()
+
+
+def test_top_k_across_batches():
+    index = MatchIndex(4)
+    index.replace([10, 11, 12, 13, 14], np.eye(5, 4, dtype=np.float32))
+    index.upsert([13, 15], np.array([[0.6, 0.8, 0, 0], [0, 0, 0, 1]], dtype=np.float32))
+
+    ranked = index.top_k(np.array([1, 0, 0, 0], dtype=np.float32), 2, batch_size=2)
+
+    assert [resume_id for resume_id, _ in ranked] == [10, 13]
+    assert [score for _, score in ranked] == pytest.approx([1.0, 0.6])
+    assert index.top_k(np.array([0, 0, 0, 1], dtype=np.float32), 1, 4) == [(15, 1.0)]
+
+
+def test_removed_rows_are_skipped_until_compacted():
+    index = MatchIndex(4)
+    index.replace([10, 11, 12, 13, 14], np.eye(5, 4, dtype=np.float32))
+    query = np.array([1, 0.5, 0.3, 0.2], dtype=np.float32)
+
+    index.remove([10, 99])
+
+    assert len(index) == 4
+    assert len(index.ids) == 5
+    assert [resume_id for resume_id, _ in index.top_k(query, 5, batch_size=2)] == [11, 12, 13, 14]
+
+    index.remove([11])
+
+    assert list(index.ids) == [12, 13, 14]
+    assert [resume_id for resume_id, _ in index.top_k(query, 1, batch_size=2)] == [12]
+
+
+async def test_change_feed_deletes_prune_the_index():
+    index = MatchIndex(4)
+    index.replace([1, 2], np.eye(2, 4, dtype=np.float32))
+    prune = prune_deleted(index)
+
+    await prune(ResumeChange(1, 7, "skills", "DELETE"))
+    await prune(ResumeChange(2, 8, "resumes", "UPDATE"))
+    assert len(index) == 2
+
+    await prune(ResumeChange(1, 7, "resumes", "DELETE"))
+    assert list(index.rows) == [2]
+
+
+@pytest.fixture
+def match_index():
+    from app.core.config import settings
+    from app.main import app
+    from app.routers.match import get_match_index
+
+    index = MatchIndex(settings.MATCH_VECTOR_DIM)
+    app.dependency_overrides[get_match_index] = lambda: index
+    return index
+
+
+async def _seed(db, user_id: int, title: str, summary: str, skills: list[str]) -> Resume:
+    resume = Resume(user_id=user_id, professional_title=title, summary=summary, location="Warsaw", phone="1")
+    db.add(resume)
+    await db.flush()
+    db.add(Experience(resume_id=resume.id, job_title=title, company="ACME", start_date=dt.date(2020, 1, 1),
+                      description=summary))
+    db.add_all(Skill(resume_id=resume.id, name=name) for name in skills)
+    await db.commit()
+    return resume
+
+
+
+async def test_match_ranks_resumes_and_refresh_picks_up_changed_ones(client, db, token_factory, match_index):
+    backend = (await _seed(db, 1, "Python Developer", "Async APIs with FastAPI and PostgreSQL", ["python"])).id
+    frontend = (await _seed(db, 2, "Frontend Developer", "React and TypeScript single page apps", ["react"])).id
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+    job = {"job_description": "Python backend engineer, FastAPI, PostgreSQL", "top_k": 2}
+    assert await refresh_index(match_index, 500, db) == 2
+
+    response = await client.post("/match", json=job, headers=headers)
+
+    assert response.status_code == 200
+    assert [hit["id"] for hit in response.json()] == [backend, frontend]
+    assert response.json()[0]["score"] > response.json()[1]["score"]
+    assert len(match_index) == 2
+    frontend_score = response.json()[1]["score"]
+
+    await db.execute(update(Resume).where(Resume.id == frontend).values(
+        summary="Python, FastAPI and PostgreSQL backend services", updated_at=dt.datetime(2100, 1, 1),
+    ))
+    await db.commit()
+    stored = await db.get(ResumeVector, frontend)
+    old_vector = stored.vector
+
+    response = await client.post("/match", json=job, headers=headers)
+
+    db.expire_all()
+    assert (await db.get(ResumeVector, frontend)).vector == old_vector
+    assert {hit["id"]: hit["score"] for hit in response.json()}[frontend] == frontend_score
+
+    assert await refresh_index(match_index, 500, db) == 1
+    response = await client.post("/match", json=job, headers=headers)
+
+    db.expire_all()
+    assert (await db.get(ResumeVector, frontend)).vector != old_vector
+    assert {hit["id"]: hit["score"] for hit in response.json()}[frontend] > frontend_score
+
+
+async def test_refresh_recomputes_one_batch_per_tick(db, match_index):
+    for user_id in range(1, 4):
+        await _seed(db, user_id, "Python Developer", "FastAPI", ["python"])
+
+    assert await refresh_index(match_index, 2, db) == 2
+    assert len(match_index) == 2
+    assert await refresh_index(match_index, 2, db) == 1
+    assert await refresh_index(match_index, 2, db) == 0
+    assert len(match_index) == 3
+
+
+async def test_match_drops_deleted_resumes_and_still_fills_top_k(client, db, token_factory, match_index):
+    ids = [(await _seed(db, user_id, "Python Developer", "FastAPI " * user_id, ["python"])).id for user_id in (1, 2, 3)]
+    await refresh_index(match_index, 500, db)
+    await db.execute(delete(Resume).where(Resume.id == ids[0]))
+    await db.commit()
+    job = {"job_description": "Python developer, FastAPI", "top_k": 2}
+
+    response = await client.post("/match", json=job, headers={"Authorization": f"Bearer {token_factory()}"})
+
+    assert response.status_code == 200
+    assert sorted(hit["id"] for hit in response.json()) == ids[1:]
+    assert len(match_index) == 2
+
+
+async def test_match_requires_token(client):
+    response = await client.post("/match", json={"job_description": "python"})
+
+    assert response.status_code == 401
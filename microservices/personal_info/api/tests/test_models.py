@@ -0,0 +1,25 @@
+from app.core.base import Base
+import app.models  # noqa: F401
+
+
+def _is_indexed(table, columns: list[str]) -> bool:
+    candidates = [list(table.primary_key.columns.keys())]
+    candidates += [[column.name for column in index.columns] for index in table.indexes]
+    return any(candidate[:len(columns)] == columns for candidate in candidates)
+
+
+def test_every_foreign_key_is_indexed():
+    missing = [
+        f"{table.name}({', '.join(constraint.column_keys)})"
+        for table in Base.metadata.sorted_tables
+        for constraint in table.foreign_key_constraints
+        if not _is_indexed(table, constraint.column_keys)
+    ]
+
+    assert not missing, f"Foreign keys without a leading index: {missing}"
+
+
+def test_one_resume_per_user():
+    resumes = Base.metadata.tables["resumes"]
+
+    assert any(index.unique and [c.name for c in index.columns] == ["user_id"] for index in resumes.indexes)
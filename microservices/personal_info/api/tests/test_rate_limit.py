@@ -0,0 +1,138 @@
+import pytest
+
+from app.core.admission import LoadShedder
+from app.core.rate_limit import Limit, MemoryRateLimiter, get_rate_limiter, parse_route_limits
+from app.models import Resume
+
+
+def test_parse_route_limits():
+    limits = parse_route_limits("POST /social-links/=120/60, PUT  /resumes/me=1/2")
+
+    assert limits == {"POST /social-links/": Limit(rate=2.0, burst=120), "PUT /resumes/me": Limit(rate=0.5, burst=1)}
+    with pytest.raises(ValueError):
+        Limit.parse("fast")
+
+
+@pytest.mark.anyio
+async def test_memory_bucket_refills_over_time(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("app.core.rate_limit.time.monotonic", lambda: now)
+    limiter = MemoryRateLimiter()
+    limit = Limit(rate=1.0, burst=2)
+
+    assert [await limiter.acquire("k", limit) for _ in range(3)] == [0, 0, 1.0]
+    assert await limiter.acquire("other", limit) == 0
+
+    now += 1.5
+    assert await limiter.acquire("k", limit) == 0
+    assert await limiter.acquire("k", limit) == pytest.approx(0.5)
+
+
+@pytest.mark.anyio
+async def test_rate_limit_per_user_and_route(client, token_factory, monkeypatch):
+    monkeypatch.setattr("app.core.rate_limit.route_limits", lambda: (Limit(rate=0.1, burst=2), {}))
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+
+    statuses = [(await client.get("/social-links/", headers=headers)).status_code for _ in range(2)]
+    limited = await client.get("/social-links/", headers=headers)
+
+    assert statuses == [200, 200]
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "10"
+    other_user = await client.get("/social-links/", headers={"Authorization": f"Bearer {token_factory(sub=2)}"})
+    assert other_user.status_code == 200
+    assert (await client.get("/resumes/me", headers=headers)).status_code == 404
+
+
+@pytest.mark.anyio
+async def test_bulk_social_links_cost_a_token_per_link(client, db, token_factory, monkeypatch):
+    monkeypatch.setattr(
+        "app.core.rate_limit.route_limits", lambda: (Limit(rate=1.0, burst=100), {"POST /social-links/": Limit(0.1, 3)})
+    )
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+    db.add(Resume(user_id=1, location="Warsaw", phone="123"))
+    await db.commit()
+    links = [{"platform": f"site{i}", "url": f"https://site{i}.me"} for i in range(3)]
+
+    assert (await client.post("/social-links/", json=links, headers=headers)).status_code == 201
+    assert (await client.post("/social-links/", json=links[:1], headers=headers)).status_code == 429
+
+
+@pytest.mark.anyio
+async def test_batches_larger_than_the_burst_are_rejected(client, db, token_factory, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr("app.core.rate_limit.route_limits", lambda: (Limit(rate=1.0, burst=10), {}))
+    headers = {"Authorization": f"Bearer {token_factory()}"}
+    db.add(Resume(user_id=1, location="Warsaw", phone="123"))
+    await db.commit()
+    links = [{"platform": f"site{i}", "url": f"https://site{i}.me"} for i in range(settings.SOCIAL_LINKS_MAX_BATCH + 1)]
+
+    assert (await client.post("/social-links/", json=links[:12], headers=headers)).status_code == 413
+    assert (await client.post("/social-links/", json=links, headers=headers)).status_code == 422
+    assert (await client.post("/social-links/", json=links[:2], headers=headers)).status_code == 201
+
+
+@pytest.mark.anyio
+async def test_invalid_token_is_verified_once_per_request(client, monkeypatch):
+    from jose import jwt
+
+    decode = jwt.decode
+    calls = 0
+
+    def counting_decode(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr("app.core.auth.jwt.decode", counting_decode)
+
+    response = await client.get("/resumes/me", headers={"Authorization": "Bearer forged"})
+
+    assert response.status_code == 401
+    assert calls == 1
+
+
+class Pool:
+    capacity = 4
+    waiting = 0
+    wait = 0.0
+
+    def recent_wait(self) -> float:
+        return self.wait
+
+
+def test_load_shedder_backs_off_under_pool_pressure():
+    shedder = LoadShedder(max_wait=0.1, max_queue=8, max_limit=100)
+    pool = Pool()
+
+    for _ in range(20):
+        assert shedder.admit(pool) is None
+
+    pool.wait = 2.5
+    assert shedder.admit(pool) == 2.5
+    assert shedder.limit == 18
+
+    pool.waiting, pool.wait = 9, 0.0
+    assert shedder.admit(pool) is not None
+
+    for _ in range(17):
+        shedder.release()
+    assert shedder.admit(pool) is None
+    assert shedder.limit == 4
+
+    pool.waiting = 0
+    assert shedder.admit(pool) is None
+    assert shedder.limit == 5
+    assert shedder.stats() == {"limit": 5, "in_flight": 5, "shed": 2}
+
+
+def test_rate_limiter_backend_from_settings(monkeypatch):
+    from app.core.rate_limit import NullRateLimiter, settings
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "none")
+    get_rate_limiter.cache_clear()
+    try:
+        assert isinstance(get_rate_limiter(), NullRateLimiter)
+    finally:
+        get_rate_limiter.cache_clear()
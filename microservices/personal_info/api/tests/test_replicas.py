@@ -0,0 +1,112 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import replicas
+from app.core.cache import MemoryCache, NullCache
+from app.core.pool import InstrumentedAsyncQueuePool
+from app.core.replicas import Replica, ReplicaSet
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def replica_set(tmp_path):
+    engines = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db", poolclass=InstrumentedAsyncQueuePool)
+        for name in ("a", "b", "c")
+    ]
+    replica_set = ReplicaSet(
+        [Replica(f"replica-{i}", engine) for i, engine in enumerate(engines)],
+        selection="round_robin", max_lag=5.0, check_interval=60.0, read_your_writes_window=10.0,
+    )
+
+    yield replica_set
+
+    for engine in engines:
+        await engine.dispose()
+
+
+async def test_replicas_join_rotation_after_lag_check(replica_set, monkeypatch):
+    assert replica_set.pick() is None
+
+    monkeypatch.setattr(replicas, "LAG_QUERY", text("SELECT 0.5"))
+    await replica_set._check
+
+    picked = [replica_set.pick().name for _ in range(4)]
+    assert picked == ["replica-0", "replica-1", "replica-2", "replica-0"]
+    assert replica_set.stats()[0]["lag_seconds"] == 0.5
+
+
+async def test_lagging_or_failing_replicas_leave_rotation(replica_set, monkeypatch):
+    monkeypatch.setattr(replicas, "LAG_QUERY", text("SELECT 0.5"))
+    await replica_set.check_lag()
+    lagging, failing, healthy = replica_set.replicas
+    monkeypatch.setattr(replicas, "LAG_QUERY", text("SELECT 30.0"))
+    await replica_set._check_replica(lagging)
+    monkeypatch.undo()
+    await replica_set._check_replica(failing)
+
+    assert {replica_set.pick().name for _ in range(3)} == {healthy.name}
+    assert lagging.lag == 30.0
+    assert failing.error.startswith("OperationalError")
+
+
+async def test_least_connections(replica_set, monkeypatch):
+    monkeypatch.setattr(replicas, "LAG_QUERY", text("SELECT 0"))
+    await replica_set.check_lag()
+    replica_set.selection = "least_connections"
+
+    async with replica_set.replicas[0].engine.connect(), replica_set.replicas[1].engine.connect():
+        assert replica_set.pick().name == "replica-2"
+
+
+async def test_read_your_writes_window(replica_set):
+    shared = MemoryCache()
+    await replica_set.record_write(7, NullCache())
+    other_worker = ReplicaSet([], "round_robin", 5.0, 60.0, 10.0)
+    await other_worker.record_write(8, shared)
+    fresh_worker = ReplicaSet([], "round_robin", 5.0, 60.0, 10.0)
+
+    assert await replica_set.wrote_recently(7, NullCache())
+    assert not await replica_set.wrote_recently(8, NullCache())
+    assert await fresh_worker.wrote_recently(8, shared)
+
+
+async def test_read_routing(replica_set, monkeypatch, token_factory):
+    from starlette.requests import Request
+
+    from app.core.database import Database, get_read_session_factory
+
+    monkeypatch.setattr(replicas, "LAG_QUERY", text("SELECT 0"))
+    await replica_set.check_lag()
+    database = Database(replica_set.replicas[2].engine, replica_set)
+    replica_set.replicas = replica_set.replicas[:1]
+    cache = MemoryCache()
+
+    def request(method: str) -> Request:
+        headers = [(b"authorization", f"Bearer {token_factory(sub=5)}".encode())]
+        return Request({"type": "http", "method": method, "headers": headers})
+
+    assert await get_read_session_factory(request("GET"), database, cache) is replica_set.replicas[0].session_factory
+    assert await get_read_session_factory(request("POST"), database, cache) is database.session_factory
+
+    await replica_set.record_write(5, cache)
+
+    assert await get_read_session_factory(request("GET"), database, cache) is database.session_factory
+
+
+async def test_database_from_settings_builds_replica_engines(monkeypatch):
+    from app.core.config import settings
+    from app.core.database import Database
+
+    monkeypatch.setattr(settings, "DB_REPLICA_URLS", "reader:secret@replica-1:5432/db")
+    database = Database.from_settings()
+    try:
+        assert database.replica_set is not None
+        [replica] = database.replica_set.replicas
+        assert replica.name == "replica-1:5432/db"
+        assert isinstance(replica.engine.pool, InstrumentedAsyncQueuePool)
+        assert replica.engine.url.host == "replica-1"
+    finally:
+        await database.dispose()
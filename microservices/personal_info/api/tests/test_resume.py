@@ -0,0 +1,170 @@
+import datetime as dt
+
+import pytest
+
+from app.models import Certificate, Education, Experience, Language, Project, Resume, Skill, SocialLink
+
+pytestmark = pytest.mark.anyio
+
+
+async def _seed_resume(db, user_id: int, items_per_section: int) -> Resume:
+    resume = Resume(user_id=user_id, professional_title="Python Developer", location="Warsaw", phone="123")
+    db.add(resume)
+    await db.flush()
+
+    for i in range(items_per_section):
+        db.add_all([
+            Experience(resume_id=resume.id, job_title=f"Dev {i}", company="ACME", start_date=dt.date(2020, 1, 1),
+                       description="Built things"),
+            Education(resume_id=resume.id, school="University", start_date=dt.date(2015, 10, 1)),
+            Skill(resume_id=resume.id, name=f"skill {i}", level="expert"),
+            Project(resume_id=resume.id, title=f"Project {i}"),
+            Certificate(resume_id=resume.id, issuer="Issuer", name=f"Cert {i}", link="https://example.com/cert"),
+            SocialLink(resume_id=resume.id, user_id=user_id, platform="github", url="https://github.com/me"),
+            Language(resume_id=resume.id, name="English", level="C1"),
+        ])
+
+    await db.commit()
+    return resume
+
+
+@pytest.mark.parametrize("items_per_section", [1, 5])
+async def test_get_my_resume_loads_all_sections_in_fixed_round_trips(
+        client, db, statements, token_factory, items_per_section
+):
+    await _seed_resume(db, user_id=7, items_per_section=items_per_section)
+    statements.clear()
+
+    response = await client.get("/resumes/me", headers={"Authorization": f"Bearer {token_factory(sub=7)}"})
+
+    assert response.status_code == 200
+    body = response.json()
+    for section in ("experiences", "education", "skills", "projects", "certificates", "social_links", "languages"):
+        assert len(body[section]) == items_per_section
+    assert len(statements) == 8
+
+
+async def test_get_resume_by_id(client, db, token_factory):
+    resume = await _seed_resume(db, user_id=3, items_per_section=2)
+
+    response = await client.get(f"/resumes/{resume.id}", headers={"Authorization": f"Bearer {token_factory(sub=9)}"})
+
+    assert response.status_code == 200
+    assert response.json()["id"] == resume.id
+    assert len(response.json()["experiences"]) == 2
+
+
+async def test_get_my_resume_not_found(client, token_factory):
+    response = await client.get("/resumes/me", headers={"Authorization": f"Bearer {token_factory(sub=99)}"})
+
+    assert response.status_code == 404
+
+
+async def test_create_resume_twice_conflicts(client, token_factory):
+    headers = {"Authorization": f"Bearer {token_factory(sub=11)}"}
+    payload = {"location": "Warsaw", "phone": "123"}
+
+    first = await client.post("/resumes/", json=payload, headers=headers)
+    second = await client.post("/resumes/", json=payload, headers=headers)
+
+    assert first.status_code == 201
+    assert second.status_code == 409
+
+
+async def test_resume_reads_are_cached_until_a_write(client, db, statements, token_factory):
+    await _seed_resume(db, user_id=21, items_per_section=1)
+    headers = {"Authorization": f"Bearer {token_factory(sub=21)}"}
+
+    first = await client.get("/resumes/me", headers=headers)
+    statements.clear()
+    second = await client.get("/resumes/me", headers=headers)
+
+    assert second.json() == first.json()
+    assert statements == []
+
+    await client.post("/social-links/", json=[{"platform": "blog", "url": "https://blog.me"}], headers=headers)
+    third = await client.get("/resumes/me", headers=headers)
+
+    assert len(third.json()["social_links"]) == 2
+
+
+def test_search_statement_ranks_on_indexed_vector_and_highlights_only_the_page():
+    from sqlalchemy.dialects import postgresql
+
+    from app.crud.search import search_resumes_stmt
+
+    sql = str(search_resumes_stmt("python", 20, {"rank": 0.5, "id": 10}).compile(
+        dialect=postgresql.dialect()
+    ))
+
+    matches, _, page = sql.partition("FROM resumes JOIN (")
+    assert "ts_headline" in matches
+    assert "resumes.search_vector @@ websearch_to_tsquery('english'::regconfig" in page
+    assert "(ts_rank_cd(resumes.search_vector" in page
+    assert "ts_headline" not in page
+    assert "LIMIT" in page
+
+
+async def test_search_requires_query(client, token_factory):
+    response = await client.get("/resumes/search", headers={"Authorization": f"Bearer {token_factory()}"})
+
+    assert response.status_code == 422
+
+
+async def test_search_rejects_invalid_cursor(client, token_factory):
+    response = await client.get(
+        "/resumes/search", params={"q": "python", "after": "bm90LWpzb24"},
+        headers={"Authorization": f"Bearer {token_factory()}"},
+    )
+
+    assert response.status_code == 400
+
+
+async def test_put_my_resume_writes_only_the_difference(client, db, statements, token_factory):
+    await _seed_resume(db, user_id=11, items_per_section=2)
+    headers = {"Authorization": f"Bearer {token_factory(sub=11)}"}
+    document = (await client.get("/resumes/me", headers=headers)).json()
+
+    statements.clear()
+    unchanged = await client.put("/resumes/me", json=document, headers=headers)
+
+    assert unchanged.status_code == 200
+    assert unchanged.json()["updated_at"] == document["updated_at"]
+    assert not [s for s in statements if not s.lstrip().upper().startswith("SELECT")]
+
+    kept, dropped = document["skills"]
+    document["skills"] = [{**kept, "level": "beginner"}, {"name": "rust", "level": None}]
+    statements.clear()
+    response = await client.put("/resumes/me", json=document, headers=headers)
+
+    assert response.status_code == 200
+    writes = [s.split()[0].upper() for s in statements if not s.lstrip().upper().startswith("SELECT")]
+    assert sorted(writes) == ["DELETE", "INSERT", "UPDATE", "UPDATE"]
+    skills = {skill["name"]: skill for skill in response.json()["skills"]}
+    assert skills.keys() == {kept["name"], "rust"}
+    assert skills[kept["name"]]["id"] == kept["id"] and skills[kept["name"]]["level"] == "beginner"
+    assert response.json()["experiences"] == document["experiences"]
+    assert response.json()["updated_at"] > document["updated_at"]
+
+
+async def test_put_my_resume_creates_and_rejects_foreign_ids(client, db, token_factory):
+    other = await _seed_resume(db, user_id=12, items_per_section=1)
+    foreign_skill = (await client.get(f"/resumes/{other.id}", headers={
+        "Authorization": f"Bearer {token_factory(sub=13)}"
+    })).json()["skills"][0]
+    headers = {"Authorization": f"Bearer {token_factory(sub=13)}"}
+    document = {
+        "location": "Gdansk", "phone": "5",
+        "social_links": [{"platform": "github", "url": "https://github.com/thirteen"}],
+    }
+
+    created = await client.put("/resumes/me", json=document, headers=headers)
+
+    assert created.status_code == 201
+    assert created.json()["social_links"][0]["url"] == "https://github.com/thirteen"
+    assert (await client.get("/social-links/", headers=headers)).json()["items"][0]["platform"] == "github"
+
+    response = await client.put("/resumes/me", json={**document, "skills": [foreign_skill]}, headers=headers)
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == f"Unknown skills id {foreign_skill['id']}."
@@ -0,0 +1,34 @@
+import pytest
+
+from app import serve
+
+
+@pytest.mark.parametrize(
+    ("workers", "max_connections", "expected"),
+    [
+        (4, None, (5, 10)),
+        (4, 100, (5, 10)),
+        (4, 40, (5, 5)),
+        (8, 20, (2, 0)),
+    ],
+)
+def test_split_pool_keeps_workers_within_max_connections(workers, max_connections, expected):
+    assert serve.split_pool(workers, max_connections, pool_size=5, max_overflow=10) == expected
+
+
+def test_split_pool_leaves_room_for_reserved_connections():
+    assert serve.split_pool(4, 40, pool_size=5, max_overflow=10, reserved=1) == (5, 4)
+
+
+def test_split_pool_rejects_more_workers_than_connections():
+    with pytest.raises(ValueError):
+        serve.split_pool(8, 4, pool_size=5, max_overflow=10)
+
+
+@pytest.mark.parametrize(("cpu_max", "limit"), [("max 100000", None), ("150000 100000", 2), ("garbage", None)])
+def test_available_cpus_honors_cgroup_quota(tmp_path, monkeypatch, cpu_max, limit):
+    monkeypatch.setattr(serve.os, "process_cpu_count", lambda: 8)
+    monkeypatch.setattr(serve, "CGROUP_CPU_MAX", tmp_path / "cpu.max")
+    serve.CGROUP_CPU_MAX.write_text(cpu_max)
+
+    assert serve.available_cpus() == (limit or 8)
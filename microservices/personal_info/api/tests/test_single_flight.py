@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import (
+    CacheEntry,
+    MemoryCache,
+    NullCache,
+    get_cache,
+    get_entry,
+    invalidate_user_cache,
+    user_resume_cache_key,
+)
+from app.core.etag import conditional_read
+from app.core.single_flight import SingleFlight, read_flights
+from app.main import app
+from app.models import Resume
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_calls_share_one_load():
+    flights = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"id": 1}
+
+    callers = [asyncio.create_task(flights.do("resume:1", "entry", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flights.stats() == {"in_flight": 0, "loads": 1, "coalesced": 4}
+
+
+async def test_errors_reach_every_waiter():
+    flights = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise LookupError("gone")
+
+    results = await asyncio.gather(*(flights.do("k", None, load) for _ in range(3)), return_exceptions=True)
+
+    assert [type(result) for result in results] == [LookupError] * 3
+    assert flights.stats()["in_flight"] == 0
+
+
+async def test_waiters_reload_when_the_leader_is_cancelled():
+    flights = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    leader = asyncio.create_task(flights.do("k", None, load))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flights.do("k", None, load))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == 2
+    assert leader.cancelled()
+
+
+async def test_forget_starts_a_new_load_for_later_callers():
+    flights = SingleFlight()
+    versions = iter(["old", "new"])
+
+    async def load():
+        version = next(versions)
+        await asyncio.sleep(0.01)
+        return version
+
+    before = asyncio.create_task(flights.do("resume:1", None, load))
+    await asyncio.sleep(0)
+    flights.forget("resume:1")
+    after = asyncio.create_task(flights.do("resume:1", None, load))
+
+    assert await asyncio.gather(before, after) == ["old", "new"]
+
+
+def test_watch_reports_forget_only_while_open():
+    flights = SingleFlight()
+
+    with flights.watch("resume:1") as forgotten:
+        assert not forgotten()
+        flights.forget("resume:2")
+        assert not forgotten()
+        flights.forget("resume:1")
+        assert forgotten()
+
+    with flights.watch("resume:1") as forgotten:
+        assert not forgotten()
+
+
+async def test_loads_invalidated_midway_are_served_but_not_cached():
+    cache = MemoryCache()
+    key = user_resume_cache_key(1)
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def load_entry():
+        loading.set()
+        await release.wait()
+        return CacheEntry(version='"old"', body=b"{}")
+
+    async def no_etag():
+        return None
+
+    read = asyncio.create_task(conditional_read(cache, key, 60, None, no_etag, load_entry))
+    await loading.wait()
+    await invalidate_user_cache(cache, 1)
+    release.set()
+
+    assert (await read).headers["ETag"] == '"old"'
+    assert await get_entry(cache, key) is None
+
+
+async def test_concurrent_resume_reads_coalesce_but_authorize_each_caller(client, db, statements, token_factory):
+    app.dependency_overrides[get_cache] = NullCache
+    resume = Resume(user_id=3, location="Warsaw", phone="123")
+    db.add(resume)
+    await db.commit()
+    statements.clear()
+    coalesced = read_flights.coalesced
+    headers = {"Authorization": f"Bearer {token_factory(sub=4)}"}
+
+    responses = await asyncio.gather(
+        *(client.get(f"/resumes/{resume.id}", headers=headers) for _ in range(5)),
+        client.get(f"/resumes/{resume.id}"),
+    )
+
+    assert [response.status_code for response in responses] == [200] * 5 + [401]
+    assert len({response.content for response in responses[:5]}) == 1
+    assert sum("FROM resumes" in statement for statement in statements) == 1
+    assert read_flights.coalesced - coalesced == 4
@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.skill_query import AllOf, AnyOf, SkillQueryError, Term, parse_skill_query, skill_terms
+
+pytestmark = pytest.mark.anyio
+
+
+def test_and_binds_tighter_than_or():
+    assert parse_skill_query("python AND fastapi or Django") == AnyOf((AllOf((Term("python"), Term("fastapi"))),
+                                                                      Term("Django")))
+
+
+def test_parentheses_quotes_and_multi_word_skills():
+    query = parse_skill_query('machine  learning AND (fastapi OR "c++" OR "and")')
+
+    assert query == AllOf((Term("machine learning"), AnyOf((Term("fastapi"), Term("c++"), Term("and")))))
+    assert skill_terms(query) == ["machine learning", "fastapi", "c++", "and"]
+
+
+def test_same_operator_nesting_is_flattened():
+    assert parse_skill_query("python AND (sql AND (python AND go))") == AllOf((Term("python"), Term("sql"), Term("go")))
+
+
+@pytest.mark.parametrize("text", ["python AND", "(python", "python)", "AND python", '"python', "()", '""'])
+def test_invalid_queries(text):
+    with pytest.raises(SkillQueryError):
+        parse_skill_query(text)
+
+
+def test_filter_collapses_sibling_terms_into_single_array_operators():
+    from app.crud.search import filter_resumes_by_skills_stmt
+
+    stmt = filter_resumes_by_skills_stmt(parse_skill_query("python AND docker AND (fastapi OR django)"))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("resumes.skill_tokens @> ARRAY[") == 1
+    assert sql.count("resumes.skill_tokens && ARRAY[") == 1
+    assert sql.count("normalize_skill_token(") == 4
+
+
+async def test_filter_rejects_invalid_query(client, token_factory):
+    response = await client.get(
+        "/resumes/filter", params={"skills": "python AND (django"},
+        headers={"Authorization": f"Bearer {token_factory()}"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid skill query: Missing closing parenthesis."
@@ -0,0 +1,162 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import encode_cursor
+from app.crud.bulk import bulk_insert_returning
+from app.crud.social_link import delete_link_stmt, update_link_stmt
+from app.models import Resume, SocialLink
+
+pytestmark = pytest.mark.anyio
+
+
+async def _create_resume(db, user_id: int) -> Resume:
+    resume = Resume(user_id=user_id, location="Warsaw", phone="123")
+    db.add(resume)
+    await db.commit()
+    return resume
+
+
+async def test_add_social_links_uses_single_insert(client, db, statements, token_factory):
+    await _create_resume(db, user_id=1)
+    links = [{"platform": f"site-{i}", "url": f"https://example.com/{i}"} for i in range(50)]
+    statements.clear()
+
+    response = await client.post("/social-links/", json=links, headers={"Authorization": f"Bearer {token_factory()}"})
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [link["platform"] for link in body] == [link["platform"] for link in links]
+    assert all(isinstance(link["id"], int) for link in body)
+    assert sum(statement.startswith("INSERT") for statement in statements) == 1
+    assert not any("FROM social_link" in statement for statement in statements)
+
+
+async def test_add_social_links_without_resume(client, token_factory):
+    response = await client.post(
+        "/social-links/",
+        json=[{"platform": "github", "url": "https://github.com/me"}],
+        headers={"Authorization": f"Bearer {token_factory(sub=404)}"},
+    )
+
+    assert response.status_code == 404
+
+
+async def test_patch_and_delete_write_in_place_with_ownership_in_where(client, db, statements, token_factory):
+    resume = await _create_resume(db, user_id=21)
+    link = SocialLink(resume_id=resume.id, user_id=21, platform="github", url="https://github.com/a")
+    db.add(link)
+    await db.commit()
+    url = f"/social-links/{link.id}/"
+    owner = {"Authorization": f"Bearer {token_factory(sub=21)}"}
+    stranger = {"Authorization": f"Bearer {token_factory(sub=22)}"}
+    payload = {"platform": "gitlab", "url": "https://gitlab.com/a"}
+
+    statements.clear()
+    response = await client.patch(url, json=payload, headers=owner)
+
+    assert response.status_code == 200
+    assert response.json() == {"id": link.id, **payload}
+    # The parent resume is locked (touched) before the link row, as every resume writer does.
+    assert [statement.split()[:2] for statement in statements] == [["UPDATE", "resumes"], ["UPDATE", "social_link"]]
+    assert "RETURNING" in statements[1] and "user_id" in statements[1].split("WHERE")[1]
+
+    assert (await client.patch(url, json=payload, headers=stranger)).status_code == 404
+    assert (await client.delete(url, headers=stranger)).status_code == 404
+
+    statements.clear()
+    assert (await client.delete(url, headers=owner)).status_code == 204
+    assert [statement.split()[:2] for statement in statements] == [["UPDATE", "resumes"], ["DELETE", "FROM"]]
+    assert (await client.delete(url, headers=owner)).status_code == 404
+
+
+def test_link_writes_touch_the_resume_in_the_same_statement_on_postgresql():
+    update_sql = str(update_link_stmt(1, 2, {"platform": "gitlab"}).compile(dialect=postgresql.dialect()))
+    delete_sql = str(delete_link_stmt(1, 2).compile(dialect=postgresql.dialect()))
+
+    # The resume is updated in the CTE the link write joins, so it is locked first.
+    for sql, write in ((update_sql, "UPDATE social_link"), (delete_sql, "DELETE FROM social_link")):
+        assert sql.startswith("WITH touched AS \n(UPDATE resumes")
+        assert write in sql and "touched.id" in sql.split(write)[1]
+    assert "RETURNING" in update_sql and update_sql.endswith("touched.updated_at")
+
+
+async def test_bulk_insert_returning_chunks(db, statements):
+    resume = await _create_resume(db, user_id=2)
+    rows = [{"resume_id": resume.id, "user_id": 2, "platform": "x", "url": f"https://x.com/{i}"} for i in range(25)]
+    statements.clear()
+
+    created = await bulk_insert_returning(db, SocialLink, rows, chunk_size=10)
+    await db.commit()
+
+    assert len(created) == 25
+    assert len({row.id for row in created}) == 25
+    assert len(statements) == 3
+
+
+async def test_get_social_links_keyset_pagination(client, db, token_factory):
+    resume = await _create_resume(db, user_id=5)
+    rows = [{"resume_id": resume.id, "user_id": 5, "platform": "x", "url": f"https://x.com/{i}"} for i in range(5)]
+    await bulk_insert_returning(db, SocialLink, rows)
+    await db.commit()
+    headers = {"Authorization": f"Bearer {token_factory(sub=5)}"}
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2} | ({"after": cursor} if cursor else {})
+        body = (await client.get("/social-links/", params=params, headers=headers)).json()
+        seen.extend(link["url"] for link in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [row["url"] for row in rows]
+
+
+@pytest.mark.parametrize("after", ["%%%", encode_cursor({"next": 1}), encode_cursor({"id": "abc"}),
+                                   encode_cursor({"id": True}), encode_cursor({"id": None})])
+async def test_get_social_links_invalid_cursor(client, db, token_factory, after):
+    await _create_resume(db, user_id=31)
+    response = await client.get(
+        "/social-links/", params={"after": after}, headers={"Authorization": f"Bearer {token_factory(sub=31)}"}
+    )
+
+    assert response.status_code == 400
+
+
+async def test_get_social_links_without_resume_still_rejects_invalid_cursor(client, token_factory):
+    response = await client.get(
+        "/social-links/",
+        params={"after": encode_cursor({"id": "abc"})},
+        headers={"Authorization": f"Bearer {token_factory(sub=404)}"},
+    )
+
+    assert response.status_code == 400
+
+
+async def test_get_social_links_ndjson_stream(client, db, token_factory):
+    resume = await _create_resume(db, user_id=6)
+    rows = [{"resume_id": resume.id, "user_id": 6, "platform": "x", "url": f"https://x.com/{i}"} for i in range(3)]
+    await bulk_insert_returning(db, SocialLink, rows)
+    await db.commit()
+
+    response = await client.get(
+        "/social-links/",
+        headers={"Authorization": f"Bearer {token_factory(sub=6)}", "Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(response.text.splitlines()) == 3
+
+
+async def test_get_social_links_without_resume_is_an_uncached_empty_page(client, token_factory):
+    from app.core.cache import get_cache, social_links_cache_key
+    from app.main import app
+
+    response = await client.get("/social-links/", headers={"Authorization": f"Bearer {token_factory(sub=404)}"})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
+    assert "ETag" not in response.headers
+    assert await app.dependency_overrides[get_cache]().hget(social_links_cache_key(404), "50:") is None
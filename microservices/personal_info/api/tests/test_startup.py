@@ -0,0 +1,132 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+API_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time of app.main; cold starts gate how fast autoscaled workers take traffic.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 1500))
+
+# Dev-only or heavy modules that must not load until a request actually needs them.
+DEFERRED_MODULES = ("mypy", "numpy", "asyncpg", "redis", "alembic", "pytest")
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], cwd=API_ROOT, env=os.environ.copy(), capture_output=True, text=True, check=True
+    )
+
+
+def test_import_time_budget():
+    stderr = _python("-X", "importtime", "-c", "import app.main").stderr
+
+    cumulative_us = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| app\.main$", stderr, re.MULTILINE)
+    assert cumulative_us is not None
+    assert int(cumulative_us[1]) / 1000 <= IMPORT_TIME_BUDGET_MS
+
+
+@pytest.mark.parametrize("module", ["app.main", "app.models"])
+def test_import_defers_heavy_modules_and_engines(module):
+    stdout = _python(
+        "-c",
+        f"import sys, {module}; "
+        f"print(*sorted({{name.partition('.')[0] for name in sys.modules}} & set({DEFERRED_MODULES!r})))",
+    ).stdout
+    assert stdout.strip() == ""
+
+
+def test_models_import_without_the_web_app():
+    stdout = _python(
+        "-c", "import sys, app.models; print('fastapi' in sys.modules, 'app.core.database' in sys.modules)"
+    ).stdout
+
+    assert stdout.split() == ["False", "False"]
+
+
+@pytest.fixture
+def readiness(monkeypatch):
+    from app.core.warmup import readiness
+
+    monkeypatch.setattr(readiness, "state", "starting")
+    monkeypatch.setattr(readiness, "error", None)
+    return readiness
+
+
+@pytest.mark.anyio
+async def test_warm_up_opens_and_primes_the_pool(tmp_path, readiness):
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    import app.models  # noqa: F401
+    from app.core.base import Base
+    from app.core.database import Database
+    from app.core.pool import InstrumentedAsyncQueuePool
+    from app.core.warmup import warm_up
+    from app.crud.warmup import prime_statements
+    from app.models import Resume
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", poolclass=InstrumentedAsyncQueuePool, pool_size=3
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(Resume.__table__.insert().values(user_id=1, location="Warsaw", phone="1"))
+    await engine.dispose()
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    await warm_up(Database(engine), 3, prime_statements, retry_interval=0)
+
+    assert readiness.ready
+    assert engine.sync_engine.pool.checkedin() == 3
+    # Per connection: user lookup, resume version, resume, its 7 sections and the social links page.
+    assert len(statements) == 3 * 11
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_ready_reflects_warm_up_and_drain(client, readiness):
+    assert (await client.get("/ready")).status_code == 503
+    assert (await client.get("/health")).status_code == 200
+
+    readiness.mark_ready()
+    assert (await client.get("/ready")).json() == {"status": "ready", "error": None}
+
+    readiness.drain()
+    response = await client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "draining"
+
+
+@pytest.mark.anyio
+async def test_sigterm_drains_before_the_server_handler_runs(readiness):
+    import asyncio
+    import signal
+
+    from app.core.warmup import drain_on_signals
+
+    received = []
+    previous = signal.signal(signal.SIGTERM, lambda sig, frame: received.append(sig))
+    try:
+        readiness.mark_ready()
+        restore = drain_on_signals(0.05)
+
+        signal.raise_signal(signal.SIGTERM)
+        assert readiness.state == "draining"
+        assert received == []
+
+        await asyncio.sleep(0.1)
+        assert received == [signal.SIGTERM]
+
+        signal.raise_signal(signal.SIGTERM)
+        assert received == [signal.SIGTERM, signal.SIGTERM]
+
+        restore()
+        signal.raise_signal(signal.SIGTERM)
+        assert len(received) == 3
+    finally:
+        signal.signal(signal.SIGTERM, previous)
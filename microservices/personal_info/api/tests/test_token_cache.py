@@ -0,0 +1,81 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.auth import token_cache, verify_jwt_token
+from app.core.token_cache import TokenCache
+from app.schemas.user import AccessTokenPayload
+
+
+def _payload(exp: int) -> AccessTokenPayload:
+    return AccessTokenPayload(sub=1, exp=exp, iat=0, roles=["user"])
+
+
+def test_cache_hit_and_miss_counters():
+    cache = TokenCache(max_size=10)
+    payload = _payload(int(time.time()) + 60)
+
+    assert cache.get("token") is None
+    cache.put("token", payload)
+
+    assert cache.get("token") is payload
+    assert cache.stats() == {"size": 1, "max_size": 10, "hits": 1, "misses": 1}
+
+
+def test_expired_entries_are_evicted(monkeypatch):
+    cache = TokenCache(max_size=10)
+    now = time.time()
+    cache.put("token", _payload(int(now) + 5))
+
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+
+    assert cache.get("token") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_size_cap():
+    cache = TokenCache(max_size=2)
+    exp = int(time.time()) + 60
+    cache.put("a", _payload(exp))
+    cache.put("b", _payload(exp))
+    cache.get("a")
+    cache.put("c", _payload(exp))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_verify_jwt_token_uses_cache(token_factory):
+    token_cache.clear()
+    token = token_factory(sub=42)
+
+    first = verify_jwt_token(token)
+    second = verify_jwt_token(token)
+
+    assert first.sub == 42
+    assert second is first
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_invalid_token_is_not_cached():
+    token_cache.clear()
+
+    with pytest.raises(HTTPException):
+        verify_jwt_token("not-a-token")
+
+    assert token_cache.stats()["size"] == 0
+
+
+def test_failed_verifications_are_not_counted_as_misses():
+    from app.core.metrics import request_metrics
+
+    token_cache.clear()
+    counts = {outcome: histogram.snapshot()["count"] for outcome, histogram in request_metrics.jwt_verification.items()}
+
+    with pytest.raises(HTTPException):
+        verify_jwt_token("not-a-token")
+
+    assert request_metrics.jwt_verification["miss"].snapshot()["count"] == counts["miss"]
+    assert request_metrics.jwt_verification["failed"].snapshot()["count"] == counts["failed"] + 1